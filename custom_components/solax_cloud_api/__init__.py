@@ -1,24 +1,101 @@
+import asyncio
+from datetime import timedelta
+
+import voluptuous as vol
 from homeassistant.components import persistent_notification
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import (
+    Event,
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
 from homeassistant.helpers.translation import async_get_translations
 
+from .cache import SolaxResponseCache
+from .clock import SolaxClock
 from .const import (
+    BURST_MAX_DURATION,
+    BURST_MIN_INTERVAL,
+    CONF_API_ENDPOINTS,
+    CONF_BATCH_SIZE,
     CONF_INVERTERS,
+    CONF_LEAN_ATTRIBUTES,
+    CONF_NIGHT_BATTERY_INTERVAL,
+    CONF_NIGHT_MODE,
     CONF_RATE_LIMIT_NOTIFICATIONS,
+    CONF_RESPONSE_CACHE_TTL,
+    CONF_RESPONSE_RECORDING,
     CONF_SCAN_INTERVAL,
+    CONF_SYSTEM_NAME,
     CONF_TOKEN,
+    DEFAULT_API_ENDPOINTS,
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_BURST_INTERVAL,
+    DEFAULT_NIGHT_BATTERY_INTERVAL,
+    DEFAULT_RESPONSE_CACHE_TTL,
     DOMAIN,
+    ENDPOINT_PROBE_INTERVAL,
+    MAX_SCAN_INTERVAL,
     PLATFORMS,
+    RECORDING_DIR,
+    REGISTRY_UPDATE_DEBOUNCE,
+    RESPONSE_CACHE_DIR,
     RUNTIME_INITIAL_SETUP_STATE,
     RUNTIME_RELOAD_STATE,
+    RUNTIME_SCHEDULER,
+    SERVICE_BURST,
     SERVICE_MANUAL_REFRESH,
 )
 from .coordinator import SolaxCoordinator
+from .quota import plan_burst_interval
+from .recording import SolaxResponseRecorder
+from .registry import serial_for_unique_id, serial_suffix_index
+from .scheduler import SolaxRequestScheduler
+from .storage import SolaxStateStore
 
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+ATTR_DURATION = "duration"
+ATTR_ENTRY_ID = "entry_id"
+ATTR_INTERVAL = "interval"
+ATTR_SERIALS = "serials"
+MANUAL_REFRESH_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_SERIALS, default=[]): vol.All(cv.ensure_list, [cv.string]),
+    }
+)
+BURST_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DURATION): vol.All(
+            vol.Coerce(int), vol.Range(min=60, max=BURST_MAX_DURATION)
+        ),
+        vol.Optional(ATTR_INTERVAL, default=DEFAULT_BURST_INTERVAL): vol.All(
+            vol.Coerce(int), vol.Range(min=BURST_MIN_INTERVAL, max=MAX_SCAN_INTERVAL)
+        ),
+        vol.Optional(ATTR_SERIALS, default=[]): vol.All(cv.ensure_list, [cv.string]),
+    }
+)
+
 _TRANSLATION_PREFIX = f"component.{DOMAIN}."
+# System-level entities that do not read any inverter payload.
+_POLL_INDEPENDENT_SUFFIXES = (
+    "_rate_limit_status_solax",
+    "_last_poll_attempt_solax",
+    "_next_scheduled_poll_solax",
+    "_api_calls_minute_solax",
+    "_api_calls_hour_solax",
+    "_api_calls_today_solax",
+    "_rate_limit_notifications_solax",
+)
 
 
 async def _load_runtime_notification_texts(hass: HomeAssistant) -> dict[str, str]:
@@ -61,6 +138,16 @@ def _invalid_serial_notification_id(entry_id: str) -> str:
     return f"{DOMAIN}_invalid_serial_{entry_id}"
 
 
+def _notification_title(hass: HomeAssistant, entry_id: str, title: str) -> str:
+    """Name the system in notification titles once several entries are configured."""
+    if len(hass.config_entries.async_entries(DOMAIN)) < 2:
+        return title
+    entry = hass.config_entries.async_get_entry(entry_id)
+    if entry is None:
+        return title
+    return f"{title} ({entry.data.get(CONF_SYSTEM_NAME) or entry.title})"
+
+
 def _rate_limit_notifications_enabled(hass: HomeAssistant, entry_id: str) -> bool:
     entry = hass.config_entries.async_get_entry(entry_id)
     if entry is None:
@@ -117,7 +204,9 @@ def _update_rate_limit_notification(
     persistent_notification.async_create(
         hass,
         body,
-        title=texts.get("rate_limit_title", "SolaX Cloud API - Rate Limit"),
+        title=_notification_title(
+            hass, entry_id, texts.get("rate_limit_title", "SolaX Cloud API - Rate Limit")
+        ),
         notification_id=notification_id,
     )
 
@@ -158,7 +247,11 @@ def _update_invalid_serial_notification(
     persistent_notification.async_create(
         hass,
         body,
-        title=texts.get("invalid_serial_title", "SolaX Cloud API - Invalid Serial/Access"),
+        title=_notification_title(
+            hass,
+            entry_id,
+            texts.get("invalid_serial_title", "SolaX Cloud API - Invalid Serial/Access"),
+        ),
         notification_id=notification_id,
     )
 
@@ -178,6 +271,50 @@ def _dedupe_serials(serials):
     return unique
 
 
+def _inverters_without_enabled_entities(
+    hass: HomeAssistant, entry: ConfigEntry, inverters: list[str]
+) -> set[str]:
+    """Return casefolded serials whose registered entities are all disabled.
+
+    Enabled system totals/estimators aggregate every inverter, so they keep all
+    serials polled. Serials without registry entries yet are always polled.
+    """
+    serial_index = serial_suffix_index(inverters)
+    has_entities = set()
+    has_enabled = set()
+    entity_registry = er.async_get(hass)
+    for reg_entry in er.async_entries_for_config_entry(entity_registry, entry.entry_id):
+        unique_id = (reg_entry.unique_id or "").casefold()
+        enabled = reg_entry.disabled_by is None
+        if unique_id.endswith("_solax"):
+            if enabled and not unique_id.endswith(_POLL_INDEPENDENT_SUFFIXES):
+                return set()
+            continue
+        serial_key = serial_for_unique_id(unique_id, serial_index)
+        if serial_key is not None:
+            has_entities.add(serial_key)
+            if enabled:
+                has_enabled.add(serial_key)
+    return has_entities - has_enabled
+
+
+def _response_cache(hass: HomeAssistant, entry: ConfigEntry) -> SolaxResponseCache | None:
+    ttl = int(entry.options.get(CONF_RESPONSE_CACHE_TTL, DEFAULT_RESPONSE_CACHE_TTL))
+    if ttl <= 0:
+        return None
+    return SolaxResponseCache(hass, hass.config.path(RESPONSE_CACHE_DIR), ttl)
+
+
+def _response_recorder(
+    hass: HomeAssistant, entry: ConfigEntry, clock: SolaxClock
+) -> SolaxResponseRecorder | None:
+    if not entry.options.get(CONF_RESPONSE_RECORDING, False):
+        return None
+    return SolaxResponseRecorder(
+        hass, hass.config.path(RECORDING_DIR), entry.entry_id, clock=clock
+    )
+
+
 def _matches_pending_initial_setup(entry: ConfigEntry, pending: dict) -> bool:
     entry_token = str(entry.data.get(CONF_TOKEN, "")).strip()
     entry_inverters = _dedupe_serials(entry.data.get(CONF_INVERTERS, []))
@@ -191,17 +328,142 @@ def _matches_pending_initial_setup(entry: ConfigEntry, pending: dict) -> bool:
     )
 
 async def async_setup(hass: HomeAssistant, config: dict):
-    async def _handle_manual_refresh(_call):
+    async def _handle_manual_refresh(call: ServiceCall) -> ServiceResponse:
         domain_data = hass.data.get(DOMAIN, {})
-        for entry_data in domain_data.values():
+        entry_id = call.data.get(ATTR_ENTRY_ID)
+        if entry_id is not None and entry_id not in domain_data:
+            raise HomeAssistantError(f"No loaded Solax entry with id {entry_id}")
+        requested = {str(sn).strip().casefold() for sn in call.data[ATTR_SERIALS]}
+
+        targeted = []
+        matched = set()
+        for candidate_id, entry_data in domain_data.items():
+            if entry_id is not None and candidate_id != entry_id:
+                continue
+            coordinator = entry_data["coordinator"]
+            serials = None
+            if requested:
+                serials = [sn for sn in coordinator.inverters if sn.casefold() in requested]
+                if not serials:
+                    continue
+                matched.update(sn.casefold() for sn in serials)
+            targeted.append((candidate_id, coordinator, serials))
+
+        if requested and not targeted:
+            raise HomeAssistantError("No configured inverter matches the requested serials")
+
+        # Entries refresh side by side; the domain scheduler paces their calls.
+        results = await asyncio.gather(
+            *(coordinator.async_manual_refresh(serials) for _, coordinator, serials in targeted)
+        )
+        refreshed = {
+            candidate_id: result
+            for (candidate_id, _, _), result in zip(targeted, results, strict=True)
+        }
+        if call.return_response:
+            return {
+                "entries": refreshed,
+                "unknown_serials": sorted(requested - matched),
+            }
+        return None
+
+    async def _handle_burst(call: ServiceCall) -> ServiceResponse:
+        duration = call.data[ATTR_DURATION]
+        requested = {str(sn).strip().casefold() for sn in call.data[ATTR_SERIALS]}
+        by_token = {}
+        for entry_id, entry_data in hass.data.get(DOMAIN, {}).items():
             coordinator = entry_data["coordinator"]
+            serials = [
+                sn
+                for sn in coordinator.inverters
+                if (not requested or sn.casefold() in requested)
+                and sn.casefold() not in coordinator.paused_inverters
+            ]
+            by_token.setdefault(coordinator.token, []).append((entry_id, coordinator, serials))
+
+        planned = []
+        skipped = []
+        budget_error = None
+        for group in by_token.values():
+            # Entries sharing a token share its budget, so the burst is planned per token.
+            burst_count = sum(len(serials) for _, _, serials in group)
+            if not burst_count:
+                continue
+            scan_interval = min(coordinator.scan_interval for _, coordinator, _ in group)
+            interval = plan_burst_interval(
+                call.data[ATTR_INTERVAL],
+                burst_count=burst_count,
+                other_count=sum(len(c.inverters) for _, c, _ in group) - burst_count,
+                scan_interval=scan_interval,
+                duration=duration,
+                calls_today=group[0][1].api_call_counter.count("day"),
+            )
+            if interval is None or interval >= scan_interval:
+                # Tokens without budget are skipped; the others still burst.
+                budget_error = (
+                    "Not enough API budget left for a burst faster than the "
+                    f"{scan_interval}s scan interval"
+                )
+                skipped.extend(sn for _, _, serials in group for sn in serials)
+                continue
+            planned.extend(
+                (entry_id, coordinator, serials, interval)
+                for entry_id, coordinator, serials in group
+                if serials
+            )
+
+        if not planned:
+            raise HomeAssistantError(
+                budget_error or "No polled inverter matches the requested serials"
+            )
+
+        bursts = {}
+        for entry_id, coordinator, serials, interval in planned:
+            coordinator.async_start_burst(serials, interval, duration)
+            # Refresh now so the shorter interval is scheduled right away.
             await coordinator.async_request_refresh()
+            bursts[entry_id] = {
+                "serials": serials,
+                "interval": interval,
+                "until": coordinator.burst["until"].isoformat(),
+            }
+        if call.return_response:
+            return {"bursts": bursts, "skipped_serials": skipped}
+        return None
 
     if not hass.services.has_service(DOMAIN, SERVICE_MANUAL_REFRESH):
-        hass.services.async_register(DOMAIN, SERVICE_MANUAL_REFRESH, _handle_manual_refresh)
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_MANUAL_REFRESH,
+            _handle_manual_refresh,
+            schema=MANUAL_REFRESH_SCHEMA,
+            supports_response=SupportsResponse.OPTIONAL,
+        )
+    if not hass.services.has_service(DOMAIN, SERVICE_BURST):
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_BURST,
+            _handle_burst,
+            schema=BURST_SCHEMA,
+            supports_response=SupportsResponse.OPTIONAL,
+        )
 
     return True
 
+@callback
+def _async_update_system_device_name(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Rename the System Totals device after a system name change."""
+    device_registry = dr.async_get(hass)
+    name = f"{entry.data.get(CONF_SYSTEM_NAME)} System Totals"
+    for device in dr.async_entries_for_config_entry(device_registry, entry.entry_id):
+        is_system_device = any(
+            domain == DOMAIN and str(identifier).startswith("system_totals_")
+            for domain, identifier in device.identifiers
+        )
+        if is_system_device and device.name != name:
+            device_registry.async_update_device(device.id, name=name)
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     hass.data.setdefault(DOMAIN, {})
     hass.data.setdefault(RUNTIME_RELOAD_STATE, {})
@@ -213,6 +475,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     reload_state = runtime_reload_state.pop(entry.entry_id, None)
     initial_data = {}
     initial_refresh_inverters = None
+    preflight_api_calls = 0
     if isinstance(reload_state, dict):
         token_changed = bool(reload_state.get("token_changed", False))
         cached_data = reload_state.get("data", {})
@@ -235,6 +498,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
             runtime_reload_state.pop(RUNTIME_INITIAL_SETUP_STATE, None)
             preflight_state = pending_initial_setup.get("state", {})
             if isinstance(preflight_state, dict):
+                preflight_api_calls = int(preflight_state.get("api_calls", 0) or 0)
                 preflight_data = preflight_state.get("data", {})
                 if isinstance(preflight_data, dict):
                     configured = {sn.casefold() for sn in inverters}
@@ -249,6 +513,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
                         if serial.casefold() not in preflight_known
                     ]
 
+    state_store = SolaxStateStore(hass, entry.entry_id)
+    await state_store.async_load()
+    scheduler = hass.data.setdefault(RUNTIME_SCHEDULER, SolaxRequestScheduler())
+    api_call_counter = scheduler.register(entry.entry_id, token, inverters)
+
     coordinator = SolaxCoordinator(
         hass,
         token,
@@ -256,8 +525,33 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         scan,
         initial_data=initial_data,
         initial_refresh_inverters=initial_refresh_inverters,
+        state_store=state_store,
+        lean_attributes=bool(entry.options.get(CONF_LEAN_ATTRIBUTES, False)),
+        night_mode=bool(entry.options.get(CONF_NIGHT_MODE, False)),
+        night_battery_interval=int(
+            entry.options.get(CONF_NIGHT_BATTERY_INTERVAL, DEFAULT_NIGHT_BATTERY_INTERVAL)
+        ),
+        scheduler=scheduler,
+        api_call_counter=api_call_counter,
+        response_cache=_response_cache(hass, entry),
+        response_recorder=_response_recorder(hass, entry, scheduler.clock),
+        batch_size=int(entry.options.get(CONF_BATCH_SIZE, DEFAULT_BATCH_SIZE)),
+        api_endpoints=list(entry.options.get(CONF_API_ENDPOINTS, DEFAULT_API_ENDPOINTS)),
+        clock=scheduler.clock,
     )
-    await coordinator.async_config_entry_first_refresh()
+    if preflight_api_calls:
+        # Calls made by the config flow preflight count against the same token.
+        coordinator.api_call_counter.record(calls=preflight_api_calls)
+        scheduler.record(token, preflight_api_calls)
+    coordinator.set_paused_inverters(_inverters_without_enabled_entities(hass, entry, inverters))
+    try:
+        await coordinator.async_probe_endpoints()
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        await state_store.async_unload()
+        if scheduler.unregister(entry.entry_id):
+            hass.data.pop(RUNTIME_SCHEDULER, None)
+        raise
     i18n_texts = await _load_runtime_notification_texts(hass)
     _update_rate_limit_notification(hass, entry.entry_id, coordinator, i18n_texts)
     _update_invalid_serial_notification(hass, entry.entry_id, coordinator, i18n_texts)
@@ -267,15 +561,137 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         _update_invalid_serial_notification(hass, entry.entry_id, coordinator, i18n_texts)
 
     rate_limit_unsub = coordinator.async_add_listener(_handle_coordinator_update)
+    entry.async_on_unload(
+        async_track_time_interval(
+            hass, coordinator.async_probe_endpoints, timedelta(seconds=ENDPOINT_PROBE_INTERVAL)
+        )
+    )
+
+    pending_pause_refresh = None
+
+    @callback
+    def _refresh_paused_inverters(_now=None) -> None:
+        nonlocal pending_pause_refresh
+        pending_pause_refresh = None
+        coordinator.set_paused_inverters(
+            _inverters_without_enabled_entities(hass, entry, inverters)
+        )
+
+    @callback
+    def _handle_entity_registry_updated(event: Event) -> None:
+        nonlocal pending_pause_refresh
+        if event.data.get("action") == "update" and "disabled_by" not in event.data.get(
+            "changes", {}
+        ):
+            return
+        # Platform setup fires one event per entity; rescan the registry once per burst.
+        if pending_pause_refresh is None:
+            pending_pause_refresh = async_call_later(
+                hass, REGISTRY_UPDATE_DEBOUNCE, _refresh_paused_inverters
+            )
+
+    @callback
+    def _cancel_pending_pause_refresh() -> None:
+        if pending_pause_refresh is not None:
+            pending_pause_refresh()
+
+    entry.async_on_unload(
+        hass.bus.async_listen(er.EVENT_ENTITY_REGISTRY_UPDATED, _handle_entity_registry_updated)
+    )
+    entry.async_on_unload(_cancel_pending_pause_refresh)
 
     def _refresh_rate_limit_notification():
         _update_rate_limit_notification(hass, entry.entry_id, coordinator, i18n_texts)
 
+    @callback
+    def _apply_options() -> None:
+        """Apply changes that keep token and inverter set without reloading the entry."""
+        coordinator.async_apply_settings(
+            scan_interval=int(entry.data.get(CONF_SCAN_INTERVAL, 120)),
+            lean_attributes=bool(entry.options.get(CONF_LEAN_ATTRIBUTES, False)),
+            night_mode=bool(entry.options.get(CONF_NIGHT_MODE, False)),
+            night_battery_interval=int(
+                entry.options.get(CONF_NIGHT_BATTERY_INTERVAL, DEFAULT_NIGHT_BATTERY_INTERVAL)
+            ),
+        )
+        cache_ttl = int(entry.options.get(CONF_RESPONSE_CACHE_TTL, DEFAULT_RESPONSE_CACHE_TTL))
+        if getattr(coordinator.response_cache, "ttl", 0) != cache_ttl:
+            coordinator.response_cache = _response_cache(hass, entry)
+        if bool(entry.options.get(CONF_RESPONSE_RECORDING, False)) != (
+            coordinator.response_recorder is not None
+        ):
+            coordinator.set_response_recorder(
+                _response_recorder(hass, entry, coordinator.clock)
+            )
+        coordinator.client.set_chunk_size(
+            int(entry.options.get(CONF_BATCH_SIZE, DEFAULT_BATCH_SIZE))
+        )
+        coordinator.client.set_endpoints(
+            list(entry.options.get(CONF_API_ENDPOINTS, DEFAULT_API_ENDPOINTS))
+        )
+        _async_update_system_device_name(hass, entry)
+        _refresh_rate_limit_notification()
+
+    async def _async_fetch_added_inverters(serials: list[str]) -> None:
+        # A cycle that started before the serials were added does not poll them.
+        while (await coordinator.async_manual_refresh(serials))["mode"] == "in_flight":
+            pass
+
+    async def _async_apply_inverters(preflight: dict | None = None) -> list[str]:
+        """Add/remove serials on the running entry without waiting for new ones to be fetched.
+
+        Added serials checked by the options flow preflight start from that
+        reply; the rest are fetched in the background. Returns those serials.
+        """
+        configured = _dedupe_serials(entry.data.get(CONF_INVERTERS, []))
+        known = {sn.casefold() for sn in inverters}
+        added = [sn for sn in configured if sn.casefold() not in known]
+        removed = coordinator.async_set_inverters(configured)
+        coordinator.set_paused_inverters(
+            _inverters_without_enabled_entities(hass, entry, inverters)
+        )
+        apply_removed_inverters = hass.data[DOMAIN][entry.entry_id].get(
+            "apply_removed_inverters"
+        )
+        if apply_removed_inverters is not None:
+            await apply_removed_inverters(removed)
+
+        preflight = preflight if isinstance(preflight, dict) else {}
+        preflight_api_calls = int(preflight.get("api_calls", 0) or 0)
+        if preflight_api_calls:
+            coordinator.api_call_counter.record(calls=preflight_api_calls)
+            scheduler.record(token, preflight_api_calls)
+        preflight_data = preflight.get("data") or {}
+        deferred = []
+        for sn in added:
+            payload = preflight_data.get(sn)
+            if not isinstance(payload, dict):
+                deferred.append(sn)
+                continue
+            coordinator.data[sn] = dict(payload)
+            if sn in preflight.get("rate_limited_inverters", []):
+                setattr(coordinator, f"_last_rate_limit_{sn}", coordinator.clock.monotonic())
+                coordinator.rate_limited_inverters.append(sn)
+                coordinator.rate_limited_details[sn] = preflight["rate_limited_details"][sn]
+            elif sn in preflight.get("unauthorized_inverters", []):
+                coordinator.unauthorized_inverters.append(sn)
+                coordinator.unauthorized_details[sn] = preflight["unauthorized_details"][sn]
+        if deferred:
+            entry.async_create_background_task(
+                hass,
+                _async_fetch_added_inverters(deferred),
+                f"{DOMAIN} fetch added inverters {entry.entry_id}",
+            )
+        coordinator.async_update_listeners()
+        return deferred
+
     hass.data[DOMAIN][entry.entry_id] = {
         "coordinator": coordinator,
         "entry": entry,
         "rate_limit_unsub": rate_limit_unsub,
         "refresh_rate_limit_notification": _refresh_rate_limit_notification,
+        "apply_options": _apply_options,
+        "apply_inverters": _async_apply_inverters,
     }
 
     # Forward the setup to the sensor platform
@@ -292,8 +708,24 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             rate_limit_unsub = entry_data.get("rate_limit_unsub")
             if rate_limit_unsub:
                 rate_limit_unsub()
+            coordinator = entry_data.get("coordinator")
+            if coordinator is not None:
+                coordinator.async_cancel_burst()
+            scheduler = hass.data.get(RUNTIME_SCHEDULER)
+            if scheduler is not None and scheduler.unregister(entry.entry_id):
+                hass.data.pop(RUNTIME_SCHEDULER, None)
+            state_store = getattr(coordinator, "state_store", None)
+            if state_store is not None:
+                await state_store.async_unload()
         persistent_notification.async_dismiss(hass, _rate_limit_notification_id(entry.entry_id))
         persistent_notification.async_dismiss(hass, _invalid_serial_notification_id(entry.entry_id))
         if not hass.data[DOMAIN] and hass.services.has_service(DOMAIN, SERVICE_MANUAL_REFRESH):
             hass.services.async_remove(DOMAIN, SERVICE_MANUAL_REFRESH)
+        if not hass.data[DOMAIN] and hass.services.has_service(DOMAIN, SERVICE_BURST):
+            hass.services.async_remove(DOMAIN, SERVICE_BURST)
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove persisted estimator/scheduler state with the config entry."""
+    await SolaxStateStore(hass, entry.entry_id).async_remove()
@@ -0,0 +1,103 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+
+from homeassistant.core import HomeAssistant
+
+from .quota import token_fingerprint
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SolaxResponseCache:
+    """File-backed cache of successful API responses keyed by token and serial.
+
+    Each serial gets its own JSON file. Writes go to a temp file in the same
+    directory and are swapped in with os.replace, so concurrent writers on the
+    same host (other entries or another Home Assistant instance sharing the
+    directory) never leave a partial file behind. Ages use wall-clock time
+    because the file outlives this process.
+    """
+
+    def __init__(self, hass: HomeAssistant, directory: str, ttl: int):
+        self.hass = hass
+        self.directory = directory
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.errors = 0
+
+    def _path(self, token: str, serial: str) -> str:
+        key = f"{token_fingerprint(token)}:{serial.casefold()}"
+        name = hashlib.sha256(key.encode("utf-8")).hexdigest()[:24]
+        return os.path.join(self.directory, f"{name}.json")
+
+    def _read(self, path: str) -> dict | None:
+        try:
+            with open(path, encoding="utf-8") as cache_file:
+                stored = json.load(cache_file)
+        except FileNotFoundError:
+            return None
+        if not isinstance(stored, dict) or not isinstance(stored.get("response"), dict):
+            return None
+        age = time.time() - float(stored.get("fetched_at", 0))
+        if not 0 <= age < self.ttl:
+            return None
+        return stored["response"]
+
+    def _write(self, path: str, response: dict) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".tmp_", suffix=".json")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+                json.dump({"fetched_at": time.time(), "response": response}, tmp_file)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    async def async_get(self, token: str, serial: str) -> dict | None:
+        """Return a cached response younger than the TTL, or None."""
+        try:
+            response = await self.hass.async_add_executor_job(
+                self._read, self._path(token, serial)
+            )
+        except (OSError, ValueError) as err:
+            _LOGGER.debug("Could not read cached Solax response for %s: %s", serial, err)
+            self.errors += 1
+            response = None
+        if response is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return response
+
+    async def async_put(self, token: str, serial: str, response: dict) -> None:
+        try:
+            await self.hass.async_add_executor_job(
+                self._write, self._path(token, serial), response
+            )
+        except (OSError, TypeError, ValueError) as err:
+            _LOGGER.debug("Could not write cached Solax response for %s: %s", serial, err)
+            self.errors += 1
+            return
+        self.writes += 1
+
+    def as_dict(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "enabled": True,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 3) if lookups else None,
+            "writes": self.writes,
+            "errors": self.errors,
+        }
@@ -0,0 +1,473 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Any
+
+import aiohttp
+
+API_BASE_URL = "https://global.solaxcloud.com"
+API_REALTIME_PATH = "/api/v2/dataAccess/realtimeInfo/get"
+# Multi-serial variant of the realtime path (comma-separated wifiSn). It is not
+# in the published SolaX API documentation and unverified on real accounts, so
+# batching stays off by default (batch size 1). The first batch call probes it;
+# a rejection falls back to one call per serial and is not retried.
+API_BATCH_PATH = "/api/v2/dataAccess/batchRealtimeInfo/get"
+API_REQUEST_TIMEOUT = 15
+# Connection pool size of a client that opens its own aiohttp session.
+CLIENT_CONNECTION_LIMIT = 10
+DEFAULT_BATCH_SIZE = 1
+DEFAULT_API_ENDPOINTS = [API_BASE_URL]
+ENDPOINT_PROBE_TIMEOUT = 5
+ENDPOINT_RETRY_AFTER = 300
+
+_LOGGER = logging.getLogger(__name__)
+
+_RATE_LIMIT_MARKERS = (
+    "rate limit",
+    "maximum call threshold",
+    "suspend the request",
+    "current minute > threshold",
+    "within the current minute",
+    "too many requests",
+)
+
+
+class SolaxOutcome(StrEnum):
+    """What a single-serial reply means for the caller."""
+
+    OK = "ok"
+    RATE_LIMITED = "rate_limited"
+    TOKEN_INVALID = "token_invalid"
+    DATA_UNAUTHORIZED = "data_unauthorized"
+    API_ERROR = "api_error"
+    HTTP_ERROR = "http_error"
+    TIMEOUT = "timeout"
+    CONNECTION_ERROR = "connection_error"
+    BAD_RESPONSE = "bad_response"
+
+
+# Batch replies with these outcomes concern the token or the call itself, so every
+# serial of the chunk gets the answer a single-serial call would have had.
+_SHARED_BATCH_OUTCOMES = (
+    SolaxOutcome.RATE_LIMITED,
+    SolaxOutcome.TOKEN_INVALID,
+    SolaxOutcome.TIMEOUT,
+    SolaxOutcome.CONNECTION_ERROR,
+)
+
+
+def is_rate_limited_response(resp: dict) -> bool:
+    """Return True when Solax response indicates API throttling/rate limit."""
+    if not isinstance(resp, dict):
+        return False
+
+    code = resp.get("code")
+    if code in (3, 104):
+        return True
+
+    exception = str(resp.get("exception", "")).lower()
+    return any(marker in exception for marker in _RATE_LIMIT_MARKERS)
+
+
+def is_token_rejected(resp: dict) -> bool:
+    """Return True for replies that reject the token itself (setup validation)."""
+    # 1001 = Interface Unauthorized, 1002 = Parameter validation failed.
+    if resp.get("code") in (1001, 1002):
+        return True
+    exception = str(resp.get("exception", "")).lower()
+    return "token" in exception and "invalid" in exception
+
+
+def classify_response(resp: Any) -> SolaxOutcome:
+    """Map a decoded reply, or an `{"error": ...}` transport payload, to an outcome."""
+    if not isinstance(resp, dict):
+        return SolaxOutcome.BAD_RESPONSE
+    if "error" in resp and "code" not in resp and "success" not in resp:
+        error = str(resp["error"])
+        if error == "Timeout":
+            return SolaxOutcome.TIMEOUT
+        if error.startswith("HTTP "):
+            return SolaxOutcome.HTTP_ERROR
+        if error.startswith("JSON Error"):
+            return SolaxOutcome.BAD_RESPONSE
+        return SolaxOutcome.CONNECTION_ERROR
+    if is_rate_limited_response(resp):
+        return SolaxOutcome.RATE_LIMITED
+    code = resp.get("code")
+    if code == 1001:
+        return SolaxOutcome.TOKEN_INVALID
+    if code == 1003:
+        return SolaxOutcome.DATA_UNAUTHORIZED
+    if not resp.get("success", False) or (code is not None and code != 0):
+        return SolaxOutcome.API_ERROR
+    return SolaxOutcome.OK
+
+
+@dataclass(frozen=True, slots=True)
+class SolaxReply:
+    """One serial's reply: the typed outcome plus the payload as SolaX sent it."""
+
+    serial: str
+    outcome: SolaxOutcome
+    payload: dict
+    status: int | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.outcome is SolaxOutcome.OK
+
+    @property
+    def code(self):
+        return self.payload.get("code")
+
+    @property
+    def exception(self):
+        return self.payload.get("exception")
+
+
+def _serial_keys(item: dict) -> set[str]:
+    keys = set()
+    for field in ("wifiSn", "sn", "inverterSN", "inverterSn"):
+        value = item.get(field)
+        if value not in (None, ""):
+            keys.add(str(value).strip().casefold())
+    return keys
+
+
+class SolaxEndpoint:
+    """Round-trip latency and error bookkeeping for one SolaX Cloud host."""
+
+    # Weight of the newest sample in the smoothed latency.
+    _SMOOTHING = 0.3
+
+    def __init__(self, base_url: str):
+        self.base_url = base_url.strip().rstrip("/")
+        self.latency = None
+        self.requests = 0
+        self.errors = 0
+        self.last_error = None
+        self.unhealthy_until = None
+
+    def healthy(self, now: float) -> bool:
+        return self.unhealthy_until is None or now >= self.unhealthy_until
+
+    def record_success(self, elapsed: float) -> None:
+        if self.latency is None:
+            self.latency = elapsed
+        else:
+            self.latency += (elapsed - self.latency) * self._SMOOTHING
+        self.unhealthy_until = None
+
+    def record_failure(self, error: str, now: float, retry_after: float) -> None:
+        self.errors += 1
+        self.last_error = error
+        self.unhealthy_until = now + retry_after
+
+    def as_dict(self, now: float) -> dict:
+        return {
+            "url": self.base_url,
+            "healthy": self.healthy(now),
+            "latency_ms": round(self.latency * 1000, 1) if self.latency is not None else None,
+            "requests": self.requests,
+            "errors": self.errors,
+            "last_error": self.last_error,
+            "retry_in_seconds": (
+                round(self.unhealthy_until - now, 1) if not self.healthy(now) else None
+            ),
+        }
+
+
+class SolaxCloudClient:
+    """Realtime-data client for one SolaX Cloud token.
+
+    `async_fetch` asks for one serial; `async_fetch_batch` asks for several in
+    one call (chunk size above 1) and splits the reply into per-serial
+    replies, switching batching off after a reply showing the endpoint does not
+    support it. Both return `SolaxReply` objects classified by `SolaxOutcome`.
+
+    Requests go to the fastest healthy host of `endpoints`; a timeout,
+    connection error or 5xx marks the host unhealthy and the request moves on
+    to the next host. When every host failed that way, the request is retried
+    `retries` times with exponential backoff. `pacer` is awaited before each
+    attempt, so callers plug in their own rate limiting and call counting.
+    `recorder`, when set, is called with every attempt's path, `wifiSn`, host,
+    HTTP status, decoded reply and round-trip seconds.
+
+    Pass an aiohttp session per call or at construction; otherwise the client
+    opens a pooled session of its own, closed by `async_close` or `async with`.
+    The module imports neither Home Assistant nor the rest of the package, so
+    fleet tools can load it straight from its file with importlib and drive
+    the same request path as the integration.
+    """
+
+    def __init__(
+        self,
+        token: str,
+        *,
+        session: aiohttp.ClientSession | None = None,
+        endpoints: list[str] | None = None,
+        chunk_size: int = DEFAULT_BATCH_SIZE,
+        timeout: float = API_REQUEST_TIMEOUT,
+        retry_after: float = ENDPOINT_RETRY_AFTER,
+        retries: int = 0,
+        retry_delay: float = 1.0,
+        pacer: Callable[[], Awaitable[Any]] | None = None,
+        connection_limit: int = CLIENT_CONNECTION_LIMIT,
+        recorder: Callable[[str, str, str, int | None, dict, float], Any] | None = None,
+    ):
+        self.token = token
+        self.endpoints = []
+        self.set_endpoints(endpoints or DEFAULT_API_ENDPOINTS)
+        self.chunk_size = max(int(chunk_size), 1)
+        self.timeout = timeout
+        self.retry_after = retry_after
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.pacer = pacer
+        self.recorder = recorder
+        self._session = session
+        self._owns_session = False
+        self._connection_limit = connection_limit
+        # None until the first batch reply; False once batching was rejected.
+        self.batch_supported = None
+        self.single_calls = 0
+        self.batch_calls = 0
+        self.batch_fallbacks = 0
+        self.retried_calls = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_exc_info) -> None:
+        await self.async_close()
+
+    async def async_close(self) -> None:
+        """Close the session if the client opened it."""
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+        self._session = None
+        self._owns_session = False
+
+    def _get_session(self, session) -> aiohttp.ClientSession:
+        if session is not None:
+            return session
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self._connection_limit)
+            )
+            self._owns_session = True
+        return self._session
+
+    @property
+    def batching(self) -> bool:
+        return self.chunk_size > 1 and self.batch_supported is not False
+
+    def set_chunk_size(self, chunk_size: int) -> None:
+        """Change the chunk size; a rejected batch endpoint is not probed again."""
+        self.chunk_size = max(int(chunk_size), 1)
+
+    def set_endpoints(self, base_urls: list[str]) -> None:
+        """Replace the host list; hosts that stay keep their statistics."""
+        known = {endpoint.base_url: endpoint for endpoint in self.endpoints}
+        endpoints = {}
+        for base_url in base_urls:
+            base_url = base_url.strip().rstrip("/")
+            if base_url and base_url not in endpoints:
+                endpoints[base_url] = known.get(base_url) or SolaxEndpoint(base_url)
+        self.endpoints = list(endpoints.values())
+
+    def ordered_endpoints(self) -> list[SolaxEndpoint]:
+        """Healthy hosts by measured latency, then unhealthy ones by retry time."""
+        now = asyncio.get_running_loop().time()
+        healthy = [endpoint for endpoint in self.endpoints if endpoint.healthy(now)]
+        unhealthy = [endpoint for endpoint in self.endpoints if not endpoint.healthy(now)]
+        # Unmeasured hosts keep their configured order behind measured ones.
+        healthy.sort(key=lambda endpoint: (endpoint.latency is None, endpoint.latency or 0))
+        unhealthy.sort(key=lambda endpoint: endpoint.unhealthy_until)
+        return healthy + unhealthy
+
+    def chunks(self, serials: list[str]) -> list[list[str]]:
+        return [
+            serials[start : start + self.chunk_size]
+            for start in range(0, len(serials), self.chunk_size)
+        ]
+
+    async def _request(self, session, path: str, wifi_sn: str) -> tuple[int | None, dict]:
+        status, payload = None, {"error": "No API endpoint configured"}
+        for attempt in range(self.retries + 1):
+            if attempt:
+                self.retried_calls += 1
+                await asyncio.sleep(self.retry_delay * 2 ** (attempt - 1))
+            if self.pacer is not None:
+                await self.pacer()
+            for endpoint in self.ordered_endpoints():
+                status, payload = await self._post(session, endpoint, path, wifi_sn)
+                if status is not None and status < 500:
+                    return status, payload
+                # Timeouts, connection errors and 5xx: try the next host.
+        return status, payload
+
+    async def _post(
+        self, session, endpoint: SolaxEndpoint, path: str, wifi_sn: str
+    ) -> tuple[int | None, dict]:
+        if self.recorder is None:
+            return await self._send(session, endpoint, path, wifi_sn)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        status, payload = await self._send(session, endpoint, path, wifi_sn)
+        self.recorder(path, wifi_sn, endpoint.base_url, status, payload, loop.time() - started)
+        return status, payload
+
+    async def _send(
+        self, session, endpoint: SolaxEndpoint, path: str, wifi_sn: str
+    ) -> tuple[int | None, dict]:
+        headers = {"Content-Type": "application/json", "tokenId": self.token}
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        endpoint.requests += 1
+        try:
+            async with asyncio.timeout(self.timeout):
+                async with session.post(
+                    f"{endpoint.base_url}{path}", json={"wifiSn": wifi_sn}, headers=headers
+                ) as resp:
+                    text = await resp.text()
+                    if resp.status >= 500:
+                        endpoint.record_failure(f"HTTP {resp.status}", loop.time(), self.retry_after)
+                    else:
+                        endpoint.record_success(loop.time() - started)
+                    if resp.status != 200:
+                        _LOGGER.warning(
+                            "Solax HTTP error %s for %s from %s: %s",
+                            resp.status,
+                            wifi_sn,
+                            endpoint.base_url,
+                            text,
+                        )
+                        return resp.status, {"error": f"HTTP {resp.status}", "raw": text}
+
+                    try:
+                        j = await resp.json()
+                    except Exception as json_err:
+                        _LOGGER.warning("JSON parse error for %s: %s", wifi_sn, json_err)
+                        return resp.status, {"error": f"JSON Error: {json_err}", "raw": text}
+
+                    return resp.status, j
+        except TimeoutError:
+            _LOGGER.warning("Timeout fetching data for %s from %s", wifi_sn, endpoint.base_url)
+            endpoint.record_failure("Timeout", loop.time(), self.retry_after)
+            return None, {"error": "Timeout"}
+        except Exception as e:
+            _LOGGER.warning("Failed request for %s to %s: %s", wifi_sn, endpoint.base_url, e)
+            endpoint.record_failure(str(e), loop.time(), self.retry_after)
+            return None, {"error": str(e)}
+
+    async def async_probe(self, session=None) -> None:
+        """Measure the round trip to every host with a request that costs no API call."""
+        session = self._get_session(session)
+        await asyncio.gather(*(self._probe(session, endpoint) for endpoint in self.endpoints))
+
+    async def _probe(self, session, endpoint: SolaxEndpoint) -> None:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        try:
+            async with asyncio.timeout(ENDPOINT_PROBE_TIMEOUT):
+                async with session.get(endpoint.base_url, allow_redirects=False) as resp:
+                    status = resp.status
+        except TimeoutError:
+            endpoint.record_failure("Probe timeout", loop.time(), self.retry_after)
+            return
+        except (aiohttp.ClientError, OSError) as e:
+            endpoint.record_failure(f"Probe failed: {e}", loop.time(), self.retry_after)
+            return
+        if status >= 500:
+            endpoint.record_failure(f"Probe HTTP {status}", loop.time(), self.retry_after)
+        else:
+            endpoint.record_success(loop.time() - started)
+
+    async def async_fetch(self, serial: str, *, session=None) -> SolaxReply:
+        self.single_calls += 1
+        status, payload = await self._request(
+            self._get_session(session), API_REALTIME_PATH, serial
+        )
+        return SolaxReply(serial, classify_response(payload), payload, status)
+
+    async def async_fetch_batch(
+        self, serials: list[str], *, session=None
+    ) -> dict[str, SolaxReply] | None:
+        """Fetch up to `chunk_size` serials in one call.
+
+        Returns replies keyed by the requested serials. Serials missing from
+        the batch reply are left out so the caller can fetch them one by one.
+        Returns None when the endpoint does not support batches.
+        """
+        self.batch_calls += 1
+        status, payload = await self._request(
+            self._get_session(session), API_BATCH_PATH, ",".join(serials)
+        )
+
+        if not isinstance(payload, dict):
+            self._disable_batching(payload)
+            return None
+
+        outcome = classify_response(payload)
+        if outcome in _SHARED_BATCH_OUTCOMES or (
+            outcome is SolaxOutcome.HTTP_ERROR and (status >= 500 or status == 429)
+        ):
+            # Throttling, token errors, timeouts and server errors hit every serial alike.
+            return {sn: SolaxReply(sn, outcome, dict(payload), status) for sn in serials}
+
+        items = payload.get("result")
+        if outcome is not SolaxOutcome.OK or not isinstance(items, list):
+            self._disable_batching(payload)
+            return None
+
+        self.batch_supported = True
+        by_serial = {}
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            for key in _serial_keys(item):
+                by_serial.setdefault(key, item)
+
+        replies = {}
+        for sn in serials:
+            item = by_serial.get(sn.casefold())
+            if item is None:
+                continue
+            replies[sn] = SolaxReply(
+                sn,
+                SolaxOutcome.OK,
+                {
+                    "success": True,
+                    "code": 0,
+                    "exception": payload.get("exception"),
+                    "result": item,
+                },
+                status,
+            )
+        return replies
+
+    def _disable_batching(self, payload) -> None:
+        _LOGGER.info(
+            "Solax batch requests are not supported for this token (%s); "
+            "falling back to one call per serial",
+            (payload.get("exception") or payload.get("error"))
+            if isinstance(payload, dict)
+            else payload,
+        )
+        self.batch_supported = False
+        self.batch_fallbacks += 1
+
+    def as_dict(self) -> dict:
+        now = asyncio.get_running_loop().time()
+        return {
+            "batch_size": self.chunk_size,
+            "batch_supported": self.batch_supported,
+            "single_calls": self.single_calls,
+            "batch_calls": self.batch_calls,
+            "batch_fallbacks": self.batch_fallbacks,
+            "retried_calls": self.retried_calls,
+            "endpoints": [endpoint.as_dict(now) for endpoint in self.ordered_endpoints()],
+        }
@@ -0,0 +1,26 @@
+import asyncio
+from datetime import datetime
+
+from homeassistant.util import dt as dt_util
+
+
+class SolaxClock:
+    """Time source for pacing, cooldowns, quota windows and day rollovers.
+
+    The coordinator, the request scheduler, the API call counters and the
+    estimators read time only through this object. The default reads the event
+    loop's monotonic clock and Home Assistant's UTC time; tests and replays pass
+    a virtual clock instead to run days of polling in seconds.
+    """
+
+    def monotonic(self) -> float:
+        return asyncio.get_running_loop().time()
+
+    def utcnow(self) -> datetime:
+        return dt_util.utcnow()
+
+    async def sleep(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+
+
+SYSTEM_CLOCK = SolaxClock()
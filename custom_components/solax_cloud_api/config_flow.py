@@ -1,37 +1,85 @@
 import asyncio
+import csv
+import io
 import logging
 from typing import Any
+from urllib.parse import urlparse
 
-import async_timeout
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import selector
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.translation import async_get_translations
 from homeassistant.util import slugify
 
+from .client import SolaxCloudClient, SolaxOutcome, classify_response, is_token_rejected
 from .const import (
-    API_URL,
+    API_CALLS_PER_MINUTE_LIMIT,
+    API_QUOTA_SAFETY_FACTOR,
+    CONF_API_ENDPOINTS,
+    CONF_AUTO_SCAN_INTERVAL,
+    CONF_BATCH_SIZE,
     CONF_ENTITY_PREFIX,
+    CONF_ENTITY_PROFILE,
     CONF_INVERTERS,
+    CONF_LEAN_ATTRIBUTES,
+    CONF_NIGHT_BATTERY_INTERVAL,
+    CONF_NIGHT_MODE,
     CONF_RATE_LIMIT_NOTIFICATIONS,
+    CONF_RESPONSE_CACHE_TTL,
+    CONF_RESPONSE_RECORDING,
     CONF_SCAN_INTERVAL,
     CONF_SYSTEM_NAME,
     CONF_TOKEN,
+    DEFAULT_API_ENDPOINTS,
+    DEFAULT_BATCH_SIZE,
     DEFAULT_ENTITY_PREFIX,
+    DEFAULT_ENTITY_PROFILE,
+    DEFAULT_NIGHT_BATTERY_INTERVAL,
+    DEFAULT_RESPONSE_CACHE_TTL,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
+    ENTITY_PROFILES,
     INVALID_ENTITY_PREFIXES,
+    MAX_BATCH_SIZE,
+    MAX_RESPONSE_CACHE_TTL,
+    MAX_SCAN_INTERVAL,
+    MIN_SCAN_INTERVAL,
+    PREFLIGHT_REQUEST_TIMEOUT,
     RUNTIME_INITIAL_SETUP_STATE,
     RUNTIME_RELOAD_STATE,
+    RUNTIME_SCHEDULER,
 )
+from .quota import plan_scan_interval
 
 _LOGGER = logging.getLogger(__name__)
 
 _TRANSLATION_PREFIX = f"component.{DOMAIN}."
 _ACKNOWLEDGE_FIELD = "acknowledge"
+# Entry data applied to the running coordinator; other data changes reload the entry.
+_HOT_APPLY_DATA_KEYS = (CONF_SCAN_INTERVAL, CONF_SYSTEM_NAME)
+# Outcomes where the request never got a well-formed API answer.
+_UNREACHED_OUTCOMES = (
+    SolaxOutcome.HTTP_ERROR,
+    SolaxOutcome.TIMEOUT,
+    SolaxOutcome.CONNECTION_ERROR,
+    SolaxOutcome.BAD_RESPONSE,
+)
+# The serial field accepts one serial or a pasted newline/comma/CSV list.
+_SERIAL_LIST_SELECTOR = selector.TextSelector(selector.TextSelectorConfig(multiline=True))
+_ENDPOINT_LIST_SELECTOR = selector.TextSelector(selector.TextSelectorConfig(multiline=True))
+# CSV header cells that mark the serial column of an exported device list.
+_SERIAL_CSV_HEADERS = ("serial", "serial number", "sn", "wifisn", "registration no.")
+_IMPORT_STATUS_DEFAULTS = {
+    "ok": "OK",
+    "unauthorized": "Data Unauthorized (1003)",
+    "rate_limited": "Rate limited",
+    "deferred": "Checked on first refresh",
+    "error": "No response",
+}
 
 def _slugify_name(value: str) -> str:
     if value is None:
@@ -68,6 +116,107 @@ def _dedupe_serials(serials: list[str]) -> list[str]:
         unique.append(normalized)
     return unique
 
+def _parse_serial_list(value: str) -> list[str]:
+    """Split a pasted serial list (newlines, commas, semicolons or CSV) into unique serials.
+
+    When the first CSV row names a serial column, only that column is read.
+    """
+    rows = [
+        row
+        for row in csv.reader(io.StringIO(str(value or "").replace(";", ",")))
+        if any(cell.strip() for cell in row)
+    ]
+    column = None
+    if rows:
+        header = [cell.strip().casefold() for cell in rows[0]]
+        column = next(
+            (index for index, cell in enumerate(header) if cell in _SERIAL_CSV_HEADERS), None
+        )
+        if column is not None:
+            rows = rows[1:]
+
+    serials = []
+    for row in rows:
+        cells = row if column is None else row[column:column + 1]
+        for cell in cells:
+            serials.extend(cell.split())
+    return _dedupe_serials(serials)
+
+def _parse_endpoint_list(value: str) -> list[str] | None:
+    """Split pasted API hosts into base URLs; None when one is not an http(s) URL."""
+    endpoints = []
+    for raw in str(value or "").replace(",", " ").replace(";", " ").split():
+        parsed = urlparse(raw)
+        if parsed.scheme not in ("http", "https") or not parsed.netloc:
+            return None
+        base_url = raw.rstrip("/")
+        if base_url not in endpoints:
+            endpoints.append(base_url)
+    return endpoints or None
+
+
+def _add_serials(
+    serials: list[str], value: str, taken: list[str] | None = None
+) -> tuple[list[str], list[str]]:
+    """Append the new serials of a pasted list in place; return (added, duplicates).
+
+    Serials in `taken` (configured in another entry) count as duplicates.
+    """
+    added = []
+    duplicates = []
+    for serial in _parse_serial_list(value):
+        if _serial_exists(serial, serials) or _serial_exists(serial, taken or []):
+            duplicates.append(serial)
+        else:
+            serials.append(serial)
+            added.append(serial)
+    return added, duplicates
+
+def _serial_import_statuses(
+    serials: list[str],
+    data: dict[str, Any] | None,
+    rate_limited: list[str] | None = None,
+    unauthorized: list[str] | None = None,
+    deferred: list[str] | None = None,
+) -> dict[str, str]:
+    """Classify each serial as ok, unauthorized, rate_limited, deferred or error."""
+    payloads = {
+        str(serial).casefold(): payload
+        for serial, payload in (data or {}).items()
+        if isinstance(payload, dict)
+    }
+    rate_limited_keys = {sn.casefold() for sn in rate_limited or []}
+    unauthorized_keys = {sn.casefold() for sn in unauthorized or []}
+    deferred_keys = {sn.casefold() for sn in deferred or []}
+
+    statuses = {}
+    for serial in serials:
+        key = serial.casefold()
+        payload = payloads.get(key)
+        if key in unauthorized_keys:
+            statuses[serial] = "unauthorized"
+        elif key in rate_limited_keys:
+            statuses[serial] = "rate_limited"
+        elif key in deferred_keys or payload is None:
+            statuses[serial] = "deferred"
+        elif payload.get("error"):
+            statuses[serial] = "error"
+        else:
+            statuses[serial] = "ok"
+    return statuses
+
+async def _format_import_results(hass, statuses: dict[str, str]) -> str:
+    """Render translated markdown table rows, one per serial."""
+    labels = {
+        status: await _translated_text(
+            hass, "config", f"config.error.import_status_{status}", default
+        )
+        for status, default in _IMPORT_STATUS_DEFAULTS.items()
+    }
+    return "\n".join(
+        f"| {serial} | {labels[status]} |" for serial, status in statuses.items()
+    ) or "| - | - |"
+
 
 def _format_invalid_serial_details(
     inverters: list[str],
@@ -111,158 +260,171 @@ def _build_initial_setup_match(entry_data: dict[str, Any]) -> dict[str, Any]:
     }
 
 
-async def _test_api_connection(hass, token: str, serial: str = "TEST123") -> bool:
-    """Test if the API token is valid."""
-    try:
-        headers = {"Content-Type": "application/json", "tokenId": token}
-        payload = {"wifiSn": serial}
-        session = async_get_clientsession(hass)
-
-        async with async_timeout.timeout(10):
-            async with session.post(API_URL, json=payload, headers=headers) as resp:
-                if resp.status != 200:
-                    return False
-
-                data = await resp.json()
-                code = data.get("code")
-                exception = str(data.get("exception", "")).lower()
-
-                # Known invalid-auth/invalid-request responses from Solax API.
-                # 1001 = Interface Unauthorized, 1002 = Parameter validation failed.
-                if code in (1001, 1002):
-                    return False
-                if "token" in exception and "invalid" in exception:
-                    return False
-
-                # Any other well-formed API response means token reached Solax correctly.
-                # (e.g. 1003 Data Unauthorized can happen with wrong/placeholder serial)
-                return True
-    except Exception:
+async def _test_api_connection(hass, token: str, serial: str) -> bool:
+    """Test if the API token is valid using a configured serial."""
+    client = SolaxCloudClient(token, timeout=PREFLIGHT_REQUEST_TIMEOUT)
+    reply = await client.async_fetch(serial, session=async_get_clientsession(hass))
+    if reply.outcome in _UNREACHED_OUTCOMES:
         return False
+    # Any other well-formed API response means token reached Solax correctly
+    # (e.g. 1003 Data Unauthorized can happen with a wrong serial).
+    return not is_token_rejected(reply.payload)
+
+
+async def _fetch_preflight_response(client: SolaxCloudClient, serial: str) -> dict[str, Any]:
+    """Return the decoded API response, or a normalized error payload."""
+    return (await client.async_fetch(serial)).payload
 
 
-def _is_rate_limited_payload(data: dict) -> bool:
-    code = data.get("code")
-    if code in (3, 104):
-        return True
+def _preflight_budget(hass, token: str) -> int:
+    """Calls left this minute for the token, counting running entries that share it."""
+    budget = int(API_CALLS_PER_MINUTE_LIMIT * API_QUOTA_SAFETY_FACTOR)
+    scheduler = hass.data.get(RUNTIME_SCHEDULER)
+    if scheduler is not None:
+        budget -= scheduler.calls_last_minute(token)
+    # A serial always doubles as token validation, so at least one is checked.
+    return max(budget, 1)
 
-    exception = str(data.get("exception", "")).lower()
+
+def _token_scan_interval(
+    hass, token: str, entry_id: str | None, inverters: list[str], batch_size: int
+) -> int:
+    """Recommended scan interval for `inverters` and the other entries on the token.
+
+    Running entries that share a token share its quota through the scheduler,
+    so their serials are counted too. Batches only count once the running
+    entry got a batch reply, since the account may not support them.
+    """
+    count = len(inverters)
+    scheduler = hass.data.get(RUNTIME_SCHEDULER)
+    if scheduler is not None:
+        count += scheduler.inverter_count(token, exclude_entry_id=entry_id)
+    coordinator = hass.data.get(DOMAIN, {}).get(entry_id, {}).get("coordinator")
+    if not getattr(getattr(coordinator, "client", None), "batch_supported", False):
+        batch_size = 1
+    return plan_scan_interval(count, batch_size=batch_size)
+
+
+def _serials_of_other_entries(hass, entry_id: str | None = None) -> list[str]:
+    """Serials configured in other entries; a serial belongs to one entry only."""
+    serials = []
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        if entry.entry_id != entry_id:
+            serials.extend(_dedupe_serials(entry.data.get(CONF_INVERTERS, [])))
+    return serials
+
+
+def _entity_prefix_in_use(hass, prefix: str) -> bool:
     return any(
-        marker in exception
-        for marker in (
-            "rate limit",
-            "maximum call threshold",
-            "suspend the request",
-            "current minute > threshold",
-            "within the current minute",
-            "too many requests",
-        )
+        _slugify_name(entry.data.get(CONF_ENTITY_PREFIX, entry.data.get(CONF_SYSTEM_NAME)))
+        == prefix
+        for entry in hass.config_entries.async_entries(DOMAIN)
     )
 
 
 async def _classify_preflight_inverters(
     hass, token: str, inverters: list[str], scan_interval: int
 ) -> dict[str, Any] | None:
-    """Single-pass setup preflight for all serials.
-
-    Returns normalized data/error payloads so the initial coordinator refresh can
-    reuse this state and avoid a second immediate API round-trip.
+    """Setup preflight for all serials within this minute's call budget.
+
+    Serials are checked one at a time until a reply reaches SolaX; that reply
+    validates the token. When none within the budget does (timeouts, connection
+    errors, 5xx or bad JSON), `token_unverified` is returned instead of data.
+    The remaining serials that fit the budget are checked concurrently; any
+    beyond it are left for the coordinator's first refresh. Returns normalized
+    data/error payloads so the initial refresh can reuse this state.
     """
     results: dict[str, dict[str, Any]] = {}
     rate_limited: list[str] = []
     rate_limited_details: dict[str, dict[str, Any]] = {}
     unauthorized: list[str] = []
     unauthorized_details: dict[str, dict[str, Any]] = {}
-    headers = {"Content-Type": "application/json", "tokenId": token}
     now_monotonic = asyncio.get_running_loop().time()
     cooldown_seconds = scan_interval * 0.55
-    session = async_get_clientsession(hass)
+    client = SolaxCloudClient(
+        token, session=async_get_clientsession(hass), timeout=PREFLIGHT_REQUEST_TIMEOUT
+    )
 
-    try:
-        async with async_timeout.timeout(20):
-            for idx, serial in enumerate(inverters):
-                if idx > 0:
-                    await asyncio.sleep(0.2)
-                payload = {"wifiSn": serial}
-                try:
-                    async with session.post(API_URL, json=payload, headers=headers) as resp:
-                        text = await resp.text()
-                        if resp.status != 200:
-                            results[serial] = {"error": f"HTTP {resp.status}", "raw": text}
-                            continue
-                        try:
-                            data = await resp.json()
-                        except Exception as json_err:
-                            results[serial] = {
-                                "error": f"JSON Error: {json_err}",
-                                "raw": text,
-                            }
-                            continue
-                except TimeoutError:
-                    results[serial] = {"error": "Timeout"}
-                    continue
-                except Exception as request_err:
-                    results[serial] = {"error": str(request_err)}
-                    continue
-
-                code = data.get("code")
-                success = data.get("success", False)
-                exception = str(data.get("exception", "")).lower()
-
-                if code in (1001, 1002):
-                    return {"token_invalid": True}
-                if "token" in exception and "invalid" in exception:
-                    return {"token_invalid": True}
-
-                if _is_rate_limited_payload(data):
-                    rate_limited.append(serial)
-                    rate_limited_details[serial] = {
-                        "reason": "api_rate_limit",
-                        "code": code,
-                        "exception": data.get("exception"),
-                        "retry_in_seconds": round(cooldown_seconds, 1),
-                    }
-                    results[serial] = {
-                        "error": "rate_limit",
-                        "code": code,
-                        "exception": data.get("exception"),
-                        "skip_until": now_monotonic + cooldown_seconds,
-                    }
-                    continue
+    def _classify(serial, data):
+        if "error" in data and "code" not in data:
+            results[serial] = data
+            return
+        code = data.get("code")
+        outcome = classify_response(data)
+
+        if outcome is SolaxOutcome.RATE_LIMITED:
+            rate_limited.append(serial)
+            rate_limited_details[serial] = {
+                "reason": "api_rate_limit",
+                "code": code,
+                "exception": data.get("exception"),
+                "retry_in_seconds": round(cooldown_seconds, 1),
+            }
+            results[serial] = {
+                "error": "rate_limit",
+                "code": code,
+                "exception": data.get("exception"),
+                "skip_until": now_monotonic + cooldown_seconds,
+            }
+            return
 
-                if code == 1003:
-                    unauthorized.append(serial)
-                    unauthorized_details[serial] = {
-                        "code": code,
-                        "exception": data.get("exception"),
-                    }
-                    results[serial] = {
-                        "error": "data_unauthorized",
-                        "code": code,
-                        "exception": data.get("exception"),
-                        "raw": data,
-                    }
-                    continue
-
-                if not success or (code is not None and code != 0):
-                    results[serial] = {
-                        "error": True,
-                        "code": code,
-                        "exception": data.get("exception"),
-                        "raw": data,
-                    }
-                    continue
+        if outcome is SolaxOutcome.DATA_UNAUTHORIZED:
+            unauthorized.append(serial)
+            unauthorized_details[serial] = {
+                "code": code,
+                "exception": data.get("exception"),
+            }
+            results[serial] = {
+                "error": "data_unauthorized",
+                "code": code,
+                "exception": data.get("exception"),
+                "raw": data,
+            }
+            return
 
-                result_data = data.get("result", {})
-                if result_data:
-                    results[serial] = {
-                        key: value for key, value in result_data.items() if value is not None
-                    }
-                else:
-                    results[serial] = {}
+        if outcome is not SolaxOutcome.OK:
+            results[serial] = {
+                "error": True,
+                "code": code,
+                "exception": data.get("exception"),
+                "raw": data,
+            }
+            return
+
+        result_data = data.get("result", {})
+        if result_data:
+            results[serial] = {
+                key: value for key, value in result_data.items() if value is not None
+            }
+        else:
+            results[serial] = {}
+
+    budget = _preflight_budget(hass, token)
+    checked = inverters[:budget]
+    token_checked = False
+    try:
+        pending = list(checked)
+        while pending and not token_checked:
+            serial = pending.pop(0)
+            data = await _fetch_preflight_response(client, serial)
+            if is_token_rejected(data):
+                return {"token_invalid": True}
+            _classify(serial, data)
+            token_checked = classify_response(data) not in _UNREACHED_OUTCOMES
+        if not token_checked:
+            return {"token_unverified": True}
+
+        responses = await asyncio.gather(
+            *(_fetch_preflight_response(client, serial) for serial in pending)
+        )
+        for serial, data in zip(pending, responses, strict=True):
+            if is_token_rejected(data):
+                return {"token_invalid": True}
+            _classify(serial, data)
     except Exception:
-        # Setup should never fail only because preflight classification failed.
-        return None
+        # Setup should never fail only because preflight classification failed,
+        # but the entry is only created once a reply reached SolaX with the token.
+        return None if token_checked else {"token_unverified": True}
 
     return {
         "token_invalid": False,
@@ -271,6 +433,9 @@ async def _classify_preflight_inverters(
         "rate_limited_details": rate_limited_details,
         "unauthorized_inverters": unauthorized,
         "unauthorized_details": unauthorized_details,
+        # Serials over this minute's budget are fetched by the first refresh.
+        "deferred_inverters": inverters[budget:],
+        "api_calls": len(checked),
     }
 
 
@@ -286,6 +451,9 @@ class SolaxFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         self._pending_entry_data = None
         self._rate_limit_notice_inverters = []
         self._initial_setup_state = None
+        self._preflight_task = None
+        # Error shown on the user form when the preflight could not accept the token.
+        self._preflight_error = None
 
     def _stash_initial_setup_state(self, entry_data: dict[str, Any]) -> None:
         if self.hass is None or not isinstance(self._initial_setup_state, dict):
@@ -296,25 +464,25 @@ class SolaxFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         }
 
     async def async_step_user(self, user_input: Any = None):
-        if self._async_current_entries():
-            return self.async_abort(reason="already_configured")
-
         errors = {}
+        if self._preflight_error:
+            # Preflight rejected the token, or no reply reached SolaX to validate it.
+            errors["base"] = self._preflight_error
+            self._preflight_error = None
 
         if user_input is not None:
-            # Validate token first
+            errors = {}
+            # The token is validated by the preflight of the first real serial.
             token = user_input[CONF_TOKEN].strip()
             if not token:
                 errors["base"] = "invalid_token"
 
-            # Only test API if token is provided
-            if token and not errors:
-                if not await _test_api_connection(self.hass, token):
-                    errors["base"] = "invalid_token"
-
             self._system_name = user_input.get(CONF_SYSTEM_NAME, "Solax System").strip()
             if not self._system_name:
                 errors["base"] = "no_system_name"
+            elif _entity_prefix_in_use(self.hass, _slugify_name(self._system_name)):
+                # Entity unique IDs are built from the prefix, so it must differ per entry.
+                errors["base"] = "system_name_in_use"
 
             # Only proceed to next step if no errors
             if not errors:
@@ -325,9 +493,9 @@ class SolaxFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         # Initial form - include system name
         data_schema = vol.Schema({
             vol.Required(CONF_TOKEN): str,
-            vol.Required(CONF_SYSTEM_NAME, default="Solax System"): str,
-            vol.Optional(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL):
-                vol.All(vol.Coerce(int), vol.Range(min=120, max=3600)),
+            vol.Required(CONF_SYSTEM_NAME, default=self._system_name or "Solax System"): str,
+            vol.Optional(CONF_SCAN_INTERVAL, default=self._scan_interval):
+                vol.All(vol.Coerce(int), vol.Range(min=MIN_SCAN_INTERVAL, max=MAX_SCAN_INTERVAL)),
         })
 
         return self.async_show_form(
@@ -341,11 +509,11 @@ class SolaxFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             if user_input.get("serial"):
-                # Adding a new inverter
-                serial = _normalize_serial(user_input["serial"])
-                if serial and not _serial_exists(serial, self._inverters):
-                    self._inverters.append(serial)
-                elif serial:
+                # Adding one serial or a pasted list of serials
+                added, duplicates = _add_serials(
+                    self._inverters, user_input["serial"], _serials_of_other_entries(self.hass)
+                )
+                if duplicates and not added:
                     errors["base"] = "duplicate_inverter"
 
             if user_input.get("finish"):
@@ -361,39 +529,13 @@ class SolaxFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                         CONF_SYSTEM_NAME: self._system_name,
                         CONF_ENTITY_PREFIX: _slugify_name(self._system_name),
                     }
-                    self._initial_setup_state = await _classify_preflight_inverters(
-                        self.hass, self._token, self._inverters, self._scan_interval
-                    )
-                    if (
-                        isinstance(self._initial_setup_state, dict)
-                        and self._initial_setup_state.get("token_invalid")
-                    ):
-                        self._initial_setup_state = None
-                        self._rate_limit_notice_inverters = []
-                        errors["base"] = "invalid_token"
-                    elif isinstance(self._initial_setup_state, dict):
-                        self._rate_limit_notice_inverters = list(
-                            self._initial_setup_state.get("rate_limited_inverters", [])
-                        )
-                    else:
-                        self._rate_limit_notice_inverters = []
-                    if errors:
-                        pass
-                    if self._rate_limit_notice_inverters:
-                        return await self.async_step_rate_limit_notice()
-
-                    if not errors:
-                        self._stash_initial_setup_state(self._pending_entry_data)
-                        return self.async_create_entry(
-                            title=self._system_name,
-                            data=self._pending_entry_data,
-                        )
+                    return await self.async_step_preflight()
 
         # Show current inverters and option to add more
         inverters_list = "\n".join([f"• {sn}" for sn in self._inverters]) if self._inverters else "-"
 
         data_schema = vol.Schema({
-            vol.Optional("serial"): str,
+            vol.Optional("serial"): _SERIAL_LIST_SELECTOR,
             vol.Required("finish", default=bool(self._inverters)): cv.boolean,
         })
 
@@ -408,6 +550,87 @@ class SolaxFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
             }
         )
 
+    async def async_step_preflight(self, user_input: Any = None):
+        """Check the configured serials while showing a progress step."""
+        if self._preflight_task is None:
+            self._preflight_task = self.hass.async_create_task(
+                _classify_preflight_inverters(
+                    self.hass, self._token, self._inverters, self._scan_interval
+                )
+            )
+        if not self._preflight_task.done():
+            return self.async_show_progress(
+                step_id="preflight",
+                progress_action="preflight",
+                description_placeholders={"count": str(len(self._inverters))},
+                progress_task=self._preflight_task,
+            )
+
+        self._initial_setup_state = self._preflight_task.result()
+        self._preflight_task = None
+        self._rate_limit_notice_inverters = []
+        if isinstance(self._initial_setup_state, dict):
+            if self._initial_setup_state.get("token_invalid"):
+                self._preflight_error = "invalid_token"
+            elif self._initial_setup_state.get("token_unverified"):
+                self._preflight_error = "cannot_connect"
+            if self._preflight_error:
+                self._initial_setup_state = None
+                return self.async_show_progress_done(next_step_id="user")
+            self._rate_limit_notice_inverters = list(
+                self._initial_setup_state.get("rate_limited_inverters", [])
+            )
+        if len(self._inverters) > 1:
+            return self.async_show_progress_done(next_step_id="import_results")
+        if self._rate_limit_notice_inverters:
+            return self.async_show_progress_done(next_step_id="rate_limit_notice")
+        return self.async_show_progress_done(next_step_id="finish_setup")
+
+    async def async_step_import_results(self, user_input: Any = None):
+        """Show the per-serial preflight result and optionally drop unauthorized serials."""
+        state = self._initial_setup_state if isinstance(self._initial_setup_state, dict) else {}
+        statuses = _serial_import_statuses(
+            self._inverters,
+            state.get("data"),
+            rate_limited=state.get("rate_limited_inverters", []),
+            unauthorized=state.get("unauthorized_inverters", []),
+            deferred=state.get("deferred_inverters", []),
+        )
+        invalid = [sn for sn, status in statuses.items() if status == "unauthorized"]
+        errors = {}
+        if user_input is not None:
+            if invalid and user_input.get("remove_invalid"):
+                if len(invalid) == len(self._inverters):
+                    errors["base"] = "no_inverters"
+                else:
+                    # Entry data holds the same list object, so it is updated too.
+                    self._inverters[:] = [sn for sn in self._inverters if sn not in invalid]
+            if not errors:
+                if self._rate_limit_notice_inverters:
+                    return await self.async_step_rate_limit_notice()
+                return await self.async_step_finish_setup()
+
+        schema_fields = {}
+        if invalid:
+            schema_fields[vol.Required("remove_invalid", default=True)] = cv.boolean
+        return self.async_show_form(
+            step_id="import_results",
+            data_schema=vol.Schema(schema_fields),
+            errors=errors,
+            description_placeholders={
+                "count": len(statuses),
+                "ok_count": sum(1 for status in statuses.values() if status == "ok"),
+                "results": await _format_import_results(self.hass, statuses),
+            },
+        )
+
+    async def async_step_finish_setup(self, user_input: Any = None):
+        self._stash_initial_setup_state(self._pending_entry_data)
+        return self.async_create_entry(
+            title=self._system_name,
+            data=self._pending_entry_data,
+        )
+
     async def async_step_rate_limit_notice(self, user_input: Any = None):
         inverters_list = ", ".join(self._rate_limit_notice_inverters) or "-"
         errors = {}
@@ -441,9 +664,6 @@ class SolaxFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
 
     async def async_step_import(self, import_config: dict) -> FlowResult:
         """Handle configuration import from YAML."""
-        if self._async_current_entries():
-            return self.async_abort(reason="already_configured")
-
         # Add this method for YAML import support
         _LOGGER.debug("Importing Solax configuration from YAML")
 
@@ -452,6 +672,14 @@ class SolaxFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         if not token:
             return self.async_abort(reason="invalid_token")
 
+        # Several entries are allowed; the same YAML system is only imported once.
+        self._async_abort_entries_match(
+            {
+                CONF_TOKEN: token,
+                CONF_SYSTEM_NAME: import_config.get(CONF_SYSTEM_NAME, "Solax System"),
+            }
+        )
+
         inverters = _dedupe_serials(import_config.get(CONF_INVERTERS, []))
         if not inverters:
             return self.async_abort(reason="no_inverters")
@@ -489,34 +717,100 @@ class SolaxOptionsFlowHandler(config_entries.OptionsFlow):
         self._token = config_entry.data.get(CONF_TOKEN)
         self._scan_interval = config_entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
         self._system_name = config_entry.data.get(CONF_SYSTEM_NAME, "Solax System")
+        self._lean_attributes = bool(config_entry.options.get(CONF_LEAN_ATTRIBUTES, False))
+        self._entity_profile = config_entry.options.get(
+            CONF_ENTITY_PROFILE, DEFAULT_ENTITY_PROFILE
+        )
+        self._night_mode = bool(config_entry.options.get(CONF_NIGHT_MODE, False))
+        self._auto_scan_interval = bool(
+            config_entry.options.get(CONF_AUTO_SCAN_INTERVAL, False)
+        )
+        self._night_battery_interval = config_entry.options.get(
+            CONF_NIGHT_BATTERY_INTERVAL, DEFAULT_NIGHT_BATTERY_INTERVAL
+        )
+        self._response_cache_ttl = config_entry.options.get(
+            CONF_RESPONSE_CACHE_TTL, DEFAULT_RESPONSE_CACHE_TTL
+        )
+        self._response_recording = bool(
+            config_entry.options.get(CONF_RESPONSE_RECORDING, False)
+        )
+        self._batch_size = config_entry.options.get(CONF_BATCH_SIZE, DEFAULT_BATCH_SIZE)
+        self._api_endpoints = list(
+            config_entry.options.get(CONF_API_ENDPOINTS, DEFAULT_API_ENDPOINTS)
+        )
         self._rate_limit_notice_inverters = []
         self._invalid_serial_notice_inverters = []
         self._invalid_serial_notice_details = {}
         self._show_rate_limit_after_invalid = False
         self._added_inverters = []
+        self._import_statuses = {}
         self._token_changed = False
 
     async def async_step_init(self, user_input: Any = None):
         """Manage the options."""
         return await self.async_step_manage_inverters()
 
+    def _api_calls_today(self):
+        runtime = self.hass.data.get(DOMAIN, {}).get(self._config_entry.entry_id, {})
+        counter = getattr(runtime.get("coordinator"), "api_call_counter", None)
+        return counter.count("day") if counter is not None else 0
+
+    def _async_finish(self):
+        # Options are written together with entry data; keep them when closing the flow.
+        return self.async_create_entry(title="", data=dict(self._config_entry.options))
+
     async def async_step_manage_inverters(self, user_input: Any = None):
         errors = {}
         token = self._token
         system_name = self._system_name
         scan_interval = self._scan_interval
+        lean_attributes = self._lean_attributes
+        entity_profile = self._entity_profile
+        night_mode = self._night_mode
+        night_battery_interval = self._night_battery_interval
+        response_cache_ttl = self._response_cache_ttl
+        response_recording = self._response_recording
+        batch_size = self._batch_size
+        api_endpoints = self._api_endpoints
+        auto_scan_interval = self._auto_scan_interval
 
         if user_input is not None:
             token = user_input.get(CONF_TOKEN, self._token).strip()
             system_name = user_input.get(CONF_SYSTEM_NAME, self._system_name).strip()
             scan_interval = user_input.get(CONF_SCAN_INTERVAL, self._scan_interval)
+            lean_attributes = bool(
+                user_input.get(CONF_LEAN_ATTRIBUTES, self._lean_attributes)
+            )
+            entity_profile = user_input.get(CONF_ENTITY_PROFILE, self._entity_profile)
+            auto_scan_interval = bool(
+                user_input.get(CONF_AUTO_SCAN_INTERVAL, self._auto_scan_interval)
+            )
+            night_mode = bool(user_input.get(CONF_NIGHT_MODE, self._night_mode))
+            night_battery_interval = user_input.get(
+                CONF_NIGHT_BATTERY_INTERVAL, self._night_battery_interval
+            )
+            response_cache_ttl = user_input.get(
+                CONF_RESPONSE_CACHE_TTL, self._response_cache_ttl
+            )
+            response_recording = bool(
+                user_input.get(CONF_RESPONSE_RECORDING, self._response_recording)
+            )
+            batch_size = user_input.get(CONF_BATCH_SIZE, self._batch_size)
+            if CONF_API_ENDPOINTS in user_input:
+                parsed_endpoints = _parse_endpoint_list(user_input[CONF_API_ENDPOINTS])
+                if parsed_endpoints is None:
+                    errors[CONF_API_ENDPOINTS] = "invalid_endpoint"
+                else:
+                    api_endpoints = parsed_endpoints
 
             if user_input.get("serial"):
-                # Adding a new inverter
-                serial = _normalize_serial(user_input["serial"])
-                if serial and not _serial_exists(serial, self._inverters):
-                    self._inverters.append(serial)
-                elif serial:
+                # Adding one serial or a pasted list of serials
+                added, duplicates = _add_serials(
+                    self._inverters,
+                    user_input["serial"],
+                    _serials_of_other_entries(self.hass, self._config_entry.entry_id),
+                )
+                if duplicates and not added:
                     errors["base"] = "duplicate_inverter"
 
             if user_input.get("remove_serial"):
@@ -537,17 +831,34 @@ class SolaxOptionsFlowHandler(config_entries.OptionsFlow):
 
                 # Validate token when saving options, especially if changed
                 if not errors and token != self._token:
-                    test_serial = self._inverters[0] if self._inverters else "TEST123"
-                    if not await _test_api_connection(self.hass, token, test_serial):
+                    if not await _test_api_connection(self.hass, token, self._inverters[0]):
                         errors["base"] = "invalid_token"
 
                 if not errors:
+                    if auto_scan_interval:
+                        scan_interval = _token_scan_interval(
+                            self.hass,
+                            token,
+                            self._config_entry.entry_id,
+                            self._inverters,
+                            batch_size,
+                        )
+
                     # Update the config entry
                     hass = self.hass
                     entry_id = self._config_entry.entry_id
                     self._token = token
                     self._system_name = system_name
                     self._scan_interval = scan_interval
+                    self._lean_attributes = lean_attributes
+                    self._entity_profile = entity_profile
+                    self._night_mode = night_mode
+                    self._night_battery_interval = night_battery_interval
+                    self._response_cache_ttl = response_cache_ttl
+                    self._response_recording = response_recording
+                    self._batch_size = batch_size
+                    self._api_endpoints = api_endpoints
+                    self._auto_scan_interval = auto_scan_interval
 
                     old_inverters = _dedupe_serials(
                         self._config_entry.data.get(CONF_INVERTERS, [])
@@ -562,22 +873,6 @@ class SolaxOptionsFlowHandler(config_entries.OptionsFlow):
                     self._added_inverters = list(added_inverters)
                     self._token_changed = token_changed
 
-                    previous_data = {}
-                    current_runtime = hass.data.get(DOMAIN, {}).get(entry_id, {})
-                    current_coordinator = current_runtime.get("coordinator")
-                    if current_coordinator and isinstance(
-                        getattr(current_coordinator, "data", None), dict
-                    ):
-                        for serial, payload in current_coordinator.data.items():
-                            if isinstance(payload, dict):
-                                previous_data[serial] = dict(payload)
-
-                    hass.data.setdefault(RUNTIME_RELOAD_STATE, {})[entry_id] = {
-                        "data": previous_data,
-                        "added_inverters": added_inverters,
-                        "token_changed": token_changed,
-                    }
-
                     # Create updated data
                     updated_data = dict(self._config_entry.data)
                     updated_data[CONF_TOKEN] = token
@@ -592,13 +887,71 @@ class SolaxOptionsFlowHandler(config_entries.OptionsFlow):
                         )
                     )
 
+                    updated_options = dict(self._config_entry.options)
+                    updated_options[CONF_LEAN_ATTRIBUTES] = lean_attributes
+                    updated_options[CONF_ENTITY_PROFILE] = entity_profile
+                    updated_options[CONF_NIGHT_MODE] = night_mode
+                    updated_options[CONF_NIGHT_BATTERY_INTERVAL] = night_battery_interval
+                    updated_options[CONF_RESPONSE_CACHE_TTL] = response_cache_ttl
+                    updated_options[CONF_RESPONSE_RECORDING] = response_recording
+                    updated_options[CONF_BATCH_SIZE] = batch_size
+                    updated_options[CONF_API_ENDPOINTS] = api_endpoints
+                    updated_options[CONF_AUTO_SCAN_INTERVAL] = auto_scan_interval
+                    current_runtime = hass.data.get(DOMAIN, {}).get(entry_id, {})
+                    inverters_changed = {sn.casefold() for sn in self._inverters} != {
+                        sn.casefold() for sn in old_inverters
+                    }
+                    needs_reload = any(
+                        updated_data.get(key) != self._config_entry.data.get(key)
+                        for key in set(updated_data) | set(self._config_entry.data)
+                        if key not in (*_HOT_APPLY_DATA_KEYS, CONF_INVERTERS)
+                    ) or (inverters_changed and "apply_inverters" not in current_runtime)
+
                     hass.config_entries.async_update_entry(
                         self._config_entry,
-                        data=updated_data
+                        data=updated_data,
+                        options=updated_options,
                     )
 
-                    # Reload the entry to apply changes
-                    await hass.config_entries.async_reload(entry_id)
+                    # Entity profile changes are applied incrementally on the running platform.
+                    apply_entity_profile = current_runtime.get("apply_entity_profile")
+                    if apply_entity_profile is not None:
+                        await apply_entity_profile(entity_profile)
+
+                    deferred_inverters = None
+                    if not needs_reload:
+                        apply_options = current_runtime.get("apply_options")
+                        if apply_options is not None:
+                            apply_options()
+                        if not inverters_changed:
+                            return self._async_finish()
+                        # Like setup, new serials get a preflight within this minute's call
+                        # budget; the rest are fetched in the background, not before submit.
+                        preflight = None
+                        if added_inverters:
+                            preflight = await _classify_preflight_inverters(
+                                hass, token, added_inverters, scan_interval
+                            )
+                        # Only the added/removed serials are touched; other entities stay live.
+                        deferred_inverters = await current_runtime["apply_inverters"](preflight)
+                    else:
+                        previous_data = {}
+                        current_coordinator = current_runtime.get("coordinator")
+                        if current_coordinator and isinstance(
+                            getattr(current_coordinator, "data", None), dict
+                        ):
+                            for serial, payload in current_coordinator.data.items():
+                                if isinstance(payload, dict):
+                                    previous_data[serial] = dict(payload)
+
+                        hass.data.setdefault(RUNTIME_RELOAD_STATE, {})[entry_id] = {
+                            "data": previous_data,
+                            "added_inverters": added_inverters,
+                            "token_changed": token_changed,
+                        }
+
+                        # Reload the entry to apply changes
+                        await hass.config_entries.async_reload(entry_id)
 
                     current_entry = hass.config_entries.async_get_entry(entry_id)
                     notifications_enabled = True
@@ -653,16 +1006,30 @@ class SolaxOptionsFlowHandler(config_entries.OptionsFlow):
                     self._show_rate_limit_after_invalid = bool(
                         notifications_enabled and self._rate_limit_notice_inverters
                     )
-                    if self._invalid_serial_notice_inverters:
-                        return await self.async_step_invalid_serial_notice()
-                    if notifications_enabled and self._rate_limit_notice_inverters:
-                        return await self.async_step_rate_limit_notice()
-
-                    return self.async_create_entry(title="", data={})
+                    if len(self._added_inverters) > 1:
+                        # Bulk imports get a per-serial result of the first fetch.
+                        self._import_statuses = _serial_import_statuses(
+                            self._added_inverters,
+                            getattr(coordinator, "data", None),
+                            rate_limited=observed_rate_limited,
+                            unauthorized=observed_unauthorized,
+                            deferred=deferred_inverters,
+                        )
+                        return await self.async_step_import_results()
+                    return await self._async_step_notices()
 
         self._token = token
         self._system_name = system_name
         self._scan_interval = scan_interval
+        self._lean_attributes = lean_attributes
+        self._entity_profile = entity_profile
+        self._night_mode = night_mode
+        self._night_battery_interval = night_battery_interval
+        self._response_cache_ttl = response_cache_ttl
+        self._response_recording = response_recording
+        self._batch_size = batch_size
+        self._api_endpoints = api_endpoints
+        self._auto_scan_interval = auto_scan_interval
 
         # Create options for remove dropdown
         inverters_list = "\n".join([f"• {sn}" for sn in self._inverters]) if self._inverters else "-"
@@ -671,8 +1038,30 @@ class SolaxOptionsFlowHandler(config_entries.OptionsFlow):
             vol.Required(CONF_TOKEN, default=self._token): str,
             vol.Required(CONF_SYSTEM_NAME, default=self._system_name): str,
             vol.Required(CONF_SCAN_INTERVAL, default=self._scan_interval):
-                vol.All(vol.Coerce(int), vol.Range(min=120, max=3600)),
-            vol.Optional("serial"): str,
+                vol.All(vol.Coerce(int), vol.Range(min=MIN_SCAN_INTERVAL, max=MAX_SCAN_INTERVAL)),
+            vol.Required(CONF_AUTO_SCAN_INTERVAL, default=self._auto_scan_interval): cv.boolean,
+            vol.Required(CONF_LEAN_ATTRIBUTES, default=self._lean_attributes): cv.boolean,
+            vol.Required(
+                CONF_ENTITY_PROFILE, default=self._entity_profile
+            ): selector.SelectSelector(
+                selector.SelectSelectorConfig(
+                    options=ENTITY_PROFILES,
+                    translation_key=CONF_ENTITY_PROFILE,
+                    mode=selector.SelectSelectorMode.DROPDOWN,
+                )
+            ),
+            vol.Required(CONF_NIGHT_MODE, default=self._night_mode): cv.boolean,
+            vol.Required(CONF_NIGHT_BATTERY_INTERVAL, default=self._night_battery_interval):
+                vol.All(vol.Coerce(int), vol.Range(min=MIN_SCAN_INTERVAL, max=MAX_SCAN_INTERVAL)),
+            vol.Required(CONF_RESPONSE_CACHE_TTL, default=self._response_cache_ttl):
+                vol.All(vol.Coerce(int), vol.Range(min=0, max=MAX_RESPONSE_CACHE_TTL)),
+            vol.Required(CONF_RESPONSE_RECORDING, default=self._response_recording): cv.boolean,
+            vol.Required(CONF_BATCH_SIZE, default=self._batch_size):
+                vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_BATCH_SIZE)),
+            vol.Required(
+                CONF_API_ENDPOINTS, default="\n".join(self._api_endpoints)
+            ): _ENDPOINT_LIST_SELECTOR,
+            vol.Optional("serial"): _SERIAL_LIST_SELECTOR,
         }
         if self._inverters:
             schema_fields[vol.Optional("remove_serial")] = vol.In({sn: sn for sn in self._inverters})
@@ -686,10 +1075,43 @@ class SolaxOptionsFlowHandler(config_entries.OptionsFlow):
             errors=errors,
             description_placeholders={
                 "count": len(self._inverters),
-                "inverters_list": inverters_list
+                "inverters_list": inverters_list,
+                "recommended_scan_interval": _token_scan_interval(
+                    self.hass,
+                    self._token,
+                    self._config_entry.entry_id,
+                    self._inverters,
+                    self._batch_size,
+                ),
+                "api_calls_today": self._api_calls_today(),
             }
         )
 
+    async def _async_step_notices(self):
+        if self._invalid_serial_notice_inverters:
+            return await self.async_step_invalid_serial_notice()
+        if self._show_rate_limit_after_invalid:
+            self._show_rate_limit_after_invalid = False
+            return await self.async_step_rate_limit_notice()
+        return self._async_finish()
+
+    async def async_step_import_results(self, user_input: Any = None):
+        if user_input is not None:
+            self._import_statuses = {}
+            return await self._async_step_notices()
+
+        return self.async_show_form(
+            step_id="import_results",
+            data_schema=vol.Schema({}),
+            description_placeholders={
+                "count": len(self._import_statuses),
+                "ok_count": sum(
+                    1 for status in self._import_statuses.values() if status == "ok"
+                ),
+                "results": await _format_import_results(self.hass, self._import_statuses),
+            },
+        )
+
     async def async_step_invalid_serial_notice(self, user_input: Any = None):
         unknown_text = await _translated_text(
             self.hass,
@@ -717,7 +1139,7 @@ class SolaxOptionsFlowHandler(config_entries.OptionsFlow):
                 if self._show_rate_limit_after_invalid:
                     self._show_rate_limit_after_invalid = False
                     return await self.async_step_rate_limit_notice()
-                return self.async_create_entry(title="", data={})
+                return self._async_finish()
             errors["base"] = "acknowledge_invalid_serial"
 
         return self.async_show_form(
@@ -738,7 +1160,7 @@ class SolaxOptionsFlowHandler(config_entries.OptionsFlow):
         if user_input is not None:
             if user_input.get(_ACKNOWLEDGE_FIELD):
                 self._rate_limit_notice_inverters = []
-                return self.async_create_entry(title="", data={})
+                return self._async_finish()
             errors["base"] = "acknowledge_rate_limit"
 
         return self.async_show_form(
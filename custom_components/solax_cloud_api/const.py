@@ -1,5 +1,19 @@
 import logging
 
+# SolaX Cloud request settings live in client.py, which must stay importable
+# without Home Assistant; re-exported here for the rest of the integration.
+from .client import (  # noqa: F401
+    API_BASE_URL,
+    API_BATCH_PATH,
+    API_REALTIME_PATH,
+    API_REQUEST_TIMEOUT,
+    CLIENT_CONNECTION_LIMIT,
+    DEFAULT_API_ENDPOINTS,
+    DEFAULT_BATCH_SIZE,
+    ENDPOINT_PROBE_TIMEOUT,
+    ENDPOINT_RETRY_AFTER,
+)
+
 DOMAIN = "solax_cloud_api"
 PLATFORMS = ["sensor", "switch"]
 CONF_TOKEN = "api_token"
@@ -8,13 +22,74 @@ CONF_SCAN_INTERVAL = "scan_interval"
 CONF_SYSTEM_NAME = "system_name"
 CONF_ENTITY_PREFIX = "entity_prefix"
 CONF_RATE_LIMIT_NOTIFICATIONS = "rate_limit_notifications"
+CONF_LEAN_ATTRIBUTES = "lean_attributes"
+CONF_ENTITY_PROFILE = "entity_profile"
+ENTITY_PROFILE_MINIMAL = "minimal"
+ENTITY_PROFILE_STANDARD = "standard"
+ENTITY_PROFILE_FULL = "full"
+ENTITY_PROFILES = [ENTITY_PROFILE_MINIMAL, ENTITY_PROFILE_STANDARD, ENTITY_PROFILE_FULL]
+DEFAULT_ENTITY_PROFILE = ENTITY_PROFILE_STANDARD
+CONF_NIGHT_MODE = "night_mode"
+CONF_NIGHT_BATTERY_INTERVAL = "night_battery_interval"
+DEFAULT_NIGHT_BATTERY_INTERVAL = 600
+# Night mode: PV-only inverters are polled at most once per NIGHT_PV_INTERVAL seconds
+# while the sun is below NIGHT_SUN_ELEVATION and NIGHT_ZERO_DC_SAMPLES consecutive
+# samples reported no DC power.
+NIGHT_PV_INTERVAL = 3600
+NIGHT_SUN_ELEVATION = 0.0
+NIGHT_ZERO_DC_SAMPLES = 3
+# Optional file-backed cache of successful responses shared by all entries and by
+# other Home Assistant instances pointing at the same directory; 0 disables it.
+CONF_RESPONSE_CACHE_TTL = "response_cache_ttl"
+DEFAULT_RESPONSE_CACHE_TTL = 0
+MAX_RESPONSE_CACHE_TTL = 3600
+RESPONSE_CACHE_DIR = f".{DOMAIN}_cache"
+# Opt-in capture of every raw API reply (serials masked, timing included) to rotating
+# gzip JSONL files in RECORDING_DIR, one file set per entry, for replaying incidents.
+CONF_RESPONSE_RECORDING = "response_recording"
+RECORDING_DIR = f".{DOMAIN}_recordings"
+RECORDING_MAX_BYTES = 5 * 1024 * 1024
+RECORDING_BACKUPS = 3
 DEFAULT_ENTITY_PREFIX = "solax_cloud_api"
 INVALID_ENTITY_PREFIXES = frozenset({"unknown", "unnamed"})
 DEFAULT_SCAN_INTERVAL = 120
-API_URL = "https://global.solaxcloud.com/api/v2/dataAccess/realtimeInfo/get"
+MIN_SCAN_INTERVAL = 120
+MAX_SCAN_INTERVAL = 3600
+CONF_AUTO_SCAN_INTERVAL = "auto_scan_interval"
+# Published SolaX Cloud limits per token; the planner keeps 10% headroom for
+# manual refreshes and setup/preflight calls that are not part of the schedule.
+API_CALLS_PER_MINUTE_LIMIT = 10
+API_CALLS_PER_DAY_LIMIT = 10000
+API_QUOTA_SAFETY_FACTOR = 0.9
+API_URL = f"{API_BASE_URL}{API_REALTIME_PATH}"
+CONF_BATCH_SIZE = "batch_size"
+MAX_BATCH_SIZE = 10
+# SolaX Cloud hosts to use, fastest healthy one first. Hosts are probed at setup
+# and every ENDPOINT_PROBE_INTERVAL seconds; a host that times out or answers
+# with a 5xx is skipped for ENDPOINT_RETRY_AFTER seconds.
+CONF_API_ENDPOINTS = "api_endpoints"
+ENDPOINT_PROBE_INTERVAL = 900
 SERVICE_MANUAL_REFRESH = "manual_refresh"
+# Manual refreshes skip serials polled this recently and fold into a scheduled
+# cycle that is due within the coalesce window.
+MANUAL_REFRESH_COOLDOWN = 60
+MANUAL_REFRESH_COALESCE_WINDOW = 30
+SERVICE_BURST = "burst"
+BURST_MIN_INTERVAL = 30
+BURST_MAX_DURATION = 3600
+DEFAULT_BURST_INTERVAL = 60
 RUNTIME_RELOAD_STATE = f"{DOMAIN}_reload_state"
+# Entity registry events are coalesced before serials are re-checked for pausing.
+REGISTRY_UPDATE_DEBOUNCE = 1.0
+# Domain-wide request scheduler shared by all config entries.
+RUNTIME_SCHEDULER = f"{DOMAIN}_scheduler"
+# Minimum gap between any two API calls, across all entries and tokens.
+SCHEDULER_CALL_SPACING = 1.0
+PREFLIGHT_REQUEST_TIMEOUT = 10
 RUNTIME_INITIAL_SETUP_STATE = "__initial_setup__"
+STORAGE_VERSION = 1
+# Debounce for estimator/scheduler state writes; a final flush runs on stop/unload.
+STORAGE_SAVE_DELAY = 60
 
 LOGGER = logging.getLogger(__package__)
 
@@ -55,5 +130,24 @@ HIDDEN_SENSORS = {
     "utcDateTime": True,     # UTC timestamp
 }
 
+# Per-inverter fields kept by the minimal entity profile (power, yield and SoC).
+MINIMAL_PROFILE_FIELDS = frozenset(
+    {"acpower", "feedinpower", "batPower", "yieldtoday", "yieldtotal", "soc"}
+)
+
 # Fields whose states are mapped via translation files
 MAPPED_FIELDS = ["inverterStatus", "batStatus", "inverterType"]
+
+# Power fields integrated into estimated energy sensors: metric -> (field, sign).
+# A sign of -1 integrates the negative part of the field (e.g. grid import).
+INTEGRATED_ENERGY_SOURCES = {
+    "pv1": ("powerdc1", 1),
+    "pv2": ("powerdc2", 1),
+    "pv3": ("powerdc3", 1),
+    "pv4": ("powerdc4", 1),
+    "grid_export": ("feedinpower", 1),
+    "grid_import": ("feedinpower", -1),
+    "eps1": ("peps1", 1),
+    "eps2": ("peps2", 1),
+    "eps3": ("peps3", 1),
+}
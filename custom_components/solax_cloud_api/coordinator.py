@@ -3,39 +3,32 @@ import logging
 from copy import deepcopy
 from datetime import timedelta
 
-import async_timeout
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.util import dt as dt_util
 
-from .const import API_URL, DEFAULT_SCAN_INTERVAL
+from .client import SolaxCloudClient, SolaxOutcome, classify_response
+from .clock import SYSTEM_CLOCK, SolaxClock
+from .const import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_NIGHT_BATTERY_INTERVAL,
+    DEFAULT_SCAN_INTERVAL,
+    MANUAL_REFRESH_COALESCE_WINDOW,
+    MANUAL_REFRESH_COOLDOWN,
+    NIGHT_PV_INTERVAL,
+    NIGHT_SUN_ELEVATION,
+    NIGHT_ZERO_DC_SAMPLES,
+)
+from .energy import SolaxEnergyIntegrator
+from .quota import SolaxApiCallCounter, plan_scan_interval, token_fingerprint
+from .solar import solar_elevation
 
 _LOGGER = logging.getLogger(__name__)
 
 
-def _is_rate_limited_response(resp: dict) -> bool:
-    """Return True when Solax response indicates API throttling/rate limit."""
-    if not isinstance(resp, dict):
-        return False
-
-    code = resp.get("code")
-    if code in (3, 104):
-        return True
-
-    exception = str(resp.get("exception", "")).lower()
-    rate_limit_markers = (
-        "rate limit",
-        "maximum call threshold",
-        "suspend the request",
-        "current minute > threshold",
-        "within the current minute",
-        "too many requests",
-    )
-    return any(marker in exception for marker in rate_limit_markers)
-
-
 class SolaxCoordinator(DataUpdateCoordinator):
     def __init__(
         self,
@@ -45,6 +38,17 @@ class SolaxCoordinator(DataUpdateCoordinator):
         scan_interval: int = DEFAULT_SCAN_INTERVAL,
         initial_data: dict | None = None,
         initial_refresh_inverters: list[str] | None = None,
+        state_store=None,
+        lean_attributes: bool = False,
+        night_mode: bool = False,
+        night_battery_interval: int = DEFAULT_NIGHT_BATTERY_INTERVAL,
+        scheduler=None,
+        api_call_counter: SolaxApiCallCounter | None = None,
+        response_cache=None,
+        response_recorder=None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        api_endpoints: list[str] | None = None,
+        clock: SolaxClock | None = None,
     ):
         super().__init__(
             hass,
@@ -54,6 +58,28 @@ class SolaxCoordinator(DataUpdateCoordinator):
         )
         self.token = token
         self.inverters = inverters
+        # Every cooldown, pacing delay and timestamp below reads this clock.
+        self.clock = clock or SYSTEM_CLOCK
+        # Configured interval; update_interval only differs while a burst is active.
+        self.scan_interval = scan_interval
+        # Entities drop their unrecorded/debug attributes entirely in lean mode.
+        self.lean_attributes = lean_attributes
+        # Casefolded serials whose entities are all disabled; they are not polled.
+        self.paused_inverters = set()
+        self.night_mode = night_mode
+        self.night_battery_interval = night_battery_interval
+        self.sun_elevation = None
+        # Casefolded serials currently polled at the stretched night rate.
+        self.night_inverters = set()
+        self._zero_dc_streak = {}
+        self._last_polled_at = {}
+        # Casefolded serials actually fetched by the latest scheduled or targeted poll.
+        self.last_fetched_inverters = set()
+        # Scheduled cycles and targeted manual refreshes never run concurrently.
+        self._poll_lock = asyncio.Lock()
+        # Active burst: {"serials": casefolded serials, "interval": seconds, "until": datetime}.
+        self.burst = None
+        self._burst_unsub = None
         self.data = {}
         if isinstance(initial_data, dict):
             for serial, payload in initial_data.items():
@@ -68,48 +94,474 @@ class SolaxCoordinator(DataUpdateCoordinator):
         self.last_rate_limit_at = None
         # Keep the latest full pre-filter API payload per inverter for diagnostics.
         self.raw_api_responses = {}
+        # Batched power -> energy integration, run once per coordinator update.
+        self.energy_integrator = SolaxEnergyIntegrator(clock=self.clock)
+        # Calls made with this token in the current UTC minute/hour/day; entries
+        # sharing a token share the counter through the domain scheduler.
+        self.api_call_counter = api_call_counter or SolaxApiCallCounter(clock=self.clock)
+        # Domain-wide pacing of API calls across entries and tokens.
+        self.scheduler = scheduler
+        # Optional shared on-disk cache; fresh entries replace API calls.
+        self.response_cache = response_cache
+        # Realtime API access, batched when batch_size > 1 and paced by the scheduler.
+        self.client = SolaxCloudClient(
+            token, endpoints=api_endpoints, chunk_size=batch_size, pacer=self._async_pace
+        )
+        # Optional capture of every raw reply, flushed to disk after each poll.
+        self.response_recorder = None
+        self.set_response_recorder(response_recorder)
+        self.state_store = state_store
+        if state_store is not None:
+            self.energy_integrator.load(state_store.restored("integrator", "accumulators"))
+            quota_key = token_fingerprint(token)
+            self.api_call_counter.load(state_store.restored("quota", quota_key))
+            state_store.async_register("quota", quota_key, self.api_call_counter.snapshot)
+            self._restore_scheduler_state(state_store.restored("scheduler", "cooldowns"))
+            state_store.async_register(
+                "integrator", "accumulators", self.energy_integrator.snapshot
+            )
+            state_store.async_register("scheduler", "cooldowns", self._scheduler_snapshot)
         self._initial_refresh_inverters = (
             {sn.casefold() for sn in initial_refresh_inverters}
             if initial_refresh_inverters is not None
             else None
         )
 
-    async def _fetch_one(self, session, sn):
-        headers = { "Content-Type": "application/json", "tokenId": self.token }
-        payload = { "wifiSn": sn }
+    def set_paused_inverters(self, serials) -> bool:
+        """Replace the paused serial set; return True when it changed."""
+        paused = {str(sn).casefold() for sn in serials}
+        if paused == self.paused_inverters:
+            return False
+        resumed = self.paused_inverters - paused
+        if resumed:
+            _LOGGER.debug("Resuming polling for re-enabled inverter(s): %s", sorted(resumed))
+        if paused - self.paused_inverters:
+            _LOGGER.debug(
+                "Pausing polling for inverter(s) without enabled entities: %s",
+                sorted(paused - self.paused_inverters),
+            )
+        self.paused_inverters = paused
+        return True
+
+    @callback
+    def set_response_recorder(self, recorder) -> None:
+        """Start recording raw replies with `recorder`, or stop when it is None."""
+        self.response_recorder = recorder
+        self.client.recorder = recorder.record if recorder is not None else None
+
+    def recommended_scan_interval(self) -> int:
+        """Fastest scan interval that keeps every serial polled with the token in quota."""
+        count = len(self.inverters)
+        if self.scheduler is not None:
+            # Entries sharing the token share its quota; this entry is registered too.
+            count = self.scheduler.inverter_count(self.token) or count
+        # Batches only save calls once the account answered one.
+        batch_size = self.client.chunk_size if self.client.batch_supported else 1
+        return plan_scan_interval(count, batch_size=batch_size)
+
+    async def _async_flush_recording(self) -> None:
+        if self.response_recorder is not None:
+            await self.response_recorder.async_flush()
+
+    def async_set_inverters(self, serials) -> list[str]:
+        """Replace the configured serials in place and drop state of removed ones.
+
+        The list object is shared with the entity platforms, so it is mutated
+        rather than rebound. Returns the removed serials.
+        """
+        wanted = {sn.casefold() for sn in serials}
+        removed = [sn for sn in self.inverters if sn.casefold() not in wanted]
+        self.inverters[:] = list(serials)
+        removed_keys = {sn.casefold() for sn in removed}
+        for sn in removed:
+            serial_key = sn.casefold()
+            self.data.pop(sn, None)
+            self.raw_api_responses.pop(sn, None)
+            self._last_polled_at.pop(serial_key, None)
+            self._zero_dc_streak.pop(serial_key, None)
+            self.paused_inverters.discard(serial_key)
+            self.night_inverters.discard(serial_key)
+            self.energy_integrator.forget(sn)
+            if hasattr(self, f"_last_rate_limit_{sn}"):
+                delattr(self, f"_last_rate_limit_{sn}")
+            if self.burst is not None:
+                self.burst["serials"].discard(serial_key)
+        self.rate_limited_inverters = [
+            sn for sn in self.rate_limited_inverters if sn.casefold() not in removed_keys
+        ]
+        self.rate_limited_details = {
+            sn: details
+            for sn, details in self.rate_limited_details.items()
+            if sn.casefold() not in removed_keys
+        }
+        self.unauthorized_inverters = [
+            sn for sn in self.unauthorized_inverters if sn.casefold() not in removed_keys
+        ]
+        self.unauthorized_details = {
+            sn: details
+            for sn, details in self.unauthorized_details.items()
+            if sn.casefold() not in removed_keys
+        }
+        return removed
+
+    def _update_sun_elevation(self):
+        if not self.night_mode:
+            self.sun_elevation = None
+            return
+        try:
+            self.sun_elevation = solar_elevation(
+                self.clock.utcnow(),
+                float(self.hass.config.latitude),
+                float(self.hass.config.longitude),
+            )
+        except (TypeError, ValueError):
+            self.sun_elevation = None
+
+    def _track_darkness(self, sn, payload):
+        """Count consecutive samples without DC power (acpower when no DC fields exist)."""
+        serial_key = sn.casefold()
+        dc_values = [payload.get(f"powerdc{i}") for i in range(1, 5)]
+        dc_values = [value for value in dc_values if value is not None]
+        if not dc_values and payload.get("acpower") is not None:
+            dc_values = [payload.get("acpower")]
         try:
-            async with async_timeout.timeout(15):
-                async with session.post(API_URL, json=payload, headers=headers) as resp:
-                    text = await resp.text()
-                    if resp.status != 200:
-                        _LOGGER.warning("Solax HTTP error %s for %s: %s", resp.status, sn, text)
-                        return { "error": f"HTTP {resp.status}", "raw": text }
-
-                    try:
-                        j = await resp.json()
-                    except Exception as json_err:
-                        _LOGGER.warning("JSON parse error for %s: %s", sn, json_err)
-                        return { "error": f"JSON Error: {json_err}", "raw": text }
-
-                    return j
-        except TimeoutError:
-            _LOGGER.warning("Timeout fetching data for %s", sn)
-            return { "error": "Timeout" }
-        except Exception as e:
-            _LOGGER.warning("Failed request for %s: %s", sn, e)
-            return { "error": str(e) }
+            dark = bool(dc_values) and all(float(value) == 0 for value in dc_values)
+        except (TypeError, ValueError):
+            dark = False
+        self._zero_dc_streak[serial_key] = (
+            self._zero_dc_streak.get(serial_key, 0) + 1 if dark else 0
+        )
+
+    def _night_interval(self, sn):
+        """Return the stretched poll interval for a serial, or None during daytime."""
+        serial_key = sn.casefold()
+        if (
+            self.sun_elevation is None
+            or self.sun_elevation >= NIGHT_SUN_ELEVATION
+            or self._zero_dc_streak.get(serial_key, 0) < NIGHT_ZERO_DC_SAMPLES
+        ):
+            self.night_inverters.discard(serial_key)
+            return None
+        self.night_inverters.add(serial_key)
+        previous = self.data.get(sn)
+        if isinstance(previous, dict) and previous.get("batPower") is not None:
+            return max(self.night_battery_interval, self.scan_interval)
+        return max(NIGHT_PV_INTERVAL, self.scan_interval)
+
+    def _serial_poll_interval(self, sn):
+        """Return the minimum spacing between polls of a serial, or None to poll every cycle."""
+        if self.burst is not None:
+            if sn.casefold() in self.burst["serials"]:
+                return None
+            # Cycles run at the burst rate; other serials keep their own schedule.
+            return self._night_interval(sn) or self.scan_interval
+        return self._night_interval(sn)
+
+    @callback
+    def async_apply_settings(
+        self,
+        *,
+        scan_interval: int,
+        lean_attributes: bool,
+        night_mode: bool,
+        night_battery_interval: int,
+    ) -> None:
+        """Apply changed options in place; an active burst keeps its own interval."""
+        self.scan_interval = scan_interval
+        if self.burst is None:
+            self.update_interval = timedelta(seconds=scan_interval)
+        self.lean_attributes = lean_attributes
+        self.night_mode = night_mode
+        self.night_battery_interval = night_battery_interval
+        if not night_mode:
+            self.sun_elevation = None
+            self.night_inverters.clear()
+        self.async_update_listeners()
+
+    @callback
+    def async_start_burst(self, serials, interval: int, duration: int) -> None:
+        """Poll the given serials every `interval` seconds for `duration` seconds."""
+        self.async_cancel_burst()
+        self.burst = {
+            "serials": {sn.casefold() for sn in serials},
+            "interval": interval,
+            "until": self.clock.utcnow() + timedelta(seconds=duration),
+        }
+        self.update_interval = timedelta(seconds=interval)
+        self._burst_unsub = async_call_later(self.hass, duration, self._async_end_burst)
+        _LOGGER.info(
+            "Burst polling %d inverter(s) every %ss for %ss", len(serials), interval, duration
+        )
+
+    @callback
+    def async_cancel_burst(self) -> None:
+        if self._burst_unsub is not None:
+            self._burst_unsub()
+            self._burst_unsub = None
+        if self.burst is not None:
+            self.burst = None
+            self.update_interval = timedelta(seconds=self.scan_interval)
+
+    @callback
+    def _async_end_burst(self, _now) -> None:
+        self._burst_unsub = None
+        self.async_cancel_burst()
+        _LOGGER.info("Burst polling ended; back to %ss scan interval", self.scan_interval)
+        self.async_update_listeners()
+
+    def _restore_scheduler_state(self, snapshot):
+        """Re-arm rate-limit cooldowns and a rejected batch probe from before a restart."""
+        if not isinstance(snapshot, dict):
+            return
+        # Each batch probe costs one of the token's calls, so a rejection is kept.
+        if snapshot.get("batch_rejected_token") == token_fingerprint(self.token):
+            self.client.batch_supported = False
+        rate_limited_at = snapshot.get("rate_limited_at")
+        if not isinstance(rate_limited_at, dict):
+            return
+        now_utc = self.clock.utcnow()
+        now_monotonic = self.clock.monotonic()
+        for sn in self.inverters:
+            limited_at = dt_util.parse_datetime(str(rate_limited_at.get(sn.casefold(), "")))
+            if limited_at is None:
+                continue
+            elapsed = (now_utc - limited_at).total_seconds()
+            if 0 <= elapsed < self.update_interval.total_seconds() * 0.55:
+                setattr(self, f"_last_rate_limit_{sn}", now_monotonic - elapsed)
+
+    def _scheduler_snapshot(self):
+        now_utc = self.clock.utcnow()
+        now_monotonic = self.clock.monotonic()
+        rate_limited_at = {}
+        for sn in self.inverters:
+            last_rate_limit = getattr(self, f"_last_rate_limit_{sn}", None)
+            if last_rate_limit is None:
+                continue
+            limited_at = now_utc - timedelta(seconds=now_monotonic - last_rate_limit)
+            rate_limited_at[sn.casefold()] = limited_at.isoformat()
+        snapshot = {"rate_limited_at": rate_limited_at}
+        if self.client.batch_supported is False:
+            snapshot["batch_rejected_token"] = token_fingerprint(self.token)
+        return snapshot
+
+    async def _fetch_one(self, session, sn):
+        if self.response_cache is not None:
+            cached = await self.response_cache.async_get(self.token, sn)
+            if cached is not None:
+                _LOGGER.debug("Using cached response for %s", sn)
+                return cached
+
+        resp = await self._request_one(session, sn)
+        if (
+            self.response_cache is not None
+            and isinstance(resp, dict)
+            and resp.get("success")
+            and resp.get("code") in (0, None)
+        ):
+            await self.response_cache.async_put(self.token, sn, resp)
+        return resp
+
+    async def _async_pace(self):
+        """Wait for the token's next call slot and count the call."""
+        if self.scheduler is not None:
+            await self.scheduler.async_acquire(self.token)
+        self.api_call_counter.record()
+
+    async def _request_one(self, session, sn):
+        reply = await self.client.async_fetch(sn, session=session)
+        return reply.payload
+
+    async def async_probe_endpoints(self, _now=None) -> None:
+        """Re-measure host latencies so requests prefer the fastest healthy host."""
+        if len(self.client.endpoints) < 2:
+            return
+        await self.client.async_probe(async_get_clientsession(self.hass))
+        _LOGGER.debug(
+            "Solax endpoint order after probe: %s",
+            [endpoint.base_url for endpoint in self.client.ordered_endpoints()],
+        )
+
+    async def _prefetch_batches(self, session, serials):
+        """Fetch serials in multi-serial calls; return single-serial replies by serial.
+
+        Serials without a reply here (batching off or rejected, a one-serial
+        remainder, or missing from the batch reply) are fetched one by one.
+        """
+        prefetched = {}
+        if not self.client.batching or len(serials) < 2:
+            return prefetched
+
+        pending = []
+        for sn in serials:
+            cached = None
+            if self.response_cache is not None:
+                cached = await self.response_cache.async_get(self.token, sn)
+            if cached is not None:
+                prefetched[sn] = cached
+            else:
+                pending.append(sn)
+
+        for chunk in self.client.chunks(pending):
+            if len(chunk) < 2 or not self.client.batching:
+                break
+            _LOGGER.debug("Fetching data for %d inverters in one batch call", len(chunk))
+            replies = await self.client.async_fetch_batch(chunk, session=session)
+            if replies is None:
+                break
+            for sn, reply in replies.items():
+                prefetched[sn] = reply.payload
+                if self.response_cache is not None and reply.ok:
+                    await self.response_cache.async_put(self.token, sn, reply.payload)
+        return prefetched
+
+    def _rate_limit_skip_until(self, sn):
+        """Return the loop time until which a rate-limited serial is skipped."""
+        last_rate_limit = getattr(self, f"_last_rate_limit_{sn}", 0)
+        return last_rate_limit + self.update_interval.total_seconds() * 0.55  # 55% of scan interval
+
+    def _seconds_until_next_cycle(self):
+        if self.last_update_attempt is None or self.update_interval is None:
+            return None
+        next_cycle = self.last_update_attempt + self.update_interval
+        return (next_cycle - self.clock.utcnow()).total_seconds()
+
+    async def async_manual_refresh(self, serials=None) -> dict:
+        """Fetch configured serials now (all when None) without fighting the schedule.
+
+        A poll already in flight is awaited instead of repeated, a scheduled
+        cycle due within the coalesce window is pulled forward, and serials that
+        were polled recently or are in a rate-limit cooldown are skipped.
+        """
+        targets = list(self.inverters if serials is None else serials)
+        if self._poll_lock.locked():
+            async with self._poll_lock:
+                pass
+            return self._manual_refresh_result("in_flight", targets, {})
+
+        now_monotonic = self.clock.monotonic()
+        skipped = {}
+        due = []
+        for sn in targets:
+            serial_key = sn.casefold()
+            last_polled = self._last_polled_at.get(serial_key)
+            last_rate_limit = getattr(self, f"_last_rate_limit_{sn}", None)
+            if serial_key in self.paused_inverters:
+                skipped[sn] = "paused"
+            elif (
+                last_rate_limit is not None
+                and now_monotonic < last_rate_limit + self.update_interval.total_seconds() * 0.55
+            ):
+                skipped[sn] = "rate_limit_cooldown"
+            elif last_polled is not None and now_monotonic - last_polled < MANUAL_REFRESH_COOLDOWN:
+                skipped[sn] = "recently_polled"
+            else:
+                due.append(sn)
+
+        if not due:
+            return {"mode": "skipped", "fetched": [], "skipped": skipped}
+
+        polled = [sn for sn in self.inverters if sn.casefold() not in self.paused_inverters]
+        seconds_left = self._seconds_until_next_cycle()
+        if len(due) == len(polled) or (
+            seconds_left is not None and seconds_left <= MANUAL_REFRESH_COALESCE_WINDOW
+        ):
+            # Run the regular cycle now; it re-arms the schedule from here.
+            await self.async_refresh()
+            return self._manual_refresh_result("scheduled", targets, skipped)
+
+        async with self._poll_lock:
+            try:
+                self.data = await self._async_poll({sn.casefold() for sn in due})
+            finally:
+                await self._async_flush_recording()
+        self.async_update_listeners()
+        return self._manual_refresh_result("targeted", targets, skipped)
+
+    def _manual_refresh_result(self, mode, targets, skipped) -> dict:
+        fetched = [sn for sn in targets if sn.casefold() in self.last_fetched_inverters]
+        not_fetched = {sn: "not_due" for sn in targets if sn not in fetched}
+        not_fetched.update({sn: reason for sn, reason in skipped.items() if sn not in fetched})
+        return {"mode": mode, "fetched": fetched, "skipped": not_fetched}
 
     async def _async_update_data(self):
+        async with self._poll_lock:
+            try:
+                return await self._async_poll()
+            finally:
+                await self._async_flush_recording()
+
+    async def _async_poll(self, targets=None):
+        """Poll every due serial, or only the casefolded `targets` for a manual refresh."""
         results = {}
         raw_results = {}
-        self.last_update_attempt = dt_util.utcnow()
-        self.rate_limited_inverters = []
-        self.rate_limited_details = {}
-        self.unauthorized_inverters = []
-        self.unauthorized_details = {}
+        self.last_fetched_inverters = set()
+        if targets is None:
+            self.last_update_attempt = self.clock.utcnow()
+            self.rate_limited_inverters = []
+            self.rate_limited_details = {}
+            self.unauthorized_inverters = []
+            self.unauthorized_details = {}
+        else:
+            # Keep the status of serials outside a targeted poll.
+            self.rate_limited_inverters = [
+                sn for sn in self.rate_limited_inverters if sn.casefold() not in targets
+            ]
+            self.rate_limited_details = {
+                sn: details
+                for sn, details in self.rate_limited_details.items()
+                if sn.casefold() not in targets
+            }
+            self.unauthorized_inverters = [
+                sn for sn in self.unauthorized_inverters if sn.casefold() not in targets
+            ]
+            self.unauthorized_details = {
+                sn: details
+                for sn, details in self.unauthorized_details.items()
+                if sn.casefold() not in targets
+            }
 
         session = async_get_clientsession(self.hass)
-        for idx, sn in enumerate(self.inverters):
+        self._update_sun_elevation()
+        cycle_started = self.clock.monotonic()
+        active_inverters = []
+        for sn in self.inverters:
+            if targets is not None:
+                deferred = sn.casefold() not in targets
+            else:
+                poll_interval = self._serial_poll_interval(sn)
+                last_polled = self._last_polled_at.get(sn.casefold())
+                deferred = (
+                    poll_interval is not None
+                    and last_polled is not None
+                    # Small tolerance so a cycle landing just early still polls.
+                    and cycle_started - last_polled < poll_interval - 5
+                )
+            if sn.casefold() not in self.paused_inverters and not deferred:
+                active_inverters.append(sn)
+                continue
+            # Paused (all entities disabled), deferred by night mode/burst or outside a
+            # targeted refresh: keep the last payload.
+            previous = self.data.get(sn)
+            results[sn] = dict(previous) if isinstance(previous, dict) else {}
+            previous_raw = self.raw_api_responses.get(sn)
+            if isinstance(previous_raw, dict):
+                raw_results[sn] = deepcopy(previous_raw)
+
+        loop_time = self.clock.monotonic()
+        prefetched = await self._prefetch_batches(
+            session,
+            [
+                sn
+                for sn in active_inverters
+                if (
+                    self._initial_refresh_inverters is None
+                    or sn.casefold() in self._initial_refresh_inverters
+                )
+                and loop_time >= self._rate_limit_skip_until(sn)
+            ],
+        )
+
+        for idx, sn in enumerate(active_inverters):
             if (
                 self._initial_refresh_inverters is not None
                 and sn.casefold() not in self._initial_refresh_inverters
@@ -134,25 +586,24 @@ class SolaxCoordinator(DataUpdateCoordinator):
                             "code": previous.get("code"),
                             "exception": previous.get("exception"),
                         }
-                        self.last_rate_limit_at = dt_util.utcnow()
+                        self.last_rate_limit_at = self.clock.utcnow()
                 else:
                     results[sn] = {}
                     if isinstance(previous_raw, dict):
                         raw_results[sn] = deepcopy(previous_raw)
                 continue
 
-            # Add progressive delay based on position
-            if idx > 0:
+            # Add progressive delay based on position; batched serials already arrived.
+            if idx > 0 and sn not in prefetched:
                 delay = min(1 + (idx * 0.5), 5)
                 _LOGGER.debug("Waiting %.1f seconds before querying inverter %s", delay, sn)
-                await asyncio.sleep(delay)
+                await self.clock.sleep(delay)
 
             # Use fresh monotonic time per inverter to avoid stale cooldown checks.
-            now_monotonic = asyncio.get_running_loop().time()
+            now_monotonic = self.clock.monotonic()
 
             # Check if this inverter was rate-limited - align with scan interval
-            last_rate_limit = getattr(self, f'_last_rate_limit_{sn}', 0)
-            skip_until = last_rate_limit + self.update_interval.total_seconds() * 0.55  # 55% of scan interval
+            skip_until = self._rate_limit_skip_until(sn)
 
             if now_monotonic < skip_until:
                 _LOGGER.debug(
@@ -181,11 +632,18 @@ class SolaxCoordinator(DataUpdateCoordinator):
                     "reason": "cooldown_active",
                     "retry_in_seconds": round(skip_until - now_monotonic, 1),
                 }
-                self.last_rate_limit_at = dt_util.utcnow()
+                self.last_rate_limit_at = self.clock.utcnow()
                 continue
 
-            _LOGGER.debug("Fetching data for inverter %s (%d/%d)", sn, idx + 1, len(self.inverters))
-            resp = await self._fetch_one(session, sn)
+            _LOGGER.debug(
+                "Fetching data for inverter %s (%d/%d)", sn, idx + 1, len(active_inverters)
+            )
+            if sn in prefetched:
+                resp = prefetched[sn]
+            else:
+                resp = await self._fetch_one(session, sn)
+            self._last_polled_at[sn.casefold()] = now_monotonic
+            self.last_fetched_inverters.add(sn.casefold())
 
             if isinstance(resp, Exception):
                 _LOGGER.warning("Fetch exception for %s: %s", sn, resp)
@@ -201,10 +659,10 @@ class SolaxCoordinator(DataUpdateCoordinator):
 
             raw_results[sn] = deepcopy(resp)
             code = resp.get("code")
-            success = resp.get("success", False)
+            outcome = classify_response(resp)
 
             # Handle rate-limit responses from Solax (seen as code 104 and code 3)
-            if _is_rate_limited_response(resp):
+            if outcome is SolaxOutcome.RATE_LIMITED:
                 _LOGGER.warning(
                     "API rate limit exceeded for %s (code=%s). Will skip for %.1f seconds.",
                     sn, code, self.update_interval.total_seconds() * 0.55
@@ -236,19 +694,19 @@ class SolaxCoordinator(DataUpdateCoordinator):
                     "exception": resp.get("exception"),
                     "retry_in_seconds": round(self.update_interval.total_seconds() * 0.55, 1),
                 }
-                self.last_rate_limit_at = dt_util.utcnow()
+                self.last_rate_limit_at = self.clock.utcnow()
 
                 # Add extra delay before next inverter
-                if idx < len(self.inverters) - 1:
+                if idx < len(active_inverters) - 1 and active_inverters[idx + 1] not in prefetched:
                     _LOGGER.debug("Adding 5 second delay after rate limit")
-                    await asyncio.sleep(5)
+                    await self.clock.sleep(5)
                 continue
 
-            if code == 1001:  # Token unauthorized
+            if outcome is SolaxOutcome.TOKEN_INVALID:  # code 1001
                 _LOGGER.error("API token unauthorized. Reauthentication required.")
                 raise ConfigEntryAuthFailed("API token unauthorized")
 
-            if code == 1003:  # Data unauthorized (invalid serial or no access)
+            if outcome is SolaxOutcome.DATA_UNAUTHORIZED:  # code 1003, invalid serial or no access
                 _LOGGER.error(
                     "Data unauthorized for inverter %s (code=1003). "
                     "Marking this inverter unavailable. Exception: %s",
@@ -268,7 +726,7 @@ class SolaxCoordinator(DataUpdateCoordinator):
                 }
                 continue
 
-            elif not success or (code is not None and code != 0):
+            elif outcome is not SolaxOutcome.OK:
                 _LOGGER.warning("API error for %s: code=%s, exception=%s", sn, code, resp.get("exception"))
                 results[sn] = { "error": True, "code": code, "exception": resp.get("exception"), "raw": resp }
                 continue
@@ -278,6 +736,7 @@ class SolaxCoordinator(DataUpdateCoordinator):
             if result_data:
                 cleaned_data = {k: v for k, v in result_data.items() if v is not None}
                 results[sn] = cleaned_data
+                self._track_darkness(sn, cleaned_data)
                 # Clear any previous rate limit flag on success
                 if hasattr(self, f'_last_rate_limit_{sn}'):
                     delattr(self, f'_last_rate_limit_{sn}')
@@ -295,10 +754,15 @@ class SolaxCoordinator(DataUpdateCoordinator):
 
         _LOGGER.debug("Successfully updated data for %d/%d inverters", successful_updates, len(self.inverters))
         if successful_updates > 0:
-            self.last_successful_update = dt_util.utcnow()
+            self.last_successful_update = self.clock.utcnow()
 
         # Only skip non-new inverters on the first refresh after a reload.
-        self._initial_refresh_inverters = None
+        if targets is None:
+            self._initial_refresh_inverters = None
+
+        self.energy_integrator.integrate(results)
+        if self.state_store is not None:
+            self.state_store.async_schedule_save()
 
         self.data = results
         self.raw_api_responses = raw_results
@@ -16,6 +16,7 @@ from .const import (
     CONF_TOKEN,
     DOMAIN,
 )
+from .quota import QUOTA_WINDOWS
 
 _TO_REDACT = {
     CONF_TOKEN,
@@ -115,6 +116,24 @@ def _battery_field_summary(raw_payload: Any, filtered_payload: Any) -> dict[str,
     return summary
 
 
+def _api_call_summary(coordinator) -> dict[str, Any]:
+    counter = getattr(coordinator, "api_call_counter", None)
+    summary = {"recommended_scan_interval": coordinator.recommended_scan_interval()}
+    if counter is not None:
+        for window in QUOTA_WINDOWS:
+            summary[window] = counter.count(window)
+    return summary
+
+
+def _scheduler_summary(coordinator) -> dict[str, Any] | None:
+    scheduler = getattr(coordinator, "scheduler", None)
+    if scheduler is None:
+        return None
+    summary = scheduler.as_dict()
+    summary["entries_sharing_token"] = len(scheduler.entries_for_token(coordinator.token))
+    return summary
+
+
 async def async_get_config_entry_diagnostics(
     hass: HomeAssistant, config_entry: ConfigEntry
 ) -> dict[str, Any]:
@@ -155,6 +174,7 @@ async def async_get_config_entry_diagnostics(
     )
     rate_limited = set(getattr(coordinator, "rate_limited_inverters", []))
     unauthorized = set(getattr(coordinator, "unauthorized_inverters", []))
+    paused = set(getattr(coordinator, "paused_inverters", set()))
     rate_limited_details = deepcopy(getattr(coordinator, "rate_limited_details", {}))
     unauthorized_details = deepcopy(getattr(coordinator, "unauthorized_details", {}))
 
@@ -167,6 +187,28 @@ async def async_get_config_entry_diagnostics(
             ),
             "last_rate_limit_at": _dt_to_iso(getattr(coordinator, "last_rate_limit_at", None)),
             "rate_limited_inverters": list(rate_limited),
+            "api_calls": _api_call_summary(coordinator),
+            "scheduler": _scheduler_summary(coordinator),
+            "response_cache": (
+                coordinator.response_cache.as_dict()
+                if getattr(coordinator, "response_cache", None) is not None
+                else {"enabled": False}
+            ),
+            "response_recording": (
+                coordinator.response_recorder.as_dict()
+                if getattr(coordinator, "response_recorder", None) is not None
+                else {"enabled": False}
+            ),
+            "client": (
+                coordinator.client.as_dict()
+                if getattr(coordinator, "client", None) is not None
+                else None
+            ),
+            "night_mode": {
+                "enabled": bool(getattr(coordinator, "night_mode", False)),
+                "sun_elevation": getattr(coordinator, "sun_elevation", None),
+                "night_inverter_count": len(getattr(coordinator, "night_inverters", ())),
+            },
             "unauthorized_inverters": list(unauthorized),
             "rate_limited_details": [
                 {"serial": serial, "details": details}
@@ -190,6 +232,7 @@ async def async_get_config_entry_diagnostics(
                 "status": {
                     "is_rate_limited": serial in rate_limited,
                     "is_unauthorized": serial in unauthorized,
+                    "is_polling_paused": serial.casefold() in paused,
                     "has_error_payload": bool(
                         isinstance(filtered_payload, dict) and filtered_payload.get("error")
                     ),
@@ -0,0 +1,197 @@
+from datetime import UTC, date, datetime
+
+from homeassistant.util import dt as dt_util
+
+from .clock import SYSTEM_CLOCK
+from .const import INTEGRATED_ENERGY_SOURCES
+
+
+def _parse_timestamp(value):
+    if value in (None, ""):
+        return None
+    raw = str(value).strip()
+    if not raw:
+        return None
+
+    dt_obj = dt_util.parse_datetime(raw)
+    if dt_obj is None:
+        for fmt in ("%Y-%m-%d %H:%M:%S", "%Y/%m/%d %H:%M:%S"):
+            try:
+                dt_obj = datetime.strptime(raw, fmt)
+                break
+            except ValueError:
+                continue
+
+    if dt_obj is None:
+        return None
+
+    if dt_obj.tzinfo is None:
+        dt_obj = dt_obj.replace(tzinfo=UTC)
+    return dt_obj
+
+
+def _sample_key_and_dt(inverter_data):
+    upload_time = inverter_data.get("uploadTime")
+    utc_date_time = inverter_data.get("utcDateTime")
+    key_source = upload_time if upload_time not in (None, "") else utc_date_time
+    if key_source in (None, ""):
+        return None, None
+
+    sample_key = str(key_source).strip()
+    if not sample_key:
+        return None, None
+
+    sample_dt = _parse_timestamp(utc_date_time) or _parse_timestamp(upload_time)
+    return sample_key, sample_dt
+
+
+def _sample_local_date(sample_dt, clock=SYSTEM_CLOCK):
+    if sample_dt is None:
+        return dt_util.as_local(clock.utcnow()).date()
+    return dt_util.as_local(sample_dt).date()
+
+
+def _daily_last_reset_utc(local_date):
+    if local_date is None:
+        return None
+    local_midnight = datetime.combine(local_date, datetime.min.time(), dt_util.DEFAULT_TIME_ZONE)
+    return dt_util.as_utc(local_midnight)
+
+
+def _directional_power(raw, sign):
+    """Return the non-negative part of a power value in the given direction."""
+    if raw is None:
+        return None
+    try:
+        power = float(raw) * sign
+    except (TypeError, ValueError):
+        return None
+    return power if power > 0 else 0.0
+
+
+class SolaxEnergyIntegrator:
+    """Integrate configured power fields into kWh once per coordinator update.
+
+    All inverters and all sources are handled in a single pass over the
+    coordinator payload, so entities only read the accumulated totals.
+    """
+
+    def __init__(self, sources=None, clock=None):
+        self._sources = dict(INTEGRATED_ENERGY_SOURCES if sources is None else sources)
+        self._clock = clock or SYSTEM_CLOCK
+        self._serial_state = {}
+
+    @property
+    def sources(self):
+        return self._sources
+
+    def _state_for(self, serial):
+        return self._serial_state.setdefault(
+            serial.casefold(),
+            {
+                "sample_key": None,
+                "sample_dt": None,
+                "today_date": None,
+                "total_kwh": {},
+                "baseline_kwh": {},
+            },
+        )
+
+    def integrate(self, data):
+        if not isinstance(data, dict):
+            return
+
+        for serial, inverter_data in data.items():
+            if not isinstance(inverter_data, dict) or inverter_data.get("error"):
+                continue
+
+            sample_key, sample_dt = _sample_key_and_dt(inverter_data)
+            if sample_key is None:
+                continue
+
+            state = self._state_for(serial)
+            current_local_date = _sample_local_date(sample_dt, self._clock)
+            if state["today_date"] != current_local_date:
+                state["today_date"] = current_local_date
+                state["baseline_kwh"] = dict(state["total_kwh"])
+
+            if state["sample_key"] is None:
+                state["sample_key"] = sample_key
+                state["sample_dt"] = sample_dt
+                continue
+
+            if sample_key == state["sample_key"]:
+                continue
+
+            last_dt = state["sample_dt"]
+            if sample_dt is not None and last_dt is not None and sample_dt > last_dt:
+                delta_hours = (sample_dt - last_dt).total_seconds() / 3600
+                totals = state["total_kwh"]
+                for metric, (field, sign) in self._sources.items():
+                    power = _directional_power(inverter_data.get(field), sign)
+                    if power is None:
+                        continue
+                    totals[metric] = totals.get(metric, 0.0) + (power * delta_hours) / 1000
+
+            state["sample_key"] = sample_key
+            state["sample_dt"] = sample_dt
+
+    def snapshot(self):
+        """Return compact, JSON-serializable accumulator state per serial."""
+        snapshot = {}
+        for serial_key, state in self._serial_state.items():
+            if not state["total_kwh"] and state["today_date"] is None:
+                continue
+            snapshot[serial_key] = {
+                "today_date": state["today_date"].isoformat() if state["today_date"] else None,
+                "total_kwh": {k: round(v, 6) for k, v in state["total_kwh"].items()},
+                "baseline_kwh": {k: round(v, 6) for k, v in state["baseline_kwh"].items()},
+            }
+        return snapshot
+
+    def load(self, snapshot):
+        """Load accumulators written by `snapshot`; sample tracking starts fresh."""
+        if not isinstance(snapshot, dict):
+            return
+        for serial_key, stored in snapshot.items():
+            if not isinstance(stored, dict):
+                continue
+            state = self._state_for(str(serial_key))
+            try:
+                state["today_date"] = (
+                    date.fromisoformat(stored["today_date"]) if stored.get("today_date") else None
+                )
+            except (TypeError, ValueError):
+                state["today_date"] = None
+            for target in ("total_kwh", "baseline_kwh"):
+                values = stored.get(target)
+                if not isinstance(values, dict):
+                    continue
+                for metric, value in values.items():
+                    try:
+                        state[target][metric] = max(float(value), 0.0)
+                    except (TypeError, ValueError):
+                        continue
+
+    def forget(self, serial):
+        self._serial_state.pop(serial.casefold(), None)
+
+    def total_kwh(self, serial, metric):
+        state = self._serial_state.get(serial.casefold())
+        if state is None:
+            return 0.0
+        return max(state["total_kwh"].get(metric, 0.0), 0.0)
+
+    def today_kwh(self, serial, metric):
+        state = self._serial_state.get(serial.casefold())
+        if state is None:
+            return 0.0
+        total = state["total_kwh"].get(metric, 0.0)
+        baseline = state["baseline_kwh"].get(metric, 0.0)
+        return max(total - baseline, 0.0)
+
+    def today_date(self, serial):
+        state = self._serial_state.get(serial.casefold())
+        if state is None:
+            return None
+        return state["today_date"]
@@ -0,0 +1,127 @@
+import hashlib
+import math
+from datetime import UTC, datetime
+
+from .clock import SYSTEM_CLOCK, SolaxClock
+from .const import (
+    API_CALLS_PER_DAY_LIMIT,
+    API_CALLS_PER_MINUTE_LIMIT,
+    API_QUOTA_SAFETY_FACTOR,
+    BURST_MIN_INTERVAL,
+    MAX_SCAN_INTERVAL,
+    MIN_SCAN_INTERVAL,
+)
+
+# Fixed UTC windows: "minute", "hour" and "day" -> strftime format of the window key.
+QUOTA_WINDOWS = {
+    "minute": "%Y-%m-%dT%H:%M",
+    "hour": "%Y-%m-%dT%H",
+    "day": "%Y-%m-%d",
+}
+
+
+def token_fingerprint(token) -> str:
+    """Return a short, non-reversible key for per-token bookkeeping."""
+    return hashlib.sha256(str(token or "").encode("utf-8")).hexdigest()[:12]
+
+
+def plan_scan_interval(
+    inverter_count: int,
+    calls_per_minute: int = API_CALLS_PER_MINUTE_LIMIT,
+    calls_per_day: int = API_CALLS_PER_DAY_LIMIT,
+    batch_size: int = 1,
+) -> int:
+    """Return the fastest scan interval that keeps one cycle of every serial in quota.
+
+    `inverter_count` is every serial polled with the token, since entries that
+    share a token share its quota; `batch_size` serials cost one call.
+    """
+    if inverter_count <= 0:
+        return MIN_SCAN_INTERVAL
+    calls = math.ceil(inverter_count / max(batch_size, 1))
+    per_minute = calls * 60 / (calls_per_minute * API_QUOTA_SAFETY_FACTOR)
+    per_day = calls * 86400 / (calls_per_day * API_QUOTA_SAFETY_FACTOR)
+    seconds = math.ceil(max(MIN_SCAN_INTERVAL, per_minute, per_day) / 10) * 10
+    return min(seconds, MAX_SCAN_INTERVAL)
+
+
+def plan_burst_interval(
+    requested: int,
+    burst_count: int,
+    other_count: int,
+    scan_interval: int,
+    duration: int,
+    calls_today: int,
+) -> int | None:
+    """Return the shortest burst interval the remaining budget allows, or None.
+
+    `other_count` serials keep polling at `scan_interval` during the burst and
+    their calls are reserved first.
+    """
+    if burst_count <= 0:
+        return None
+    minute_budget = (
+        API_CALLS_PER_MINUTE_LIMIT * API_QUOTA_SAFETY_FACTOR - other_count * 60 / scan_interval
+    )
+    day_budget = (
+        API_CALLS_PER_DAY_LIMIT * API_QUOTA_SAFETY_FACTOR
+        - calls_today
+        - other_count * duration / scan_interval
+    )
+    if minute_budget <= 0 or day_budget <= 0:
+        return None
+    interval = max(
+        requested,
+        BURST_MIN_INTERVAL,
+        burst_count * 60 / minute_budget,
+        burst_count * duration / day_budget,
+    )
+    return math.ceil(interval)
+
+
+class SolaxApiCallCounter:
+    """Count API calls in the current UTC minute, hour and day for one token."""
+
+    def __init__(self, clock: SolaxClock | None = None):
+        self._windows = {window: (None, 0) for window in QUOTA_WINDOWS}
+        self._clock = clock or SYSTEM_CLOCK
+
+    def record(self, now: datetime | None = None, calls: int = 1) -> None:
+        now = now or self._clock.utcnow()
+        for window, fmt in QUOTA_WINDOWS.items():
+            key = now.astimezone(UTC).strftime(fmt)
+            current_key, count = self._windows[window]
+            self._windows[window] = (key, count + calls if key == current_key else calls)
+
+    def count(self, window: str, now: datetime | None = None) -> int:
+        now = now or self._clock.utcnow()
+        key, count = self._windows.get(window, (None, 0))
+        if key != now.astimezone(UTC).strftime(QUOTA_WINDOWS[window]):
+            return 0
+        return count
+
+    def snapshot(self) -> dict:
+        return {
+            window: {"window": key, "count": count}
+            for window, (key, count) in self._windows.items()
+            if key is not None
+        }
+
+    def load(self, snapshot) -> None:
+        """Restore persisted counts; a shared counter keeps the higher count per window."""
+        if not isinstance(snapshot, dict):
+            return
+        for window in QUOTA_WINDOWS:
+            stored = snapshot.get(window)
+            if not isinstance(stored, dict) or not isinstance(stored.get("window"), str):
+                continue
+            try:
+                count = max(int(stored.get("count", 0)), 0)
+            except (TypeError, ValueError):
+                continue
+            current_key, current_count = self._windows[window]
+            if current_key is not None and current_key > stored["window"]:
+                continue
+            if current_key == stored["window"]:
+                count = max(count, current_count)
+            self._windows[window] = (stored["window"], count)
@@ -0,0 +1,137 @@
+import gzip
+import json
+import logging
+import os
+
+from homeassistant.core import HomeAssistant
+
+from .clock import SYSTEM_CLOCK, SolaxClock
+from .const import RECORDING_BACKUPS, RECORDING_MAX_BYTES
+from .diagnostics import _mask_serial, _mask_serial_fields
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _mask_text(value, serials: dict[str, str]):
+    """Replace requested serials inside free-text values (exceptions, raw bodies)."""
+    if isinstance(value, str):
+        for serial, masked in serials.items():
+            value = value.replace(serial, masked)
+        return value
+    if isinstance(value, dict):
+        return {key: _mask_text(item, serials) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_mask_text(item, serials) for item in value]
+    return value
+
+
+class SolaxResponseRecorder:
+    """Opt-in log of every raw SolaX Cloud reply, for replaying field incidents.
+
+    The client hands each HTTP attempt to `record`, which masks serials the same
+    way diagnostics do and buffers one JSON line with the request, the reply and
+    its timing. The coordinator calls `async_flush` after every poll; the lines
+    are compressed and appended in the executor as one gzip member, so the file
+    reads back with `gzip.open` at any point. Past `max_bytes` the file is
+    rotated to `<name>.1.jsonl.gz` and older ones shift up, keeping `backups`.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        directory: str,
+        name: str,
+        *,
+        clock: SolaxClock | None = None,
+        max_bytes: int = RECORDING_MAX_BYTES,
+        backups: int = RECORDING_BACKUPS,
+    ):
+        self.hass = hass
+        self.directory = directory
+        self.name = name
+        self.clock = clock or SYSTEM_CLOCK
+        self.max_bytes = max_bytes
+        self.backups = backups
+        # Replays group replies by poll; the counter moves on with every flush.
+        self.poll = 0
+        self.records = 0
+        self.rotations = 0
+        self.errors = 0
+        self._buffer = []
+
+    @property
+    def path(self) -> str:
+        return self._path(0)
+
+    def _path(self, generation: int) -> str:
+        suffix = f".{generation}" if generation else ""
+        return os.path.join(self.directory, f"{self.name}{suffix}.jsonl.gz")
+
+    def record(
+        self,
+        path: str,
+        wifi_sn: str,
+        endpoint: str,
+        status: int | None,
+        payload,
+        elapsed: float,
+    ) -> None:
+        """Buffer one request/reply pair; called by the client for every attempt."""
+        serials = {
+            serial: _mask_serial(serial) for serial in wifi_sn.split(",") if serial
+        }
+        self._buffer.append(
+            {
+                "poll": self.poll,
+                "time": self.clock.utcnow().isoformat(),
+                "path": path,
+                "endpoint": endpoint,
+                "wifi_sn": ",".join(serials.values()),
+                "status": status,
+                "elapsed_ms": round(elapsed * 1000, 1),
+                "response": _mask_text(_mask_serial_fields(payload), serials),
+            }
+        )
+
+    def _rotate(self) -> None:
+        for generation in range(self.backups, 0, -1):
+            source = self._path(generation - 1)
+            if os.path.exists(source):
+                os.replace(source, self._path(generation))
+        self.rotations += 1
+
+    def _write(self, lines: list[dict]) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        try:
+            if os.path.getsize(self.path) >= self.max_bytes:
+                self._rotate()
+        except FileNotFoundError:
+            pass
+        text = "".join(json.dumps(line, separators=(",", ":")) + "\n" for line in lines)
+        with gzip.open(self.path, "at", encoding="utf-8") as recording:
+            recording.write(text)
+
+    async def async_flush(self) -> None:
+        """Append the replies buffered since the last flush and start the next poll."""
+        self.poll += 1
+        if not self._buffer:
+            return
+        lines, self._buffer = self._buffer, []
+        try:
+            await self.hass.async_add_executor_job(self._write, lines)
+        except (OSError, TypeError, ValueError) as err:
+            _LOGGER.debug("Could not write Solax response recording %s: %s", self.path, err)
+            self.errors += 1
+            return
+        self.records += len(lines)
+
+    def as_dict(self) -> dict:
+        return {
+            "enabled": True,
+            "file": self.path,
+            "max_bytes": self.max_bytes,
+            "backups": self.backups,
+            "records": self.records,
+            "rotations": self.rotations,
+            "errors": self.errors,
+        }
@@ -0,0 +1,21 @@
+def serial_suffix_index(serials) -> dict[str, tuple[str, ...]]:
+    """Index casefolded serials by their last `_`-separated token.
+
+    Unique IDs end with `_{serial}`, so the token after the last underscore of a
+    unique ID selects the only serials that can match it.
+    """
+    index = {}
+    for serial in serials:
+        serial_key = str(serial).casefold()
+        tail = serial_key.rsplit("_", 1)[-1]
+        index[tail] = (*index.get(tail, ()), serial_key)
+    return index
+
+
+def serial_for_unique_id(unique_id: str, index: dict[str, tuple[str, ...]]) -> str | None:
+    """Return the casefolded indexed serial a unique ID ends with, or None."""
+    unique_id = unique_id.casefold()
+    for serial_key in index.get(unique_id.rsplit("_", 1)[-1], ()):
+        if unique_id.endswith(f"_{serial_key}"):
+            return serial_key
+    return None
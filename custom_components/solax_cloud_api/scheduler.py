@@ -0,0 +1,129 @@
+import asyncio
+from collections import deque
+
+from .clock import SYSTEM_CLOCK, SolaxClock
+from .const import (
+    API_CALLS_PER_MINUTE_LIMIT,
+    API_QUOTA_SAFETY_FACTOR,
+    SCHEDULER_CALL_SPACING,
+)
+from .quota import SolaxApiCallCounter, token_fingerprint
+
+
+class SolaxRequestScheduler:
+    """Pace API calls of every config entry from one place.
+
+    Entries that share a token share its per-minute budget and its API call
+    counter. Calls of all tokens are additionally spaced apart, so entries whose
+    cycles happen to start together do not fire their requests at once.
+    """
+
+    def __init__(
+        self,
+        calls_per_minute: int | None = None,
+        spacing: float = SCHEDULER_CALL_SPACING,
+        clock: SolaxClock | None = None,
+    ):
+        self._calls_per_minute = calls_per_minute or int(
+            API_CALLS_PER_MINUTE_LIMIT * API_QUOTA_SAFETY_FACTOR
+        )
+        self._spacing = spacing
+        # Shared with the coordinators and call counters of every entry.
+        self.clock = clock or SYSTEM_CLOCK
+        self._entries = {}
+        self._inverters = {}
+        self._counters = {}
+        self._calls = {}
+        self._token_locks = {}
+        self._next_slot = 0.0
+        self.delayed_calls = 0
+        self.total_delay = 0.0
+
+    def register(
+        self, entry_id: str, token: str, inverters: list[str] | None = None
+    ) -> SolaxApiCallCounter:
+        """Attach an entry and return the call counter shared by its token.
+
+        `inverters` is the entry's live serial list; it is read, not copied, so
+        serials added or removed at runtime are counted against the token.
+        """
+        key = token_fingerprint(token)
+        self._entries[entry_id] = key
+        self._inverters[entry_id] = inverters if inverters is not None else []
+        if key not in self._counters:
+            self._counters[key] = SolaxApiCallCounter(clock=self.clock)
+        return self._counters[key]
+
+    def unregister(self, entry_id: str) -> bool:
+        """Detach an entry; return True when no entries are left."""
+        key = self._entries.pop(entry_id, None)
+        self._inverters.pop(entry_id, None)
+        if key is not None and key not in self._entries.values():
+            self._counters.pop(key, None)
+            self._calls.pop(key, None)
+            self._token_locks.pop(key, None)
+        return not self._entries
+
+    def api_call_counter(self, token: str) -> SolaxApiCallCounter | None:
+        return self._counters.get(token_fingerprint(token))
+
+    def entries_for_token(self, token: str) -> list[str]:
+        key = token_fingerprint(token)
+        return [entry_id for entry_id, entry_key in self._entries.items() if entry_key == key]
+
+    def inverter_count(self, token: str, exclude_entry_id: str | None = None) -> int:
+        """Serials polled with the token across its entries; they share one quota."""
+        return sum(
+            len(self._inverters[entry_id])
+            for entry_id in self.entries_for_token(token)
+            if entry_id != exclude_entry_id
+        )
+
+    def _recent_calls(self, key: str, now: float) -> deque:
+        calls = self._calls.setdefault(key, deque())
+        while calls and now - calls[0] >= 60:
+            calls.popleft()
+        return calls
+
+    def calls_last_minute(self, token: str) -> int:
+        key = token_fingerprint(token)
+        return len(self._recent_calls(key, self.clock.monotonic()))
+
+    def record(self, token: str, calls: int = 1) -> None:
+        """Count calls made outside `async_acquire` (e.g. the setup preflight)."""
+        key = token_fingerprint(token)
+        now = self.clock.monotonic()
+        self._recent_calls(key, now).extend([now] * calls)
+
+    async def async_acquire(self, token: str) -> float:
+        """Wait for the next free call slot of the token; return the seconds waited."""
+        key = token_fingerprint(token)
+        async with self._token_locks.setdefault(key, asyncio.Lock()):
+            now = self.clock.monotonic()
+            calls = self._recent_calls(key, now)
+            start = now
+            if len(calls) >= self._calls_per_minute:
+                start = calls[-self._calls_per_minute] + 60
+            start = max(start, self._next_slot)
+            self._next_slot = start + self._spacing
+            calls.append(start)
+            wait = start - now
+            if wait > 0:
+                self.delayed_calls += 1
+                self.total_delay += wait
+                await self.clock.sleep(wait)
+        return max(wait, 0.0)
+
+    def as_dict(self) -> dict:
+        tokens = {}
+        for key in self._entries.values():
+            tokens[key] = tokens.get(key, 0) + 1
+        return {
+            "entries": len(self._entries),
+            "tokens": len(tokens),
+            "entries_per_token": sorted(tokens.values(), reverse=True),
+            "calls_per_minute_budget": self._calls_per_minute,
+            "call_spacing_seconds": self._spacing,
+            "delayed_calls": self.delayed_calls,
+            "total_delay_seconds": round(self.total_delay, 1),
+        }
@@ -1,5 +1,5 @@
 import re
-from datetime import UTC, datetime, timedelta
+from datetime import datetime, timedelta
 from pathlib import Path
 
 from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
@@ -12,61 +12,51 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
 from homeassistant.util import slugify
 
+from .clock import SYSTEM_CLOCK
 from .const import (
+    API_CALLS_PER_DAY_LIMIT,
+    API_CALLS_PER_MINUTE_LIMIT,
     CONF_ENTITY_PREFIX,
-    CONF_INVERTERS,
+    CONF_ENTITY_PROFILE,
     CONF_SYSTEM_NAME,
     DEFAULT_ENTITY_PREFIX,
+    DEFAULT_ENTITY_PROFILE,
     DOMAIN,
+    ENTITY_PROFILE_FULL,
+    ENTITY_PROFILE_MINIMAL,
+    ENTITY_PROFILES,
     HIDDEN_SENSORS,
+    INTEGRATED_ENERGY_SOURCES,
     INVALID_ENTITY_PREFIXES,
     MAPPED_FIELDS,
+    MINIMAL_PROFILE_FIELDS,
     NUMERIC_FIELDS,
     RESULT_FIELDS,
 )
+from .energy import (
+    _daily_last_reset_utc,
+    _parse_timestamp,
+    _sample_key_and_dt,
+    _sample_local_date,
+)
+from .registry import serial_for_unique_id, serial_suffix_index
 
 
 async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
     return
 
 
-def _parse_timestamp(value):
-    if value in (None, ""):
-        return None
-    raw = str(value).strip()
-    if not raw:
-        return None
-
-    dt_obj = dt_util.parse_datetime(raw)
-    if dt_obj is None:
-        for fmt in ("%Y-%m-%d %H:%M:%S", "%Y/%m/%d %H:%M:%S"):
-            try:
-                dt_obj = datetime.strptime(raw, fmt)
-                break
-            except ValueError:
-                continue
-
-    if dt_obj is None:
-        return None
-
-    if dt_obj.tzinfo is None:
-        dt_obj = dt_obj.replace(tzinfo=UTC)
-    return dt_obj
-
-
-def _sample_key_and_dt(inverter_data):
-    upload_time = inverter_data.get("uploadTime")
-    utc_date_time = inverter_data.get("utcDateTime")
-    key_source = upload_time if upload_time not in (None, "") else utc_date_time
-    if key_source in (None, ""):
-        return None, None
-
-    sample_key = str(key_source).strip()
-    if not sample_key:
-        return None, None
-
-    sample_dt = _parse_timestamp(utc_date_time) or _parse_timestamp(upload_time)
-    return sample_key, sample_dt
+_INTEGRATED_ENERGY_LABELS = {
+    "pv1": "PV String 1",
+    "pv2": "PV String 2",
+    "pv3": "PV String 3",
+    "pv4": "PV String 4",
+    "grid_export": "Grid Export",
+    "grid_import": "Grid Import",
+    "eps1": "EPS Phase 1",
+    "eps2": "EPS Phase 2",
+    "eps3": "EPS Phase 3",
+}
 
 
 def _battery_power_for_direction(inverter_data, direction):
@@ -83,17 +73,17 @@ def _battery_power_for_direction(inverter_data, direction):
     return -power if power < 0 else 0.0
 
 
-def _sample_local_date(sample_dt):
-    if sample_dt is None:
-        return dt_util.as_local(dt_util.utcnow()).date()
-    return dt_util.as_local(sample_dt).date()
+def _clock(entity):
+    """Return the coordinator's time source (the system clock for bare coordinators)."""
+    return getattr(entity.coordinator, "clock", SYSTEM_CLOCK)
 
 
-def _daily_last_reset_utc(local_date):
-    if local_date is None:
-        return None
-    local_midnight = datetime.combine(local_date, datetime.min.time(), dt_util.DEFAULT_TIME_ZONE)
-    return dt_util.as_utc(local_midnight)
+def _lean_attributes(entity, attrs):
+    """Drop the entity's unrecorded (debug) attributes when lean mode is enabled."""
+    if not getattr(entity.coordinator, "lean_attributes", False):
+        return attrs
+    debug_attributes = type(entity)._unrecorded_attributes
+    return {key: value for key, value in attrs.items() if key not in debug_attributes}
 
 
 def _coerce_float(value):
@@ -171,45 +161,150 @@ async def _load_local_translations(hass, lang):
     return {f"component.{DOMAIN}.{key}": value for key, value in flattened.items()}
 
 
-def _cleanup_removed_inverter_artifacts(hass, entry, system_slug, inverters):
+def _cleanup_removed_inverter_artifacts(hass, entry, system_slug, inverters, removed=None):
+    """Drop registry entries of serials no longer configured.
+
+    With `removed`, only artifacts of those serials are touched; otherwise every
+    entry of the config entry is checked against the configured serials. Unique
+    IDs are resolved through a suffix index in one pass, and removals run after
+    the scan so the registry is not mutated while iterating.
+    """
     configured_casefold = {sn.casefold() for sn in inverters}
+    configured_index = serial_suffix_index(configured_casefold)
+    removed_casefold = None
+    removed_index = None
+    if removed is not None:
+        removed_casefold = {sn.casefold() for sn in removed} - configured_casefold
+        removed_index = serial_suffix_index(removed_casefold)
     slug_prefix = f"{system_slug}_".casefold()
     entity_registry = er.async_get(hass)
+    stale_entity_ids = []
     for reg_entry in er.async_entries_for_config_entry(entity_registry, entry.entry_id):
-        unique_id = reg_entry.unique_id or ""
-        unique_id_casefold = unique_id.casefold()
+        unique_id_casefold = (reg_entry.unique_id or "").casefold()
         if not unique_id_casefold.startswith(slug_prefix):
             continue
         # Keep system total sensors.
         if unique_id_casefold.endswith("_solax"):
             continue
-        has_serial_suffix = any(
-            unique_id_casefold.endswith(f"_{serial}") for serial in configured_casefold
-        )
-        if not has_serial_suffix:
-            entity_registry.async_remove(reg_entry.entity_id)
+        if serial_for_unique_id(unique_id_casefold, configured_index) is not None:
+            continue
+        if removed_index is not None and serial_for_unique_id(
+            unique_id_casefold, removed_index
+        ) is None:
+            continue
+        stale_entity_ids.append(reg_entry.entity_id)
 
     device_registry = dr.async_get(hass)
+    stale_device_ids = []
     for device in dr.async_entries_for_config_entry(device_registry, entry.entry_id):
-        domain_ids = [ident for ident in device.identifiers if ident[0] == DOMAIN]
-        if not domain_ids:
+        identifiers = [
+            identifier.casefold()
+            for domain, identifier in device.identifiers
+            if domain == DOMAIN
+        ]
+        if not identifiers:
             continue
-        removable = True
-        for _, identifier in domain_ids:
-            if identifier.startswith("system_totals_"):
-                removable = False
-                break
-            if identifier.casefold() in configured_casefold:
-                removable = False
-                break
-        if removable:
-            device_registry.async_remove_device(device.id)
+        if all(
+            not identifier.startswith("system_totals_")
+            and identifier not in configured_casefold
+            and (removed_casefold is None or identifier in removed_casefold)
+            for identifier in identifiers
+        ):
+            stale_device_ids.append(device.id)
+
+    # Registry writes are debounced, so the batch below is persisted once.
+    for entity_id in stale_entity_ids:
+        entity_registry.async_remove(entity_id)
+    for device_id in stale_device_ids:
+        device_registry.async_remove_device(device_id)
+
+
+SYSTEM_SENSOR_KEYS = [
+    "ac_total",
+    "dc_total",
+    "yieldtoday_total",
+    "yieldtotal_total",
+    "systemEfficiency",
+    "systemHealth",
+    "rateLimitStatus",
+    "lastPollAttempt",
+    "nextScheduledPoll",
+    "apiCallsMinute",
+    "apiCallsHour",
+    "apiCallsToday",
+]
+
+# System metric -> API call counter window.
+_API_CALL_WINDOWS = {
+    "apiCallsMinute": "minute",
+    "apiCallsHour": "hour",
+    "apiCallsToday": "day",
+}
+
+
+def _normalize_entity_profile(profile):
+    return profile if profile in ENTITY_PROFILES else DEFAULT_ENTITY_PROFILE
+
+
+def _entity_profile(entry):
+    return _normalize_entity_profile(entry.options.get(CONF_ENTITY_PROFILE))
+
+
+def _profile_includes(profile, key):
+    if profile != ENTITY_PROFILE_MINIMAL:
+        return True
+    kind = key[0]
+    if kind in ("api_status", "system"):
+        return True
+    return kind == "field" and key[2] in MINIMAL_PROFILE_FIELDS
+
+
+def _async_apply_full_profile_to_registry(entity_registry, entity, profile, previous):
+    """Enable or disable a default-disabled entity's registry entry for "full".
+
+    Only entries the integration disabled are enabled and only enabled entries
+    are disabled, so names, areas and entities the user disabled are kept.
+    Entities the user enabled outside the full profile are marked in the entry
+    options and stay enabled when leaving it. Returns True when the entry was
+    enabled; Home Assistant reloads the config entry 30 s after that.
+    """
+    entity_id = entity_registry.async_get_entity_id("sensor", DOMAIN, entity.unique_id)
+    registry_entry = entity_registry.async_get(entity_id) if entity_id else None
+    if registry_entry is None:
+        return False
+    options = registry_entry.options.get(DOMAIN, {})
+    user_enabled = bool(options.get("user_enabled"))
+    if previous != ENTITY_PROFILE_FULL and registry_entry.disabled_by is None and not user_enabled:
+        user_enabled = True
+        entity_registry.async_update_entity_options(
+            entity_id, DOMAIN, {**options, "user_enabled": True}
+        )
+    if profile == ENTITY_PROFILE_FULL or user_enabled:
+        if registry_entry.disabled_by is er.RegistryEntryDisabler.INTEGRATION:
+            entity_registry.async_update_entity(entity_id, disabled_by=None)
+            return True
+    elif registry_entry.disabled_by is None:
+        # Home Assistant removes the entity from the state machine once disabled.
+        entity_registry.async_update_entity(
+            entity_id, disabled_by=er.RegistryEntryDisabler.INTEGRATION
+        )
+    return False
+
+
+async def _async_retire_entity(hass, entity_registry, entity):
+    # Disabled entities were never added to hass but still own a registry entry.
+    if entity.hass is not None:
+        await entity.async_remove(force_remove=True)
+    entity_id = entity_registry.async_get_entity_id("sensor", DOMAIN, entity.unique_id)
+    if entity_id is not None:
+        entity_registry.async_remove(entity_id)
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
     data = hass.data[DOMAIN][entry.entry_id]
     coordinator = data["coordinator"]
-    inverters = entry.data.get(CONF_INVERTERS, [])
+    # Shared with the coordinator; inverters added or removed at runtime show up here.
+    inverters = coordinator.inverters
     system_name = entry.data.get(CONF_SYSTEM_NAME)
     if not system_name:
         raise ValueError("System name must be provided in integration setup")
@@ -234,72 +329,111 @@ async def async_setup_entry(hass, entry, async_add_entities):
         if f"entity.sensor.{inverter_type_key}.state." in k
     }
 
-    entities = []
-    created_field_entities = set()
-    created_dc_total_entities = set()
-    created_efficiency_entities = set()
-    created_estimated_battery_entities = set()
-    created_system_estimated_battery_entities = set()
-
-    # Always expose inverter API access status so invalid serials are visible in UI.
-    for sn in inverters:
-        human_name = (
-            get_translation_name(translations, DOMAIN, "apiAccessStatus")
-            or "API Access Status"
-        )
-        entities.append(
-            SolaxInverterApiAccessStatusSensor(
-                coordinator, sn, human_name, system_slug, translations, type_map
-            )
+    profile_state = {"profile": _entity_profile(entry)}
+    # Entities created so far keyed by kind/serial/metric, so profile changes can
+    # add or retire them incrementally.
+    created_entities = {}
+    default_disabled_keys = set()
+    # Casefolded serial -> fields seen with a value so far; discovery only runs
+    # for serials whose field set grows.
+    discovered_fields = {}
+
+    def _observe_fields(serial_key, inverter_data):
+        seen = discovered_fields.get(serial_key, frozenset())
+        if inverter_data.keys() <= seen:
+            return False
+        present = frozenset(k for k, v in inverter_data.items() if v is not None)
+        if present <= seen:
+            return False
+        discovered_fields[serial_key] = seen | present
+        return True
+
+    def _register_entity(key, entity, new_entities):
+        created_entities[key] = entity
+        if not entity.entity_registry_enabled_default:
+            default_disabled_keys.add(key)
+            if profile_state["profile"] == ENTITY_PROFILE_FULL:
+                entity._attr_entity_registry_enabled_default = True
+        new_entities.append(entity)
+
+    def _wants(key):
+        return key not in created_entities and _profile_includes(
+            profile_state["profile"], key
         )
 
-    def _build_new_field_entities():
+    def _build_new_status_entities():
+        # Always expose inverter API access status so invalid serials are visible in UI.
         new_entities = []
         for sn in inverters:
+            key = ("api_status", sn.casefold())
+            if not _wants(key):
+                continue
+            human_name = (
+                get_translation_name(translations, DOMAIN, "apiAccessStatus")
+                or "API Access Status"
+            )
+            _register_entity(
+                key,
+                SolaxInverterApiAccessStatusSensor(
+                    coordinator, sn, human_name, system_slug, translations, type_map
+                ),
+                new_entities,
+            )
+        return new_entities
+
+    def _build_new_field_entities(serials=None):
+        new_entities = []
+        for sn in inverters if serials is None else serials:
             inverter_data = coordinator.data.get(sn)
             if not isinstance(inverter_data, dict) or inverter_data.get("error"):
                 continue
 
+            serial_key = sn.casefold()
+            _observe_fields(serial_key, inverter_data)
             for field in RESULT_FIELDS:
                 if inverter_data.get(field) is None:
                     continue
-                key = (sn.casefold(), field)
-                if key in created_field_entities:
+                key = ("field", serial_key, field)
+                if not _wants(key):
                     continue
-                created_field_entities.add(key)
                 human_name = get_translation_name(translations, DOMAIN, field)
-                new_entities.append(
+                _register_entity(
+                    key,
                     SolaxFieldSensor(
                         coordinator, sn, field, human_name, system_slug, translations, type_map
-                    )
+                    ),
+                    new_entities,
                 )
 
-            serial_key = sn.casefold()
-            if serial_key not in created_efficiency_entities:
-                created_efficiency_entities.add(serial_key)
+            key = ("efficiency", serial_key)
+            if _wants(key):
                 human_name = (
                     get_translation_name(translations, DOMAIN, "inverterEfficiency")
                     or "Inverter Efficiency"
                 )
-                new_entities.append(
+                _register_entity(
+                    key,
                     SolaxInverterEfficiencySensor(
                         coordinator, sn, human_name, system_slug, type_map
-                    )
+                    ),
+                    new_entities,
                 )
 
             has_dc_values = any(
                 inverter_data.get(f"powerdc{i}") is not None for i in range(1, 5)
             )
-            if has_dc_values and serial_key not in created_dc_total_entities:
-                created_dc_total_entities.add(serial_key)
+            key = ("dc_total", serial_key)
+            if has_dc_values and _wants(key):
                 human_name = (
                     get_translation_name(translations, DOMAIN, "dc_total_inverter")
                     or "DC Power Inverter Total"
                 )
-                new_entities.append(
+                _register_entity(
+                    key,
                     SolaxComputedSensor(
                         coordinator, sn, "dc_total", human_name, system_slug, type_map
-                    )
+                    ),
+                    new_entities,
                 )
 
             if inverter_data.get("batPower") is not None:
@@ -330,15 +464,15 @@ async def async_setup_entry(hass, entry, async_add_entities):
                     ),
                 )
                 for direction, period, translation_key, default_name in estimated_metrics:
-                    est_key = (serial_key, direction, period)
-                    if est_key in created_estimated_battery_entities:
+                    key = ("estimated_battery", serial_key, direction, period)
+                    if not _wants(key):
                         continue
-                    created_estimated_battery_entities.add(est_key)
                     human_name = (
                         get_translation_name(translations, DOMAIN, translation_key)
                         or default_name
                     )
-                    new_entities.append(
+                    _register_entity(
+                        key,
                         SolaxEstimatedBatteryEnergySensor(
                             coordinator=coordinator,
                             serial=sn,
@@ -347,10 +481,68 @@ async def async_setup_entry(hass, entry, async_add_entities):
                             human_name=human_name,
                             system_slug=system_slug,
                             type_map=type_map,
+                        ),
+                        new_entities,
+                    )
+
+            for metric, (source_field, _sign) in INTEGRATED_ENERGY_SOURCES.items():
+                if inverter_data.get(source_field) is None:
+                    continue
+                for period in ("today", "total"):
+                    key = ("integrated_energy", serial_key, metric, period)
+                    if not _wants(key):
+                        continue
+                    default_name = (
+                        f"Estimated {_INTEGRATED_ENERGY_LABELS.get(metric, metric)} "
+                        f"Energy {period.title()}"
+                    )
+                    human_name = (
+                        get_translation_name(
+                            translations, DOMAIN, f"estimated_{metric}_energy_{period}"
                         )
+                        or default_name
+                    )
+                    _register_entity(
+                        key,
+                        SolaxIntegratedEnergySensor(
+                            coordinator=coordinator,
+                            serial=sn,
+                            metric=metric,
+                            period=period,
+                            human_name=human_name,
+                            system_slug=system_slug,
+                            type_map=type_map,
+                        ),
+                        new_entities,
                     )
         return new_entities
 
+    def _build_new_system_total_entities():
+        new_entities = []
+        for metric in SYSTEM_SENSOR_KEYS:
+            key = ("system", metric)
+            if not _wants(key):
+                continue
+            human_name = get_translation_name(translations, DOMAIN, metric) or metric.replace(
+                "_", " "
+            ).title()
+            legacy_entity_name = f"{system_name} {human_name}"
+            _register_entity(
+                key,
+                SolaxSystemTotalSensor(
+                    coordinator,
+                    inverters,
+                    metric,
+                    human_name,
+                    system_name,
+                    system_slug,
+                    translations,
+                    legacy_entity_name,
+                ),
+                new_entities,
+            )
+        return new_entities
+
     def _build_new_system_estimated_entities():
         has_battery_data = False
         for sn in inverters:
@@ -392,16 +584,16 @@ async def async_setup_entry(hass, entry, async_add_entities):
             ),
         )
         for direction, period, translation_key, default_name in estimated_metrics:
-            metric_key = f"{direction}_{period}"
-            if metric_key in created_system_estimated_battery_entities:
+            key = ("system_estimated_battery", direction, period)
+            if not _wants(key):
                 continue
-            created_system_estimated_battery_entities.add(metric_key)
             human_name = (
                 get_translation_name(translations, DOMAIN, translation_key)
                 or default_name
             )
             legacy_entity_name = f"{system_name} {human_name}"
-            new_entities.append(
+            _register_entity(
+                key,
                 SolaxSystemEstimatedBatteryEnergySensor(
                     coordinator=coordinator,
                     inverters=inverters,
@@ -411,57 +603,111 @@ async def async_setup_entry(hass, entry, async_add_entities):
                     system_name=system_name,
                     system_slug=system_slug,
                     legacy_entity_name=legacy_entity_name,
-                )
+                ),
+                new_entities,
             )
         return new_entities
 
-    # Create field/DC sensors that are available right now.
-    entities.extend(_build_new_field_entities())
-
-    system_sensor_keys = [
-        "ac_total",
-        "dc_total",
-        "yieldtoday_total",
-        "yieldtotal_total",
-        "systemEfficiency",
-        "systemHealth",
-        "rateLimitStatus",
-        "lastPollAttempt",
-        "nextScheduledPoll",
-    ]
-    for key in system_sensor_keys:
-        human_name = get_translation_name(translations, DOMAIN, key) or key.replace(
-            "_", " "
-        ).title()
-        legacy_entity_name = f"{system_name} {human_name}"
-        entities.append(
-            SolaxSystemTotalSensor(
-                coordinator,
-                inverters,
-                key,
-                human_name,
-                system_name,
-                system_slug,
-                translations,
-                legacy_entity_name,
-            )
-        )
-    entities.extend(_build_new_system_estimated_entities())
+    def _build_new_entities():
+        new_entities = _build_new_status_entities()
+        new_entities.extend(_build_new_field_entities())
+        new_entities.extend(_build_new_system_total_entities())
+        new_entities.extend(_build_new_system_estimated_entities())
+        return new_entities
 
-    async_add_entities(entities, update_before_add=True)
+    async_add_entities(_build_new_entities())
 
     def _handle_coordinator_update():
         # Add newly available field/DC sensors without requiring an integration reload.
-        new_entities = _build_new_field_entities()
+        grown = []
+        for sn in inverters:
+            inverter_data = coordinator.data.get(sn)
+            if not isinstance(inverter_data, dict) or inverter_data.get("error"):
+                continue
+            if _observe_fields(sn.casefold(), inverter_data):
+                grown.append(sn)
+        if not grown:
+            return
+        new_entities = _build_new_field_entities(grown)
         new_entities.extend(_build_new_system_estimated_entities())
         if new_entities:
-            async_add_entities(new_entities, update_before_add=True)
+            async_add_entities(new_entities)
+
+    async def _async_apply_entity_profile(profile):
+        profile = _normalize_entity_profile(profile)
+        previous = profile_state["profile"]
+        if profile == previous:
+            return
+        profile_state["profile"] = profile
+
+        # Registry entries are kept so user customisations survive profile
+        # switches. Entities leaving the profile only leave the state machine and
+        # come back through async_add_entities: re-enabling a registry entry makes
+        # Home Assistant reload the whole entry. Only "full" toggles disabled_by,
+        # for the default-disabled entities it shows.
+        entity_registry = er.async_get(hass)
+        applied = set(created_entities)
+        for key in applied:
+            entity = created_entities[key]
+            enabled = key in default_disabled_keys and _async_apply_full_profile_to_registry(
+                entity_registry, entity, profile, previous
+            )
+            if _profile_includes(profile, key) and not enabled:
+                continue
+            # Disabled entities were never added; enabled ones are rebuilt to add them.
+            if entity.hass is not None:
+                await entity.async_remove(force_remove=True)
+            default_disabled_keys.discard(key)
+            del created_entities[key]
+
+        new_entities = _build_new_entities()
+        # Entries of default-disabled entities entering the profile may exist already.
+        for key in created_entities.keys() - applied:
+            if key in default_disabled_keys:
+                _async_apply_full_profile_to_registry(
+                    entity_registry, created_entities[key], profile, previous
+                )
+        if new_entities:
+            async_add_entities(new_entities)
+
+    async def _async_apply_removed_inverters(removed):
+        """Retire entities of removed serials; entities of new serials follow their data."""
+        removed_keys = {sn.casefold() for sn in removed}
+        for serial_key in removed_keys:
+            discovered_fields.pop(serial_key, None)
+        entity_registry = er.async_get(hass)
+        state_store = getattr(coordinator, "state_store", None)
+        retired = [
+            key
+            for key in created_entities
+            if key[0] not in ("system", "system_estimated_battery") and key[1] in removed_keys
+        ]
+        for key in retired:
+            default_disabled_keys.discard(key)
+            entity = created_entities.pop(key)
+            await _async_retire_entity(hass, entity_registry, entity)
+            if state_store is not None:
+                state_store.async_forget("estimators", entity.unique_id)
+        if removed:
+            _cleanup_removed_inverter_artifacts(
+                hass, entry, system_slug, inverters, removed=removed
+            )
+
+        new_entities = _build_new_entities()
+        if new_entities:
+            async_add_entities(new_entities)
 
     entry.async_on_unload(coordinator.async_add_listener(_handle_coordinator_update))
+    data["apply_entity_profile"] = _async_apply_entity_profile
+    data["apply_removed_inverters"] = _async_apply_removed_inverters
 
 
 class SolaxFieldSensor(CoordinatorEntity, SensorEntity):
     _attr_has_entity_name = False
+    # Per-update debug attributes; the raw mapped value stays recorded.
+    _unrecorded_attributes = frozenset(
+        {"last_update_raw", "utc_date_time", *(f"{field}_text" for field in MAPPED_FIELDS)}
+    )
 
     def __init__(
         self, coordinator, serial, field, human_name, system_slug, translations, type_map
@@ -535,7 +781,7 @@ class SolaxFieldSensor(CoordinatorEntity, SensorEntity):
         if not inv or not isinstance(inv, dict) or inv.get("error"):
             return None
         sample_dt = _sample_key_and_dt(inv)[1]
-        local_date = _sample_local_date(sample_dt)
+        local_date = _sample_local_date(sample_dt, _clock(self))
         return _daily_last_reset_utc(local_date)
 
     @property
@@ -573,11 +819,14 @@ class SolaxFieldSensor(CoordinatorEntity, SensorEntity):
 
         attrs["last_update_raw"] = inv.get("uploadTime")
         attrs["utc_date_time"] = inv.get("utcDateTime")
-        return attrs
+        return _lean_attributes(self, attrs)
 
 
 class SolaxInverterApiAccessStatusSensor(CoordinatorEntity, SensorEntity):
     _attr_has_entity_name = False
+    _unrecorded_attributes = frozenset(
+        {"code", "exception", "last_update_raw", "utc_date_time"}
+    )
 
     def __init__(self, coordinator, serial, human_name, system_slug, translations, type_map):
         super().__init__(coordinator)
@@ -659,7 +908,7 @@ class SolaxInverterApiAccessStatusSensor(CoordinatorEntity, SensorEntity):
                 attrs["last_update_raw"] = inv.get("uploadTime")
             if inv.get("utcDateTime"):
                 attrs["utc_date_time"] = inv.get("utcDateTime")
-        return attrs
+        return _lean_attributes(self, attrs)
 
 
 class SolaxInverterEfficiencySensor(CoordinatorEntity, SensorEntity):
@@ -765,6 +1014,9 @@ class SolaxComputedSensor(CoordinatorEntity, SensorEntity):
 
 class SolaxEstimatedBatteryEnergySensor(CoordinatorEntity, SensorEntity, RestoreEntity):
     _attr_has_entity_name = False
+    _unrecorded_attributes = frozenset(
+        {"calculation_source", "calculation_note", "direction", "period"}
+    )
     _attr_device_class = SensorDeviceClass.ENERGY
     _attr_native_unit_of_measurement = "kWh"
 
@@ -797,25 +1049,36 @@ class SolaxEstimatedBatteryEnergySensor(CoordinatorEntity, SensorEntity, Restore
         self._today_date = None
         self._last_sample_key = None
         self._last_sample_dt = None
-        self._last_bat_power = None
 
     async def async_added_to_hass(self):
         await super().async_added_to_hass()
-        last_state = await self.async_get_last_state()
-        if last_state is None:
-            return
-
-        attrs = dict(last_state.attributes or {})
+        store = getattr(self.coordinator, "state_store", None)
+        stored = store.restored("estimators", self.unique_id) if store is not None else None
+        if stored is not None:
+            self._restore_snapshot(stored)
+        else:
+            last_state = await self.async_get_last_state()
+            if last_state is not None:
+                # Migrate accumulators that older versions kept in state attributes.
+                self._restore_snapshot(dict(last_state.attributes or {}), last_state.state)
+
+        if store is not None:
+            self.async_on_remove(
+                store.async_register("estimators", self.unique_id, self._snapshot)
+            )
+            if stored is None:
+                store.async_schedule_save()
 
+    def _restore_snapshot(self, attrs, state_value=None):
         restored_total = _coerce_float(attrs.get("total_kwh"))
         if restored_total is None and self._period == "total":
-            restored_total = _coerce_float(last_state.state)
+            restored_total = _coerce_float(state_value)
         if restored_total is not None:
             self._total_kwh = max(restored_total, 0.0)
 
         restored_baseline = _coerce_float(attrs.get("today_baseline_kwh"))
         if restored_baseline is None and self._period == "today":
-            restored_today = _coerce_float(last_state.state)
+            restored_today = _coerce_float(state_value)
             if restored_today is not None:
                 restored_baseline = max(self._total_kwh - restored_today, 0.0)
         if restored_baseline is not None:
@@ -833,15 +1096,21 @@ class SolaxEstimatedBatteryEnergySensor(CoordinatorEntity, SensorEntity, Restore
         if restored_sample_dt is not None:
             self._last_sample_dt = restored_sample_dt
 
-        if "last_bat_power_w" in attrs:
-            self._last_bat_power = attrs.get("last_bat_power_w")
+    def _snapshot(self):
+        return {
+            "total_kwh": round(self._total_kwh, 6),
+            "today_baseline_kwh": round(self._today_baseline_kwh, 6),
+            "today_date": self._today_date.isoformat() if self._today_date else None,
+            "last_sample_key": self._last_sample_key,
+            "last_sample_dt": self._last_sample_dt.isoformat() if self._last_sample_dt else None,
+        }
 
     def _update_estimate(self, inverter_data):
         sample_key, sample_dt = _sample_key_and_dt(inverter_data)
         if sample_key is None:
             return
 
-        current_local_date = _sample_local_date(sample_dt)
+        current_local_date = _sample_local_date(sample_dt, _clock(self))
         if self._today_date is None:
             self._today_date = current_local_date
             self._today_baseline_kwh = self._total_kwh
@@ -852,11 +1121,9 @@ class SolaxEstimatedBatteryEnergySensor(CoordinatorEntity, SensorEntity, Restore
         if self._last_sample_key is None:
             self._last_sample_key = sample_key
             self._last_sample_dt = sample_dt
-            self._last_bat_power = inverter_data.get("batPower")
             return
 
         if sample_key == self._last_sample_key:
-            self._last_bat_power = inverter_data.get("batPower")
             return
 
         direction_power = _battery_power_for_direction(inverter_data, self._direction)
@@ -871,7 +1138,6 @@ class SolaxEstimatedBatteryEnergySensor(CoordinatorEntity, SensorEntity, Restore
 
         self._last_sample_key = sample_key
         self._last_sample_dt = sample_dt
-        self._last_bat_power = inverter_data.get("batPower")
 
     @property
     def native_value(self):
@@ -925,27 +1191,131 @@ class SolaxEstimatedBatteryEnergySensor(CoordinatorEntity, SensorEntity, Restore
 
     @property
     def extra_state_attributes(self):
+        return _lean_attributes(
+            self,
+            {
+                "is_estimated": True,
+                "calculation_source": "batPower",
+                "calculation_note": (
+                    "Estimated from batPower and inverter upload interval; values are approximate."
+                ),
+                "direction": self._direction,
+                "period": self._period,
+            },
+        )
+
+
+class SolaxIntegratedEnergySensor(CoordinatorEntity, SensorEntity):
+    """Estimated energy from the coordinator's batched power integration."""
+
+    _attr_has_entity_name = False
+    _unrecorded_attributes = frozenset(
+        {"calculation_source", "calculation_note", "metric", "period"}
+    )
+    _attr_device_class = SensorDeviceClass.ENERGY
+    _attr_native_unit_of_measurement = "kWh"
+
+    def __init__(
+        self, coordinator, serial, metric, period, human_name, system_slug, type_map
+    ):
+        super().__init__(coordinator)
+        self._serial = serial
+        self._metric = metric
+        self._period = period
+        self._source_field = INTEGRATED_ENERGY_SOURCES[metric][0]
+        self._type_map = type_map
+        self._attr_name = human_name
+        self._attr_unique_id = (
+            f"{system_slug}_estimated_{metric}_energy_{period}_{serial}"
+            .lower()
+            .replace(" ", "_")
+        )
+        self.entity_id = (
+            f"sensor.{system_slug}_estimated_{metric}_energy_{period}_{serial}".lower()
+        )
+        self._attr_entity_registry_enabled_default = False
+        if self._period == "total":
+            self._attr_state_class = SensorStateClass.TOTAL_INCREASING
+        else:
+            self._attr_state_class = SensorStateClass.TOTAL
+
+    def _integrator(self):
+        return getattr(self.coordinator, "energy_integrator", None)
+
+    @property
+    def available(self):
+        inverter_data = self.coordinator.data.get(self._serial)
+        if not inverter_data or not isinstance(inverter_data, dict):
+            return False
+        if inverter_data.get("error"):
+            return False
+        return (
+            self._integrator() is not None
+            and inverter_data.get(self._source_field) is not None
+        )
+
+    @property
+    def native_value(self):
+        if not self.available:
+            return None
+        integrator = self._integrator()
+        if self._period == "total":
+            return round(integrator.total_kwh(self._serial, self._metric), 5)
+        return round(integrator.today_kwh(self._serial, self._metric), 5)
+
+    @property
+    def last_reset(self):
+        if self._period != "today":
+            return None
+        integrator = self._integrator()
+        if integrator is None:
+            return None
+        return _daily_last_reset_utc(integrator.today_date(self._serial))
+
+    @property
+    def device_info(self):
+        inverter_data = self.coordinator.data.get(self._serial)
+        inverter_sn = inverter_data.get("inverterSN") if isinstance(inverter_data, dict) else None
+        inverter_type_val = (
+            inverter_data.get("inverterType") if isinstance(inverter_data, dict) else None
+        )
+
+        model = "Unknown"
+        if inverter_type_val is not None:
+            model = self._type_map.get(str(inverter_type_val), str(inverter_type_val))
+
         return {
-            "is_estimated": True,
-            "calculation_source": "batPower",
-            "calculation_note": (
-                "Estimated from batPower and inverter upload interval; values are approximate."
-            ),
-            "direction": self._direction,
-            "period": self._period,
-            "total_kwh": round(self._total_kwh, 5),
-            "last_sample_key": self._last_sample_key,
-            "last_sample_dt": self._last_sample_dt.isoformat() if self._last_sample_dt else None,
-            "today_baseline_kwh": round(self._today_baseline_kwh, 5),
-            "today_date": self._today_date.isoformat() if self._today_date else None,
-            "last_bat_power_w": self._last_bat_power,
+            "identifiers": {(DOMAIN, self._serial)},
+            "name": f"Solax Inverter {self._serial}",
+            "manufacturer": "Solax",
+            "model": model,
+            "serial_number": inverter_sn or self._serial,
         }
 
+    @property
+    def extra_state_attributes(self):
+        return _lean_attributes(
+            self,
+            {
+                "is_estimated": True,
+                "calculation_source": self._source_field,
+                "calculation_note": (
+                    f"Estimated from {self._source_field} and inverter upload interval; "
+                    "values are approximate."
+                ),
+                "metric": self._metric,
+                "period": self._period,
+            },
+        )
+
 
 class SolaxSystemEstimatedBatteryEnergySensor(
     CoordinatorEntity, SensorEntity, RestoreEntity
 ):
     _attr_has_entity_name = False
+    _unrecorded_attributes = frozenset(
+        {"calculation_source", "calculation_note", "direction", "period"}
+    )
     _attr_device_class = SensorDeviceClass.ENERGY
     _attr_native_unit_of_measurement = "kWh"
 
@@ -984,15 +1354,27 @@ class SolaxSystemEstimatedBatteryEnergySensor(
 
     async def async_added_to_hass(self):
         await super().async_added_to_hass()
-        last_state = await self.async_get_last_state()
-        if last_state is None:
-            return
-
-        attrs = dict(last_state.attributes or {})
+        store = getattr(self.coordinator, "state_store", None)
+        stored = store.restored("estimators", self.unique_id) if store is not None else None
+        if stored is not None:
+            self._restore_snapshot(stored)
+        else:
+            last_state = await self.async_get_last_state()
+            if last_state is not None:
+                # Migrate accumulators that older versions kept in state attributes.
+                self._restore_snapshot(dict(last_state.attributes or {}), last_state.state)
+
+        if store is not None:
+            self.async_on_remove(
+                store.async_register("estimators", self.unique_id, self._snapshot)
+            )
+            if stored is None:
+                store.async_schedule_save()
 
+    def _restore_snapshot(self, attrs, state_value=None):
         restored_total = _coerce_float(attrs.get("total_kwh"))
         if restored_total is None:
-            restored_state = _coerce_float(last_state.state)
+            restored_state = _coerce_float(state_value)
             if self._period == "total":
                 restored_total = restored_state
             elif restored_state is not None:
@@ -1003,7 +1385,7 @@ class SolaxSystemEstimatedBatteryEnergySensor(
 
         restored_baseline = _coerce_float(attrs.get("today_baseline_kwh"))
         if restored_baseline is None and self._period == "today":
-            restored_today = _coerce_float(last_state.state)
+            restored_today = _coerce_float(state_value)
             if restored_today is not None:
                 restored_baseline = max(self._total_kwh - restored_today, 0.0)
         if restored_baseline is not None:
@@ -1026,6 +1408,24 @@ class SolaxSystemEstimatedBatteryEnergySensor(
             if parsed_state:
                 self._serial_state = parsed_state
 
+    def _snapshot(self):
+        serial_snapshot = {}
+        for serial, snapshot in self._serial_state.items():
+            if not isinstance(snapshot, dict):
+                continue
+            serial_snapshot[serial] = {
+                "sample_key": snapshot.get("sample_key"),
+                "sample_dt": snapshot.get("sample_dt").isoformat()
+                if snapshot.get("sample_dt")
+                else None,
+            }
+        return {
+            "total_kwh": round(self._total_kwh, 6),
+            "today_baseline_kwh": round(self._today_baseline_kwh, 6),
+            "today_date": self._today_date.isoformat() if self._today_date else None,
+            "serial_sample_state": serial_snapshot,
+        }
+
     @property
     def device_info(self):
         total_inverters = len(self._inverters)
@@ -1085,7 +1485,7 @@ class SolaxSystemEstimatedBatteryEnergySensor(
             serial_state["sample_key"] = sample_key
             serial_state["sample_dt"] = sample_dt
 
-        current_local_date = newest_local_date or dt_util.as_local(dt_util.utcnow()).date()
+        current_local_date = newest_local_date or dt_util.as_local(_clock(self).utcnow()).date()
         if self._today_date is None:
             self._today_date = current_local_date
             self._today_baseline_kwh = self._total_kwh
@@ -1132,35 +1532,35 @@ class SolaxSystemEstimatedBatteryEnergySensor(
                 and inverter_data.get("batPower") is not None
             ):
                 battery_inverters += 1
-        serial_snapshot = {}
-        for serial, snapshot in self._serial_state.items():
-            if not isinstance(snapshot, dict):
-                continue
-            serial_snapshot[serial] = {
-                "sample_key": snapshot.get("sample_key"),
-                "sample_dt": snapshot.get("sample_dt").isoformat()
-                if snapshot.get("sample_dt")
-                else None,
-            }
-        return {
-            "is_estimated": True,
-            "calculation_source": "batPower",
-            "calculation_note": (
-                "Estimated from batPower and inverter upload interval; values are approximate."
-            ),
-            "direction": self._direction,
-            "period": self._period,
-            "total_kwh": round(self._total_kwh, 5),
-            "battery_inverters_count": battery_inverters,
-            "serial_sample_state": serial_snapshot,
-            "today_baseline_kwh": round(self._today_baseline_kwh, 5),
-            "today_date": self._today_date.isoformat() if self._today_date else None,
-        }
+        return _lean_attributes(
+            self,
+            {
+                "is_estimated": True,
+                "calculation_source": "batPower",
+                "calculation_note": (
+                    "Estimated from batPower and inverter upload interval; values are approximate."
+                ),
+                "direction": self._direction,
+                "period": self._period,
+                "battery_inverters_count": battery_inverters,
+            },
+        )
 
 
 class SolaxSystemTotalSensor(CoordinatorEntity, SensorEntity):
     _attr_has_entity_name = False
-    _unrecorded_attributes = frozenset({"seconds_until_next_poll"})
+    _unrecorded_attributes = frozenset(
+        {
+            "seconds_until_next_poll",
+            "burst_until",
+            "burst_serials",
+            "rate_limited_details",
+            "last_rate_limit_at",
+            "error_breakdown",
+            "last_successful_refresh",
+            "seconds_since_last_successful_refresh",
+        }
+    )
 
     def __init__(
         self,
@@ -1194,6 +1594,9 @@ class SolaxSystemTotalSensor(CoordinatorEntity, SensorEntity):
             "rateLimitStatus": "rate_limit_status",
             "lastPollAttempt": "last_poll_attempt",
             "nextScheduledPoll": "next_scheduled_poll",
+            "apiCallsMinute": "api_calls_minute",
+            "apiCallsHour": "api_calls_hour",
+            "apiCallsToday": "api_calls_today",
         }
         self._attr_unique_id = f"{self._system_slug}_{metric_map[self._metric]}_solax"
 
@@ -1218,6 +1621,10 @@ class SolaxSystemTotalSensor(CoordinatorEntity, SensorEntity):
             self._attr_native_unit_of_measurement = None
             self._attr_entity_category = EntityCategory.DIAGNOSTIC
             self._attr_entity_registry_enabled_default = False
+        elif self._metric in _API_CALL_WINDOWS:
+            self._attr_state_class = SensorStateClass.MEASUREMENT
+            self._attr_native_unit_of_measurement = None
+            self._attr_entity_category = EntityCategory.DIAGNOSTIC
         else:
             self._attr_device_class = SensorDeviceClass.POWER
             self._attr_state_class = SensorStateClass.MEASUREMENT
@@ -1285,6 +1692,8 @@ class SolaxSystemTotalSensor(CoordinatorEntity, SensorEntity):
             return len(self._inverters) > 0
         if self._metric in ("lastPollAttempt", "nextScheduledPoll"):
             return len(self._inverters) > 0
+        if self._metric in _API_CALL_WINDOWS:
+            return getattr(self.coordinator, "api_call_counter", None) is not None
 
         for sn in self._inverters:
             inv = self.coordinator.data.get(sn)
@@ -1311,6 +1720,12 @@ class SolaxSystemTotalSensor(CoordinatorEntity, SensorEntity):
         if self._metric == "lastPollAttempt":
             return self.coordinator.last_update_attempt
 
+        if self._metric in _API_CALL_WINDOWS:
+            counter = getattr(self.coordinator, "api_call_counter", None)
+            if counter is None:
+                return None
+            return counter.count(_API_CALL_WINDOWS[self._metric])
+
         if self._metric == "nextScheduledPoll":
             if self.coordinator.last_update_attempt is None:
                 return None
@@ -1387,12 +1802,12 @@ class SolaxSystemTotalSensor(CoordinatorEntity, SensorEntity):
             ):
                 continue
             sample_dt = _sample_key_and_dt(inv)[1]
-            local_date = _sample_local_date(sample_dt)
+            local_date = _sample_local_date(sample_dt, _clock(self))
             if latest_local_date is None or local_date > latest_local_date:
                 latest_local_date = local_date
 
         if latest_local_date is None:
-            latest_local_date = dt_util.as_local(dt_util.utcnow()).date()
+            latest_local_date = dt_util.as_local(_clock(self).utcnow()).date()
 
         return _daily_last_reset_utc(latest_local_date)
 
@@ -1417,8 +1832,27 @@ class SolaxSystemTotalSensor(CoordinatorEntity, SensorEntity):
         if self._metric == "nextScheduledPoll":
             next_poll = self.native_value
             if next_poll is not None:
-                seconds_left = int((next_poll - dt_util.utcnow()).total_seconds())
+                seconds_left = int((next_poll - _clock(self).utcnow()).total_seconds())
                 attrs["seconds_until_next_poll"] = max(0, seconds_left)
+            update_interval = self.coordinator.update_interval
+            if update_interval is not None:
+                attrs["effective_scan_interval"] = int(update_interval.total_seconds())
+            burst = getattr(self.coordinator, "burst", None)
+            attrs["burst_active"] = burst is not None
+            if burst is not None:
+                attrs["burst_until"] = burst["until"].isoformat()
+                attrs["burst_serials"] = [
+                    sn for sn in self._inverters if sn.casefold() in burst["serials"]
+                ]
+
+        if self._metric == "apiCallsMinute":
+            attrs["limit"] = API_CALLS_PER_MINUTE_LIMIT
+
+        if self._metric == "apiCallsToday":
+            calls_today = self.native_value or 0
+            attrs["limit"] = API_CALLS_PER_DAY_LIMIT
+            attrs["remaining"] = max(API_CALLS_PER_DAY_LIMIT - calls_today, 0)
+            attrs["recommended_scan_interval"] = self.coordinator.recommended_scan_interval()
 
         if self._metric == "systemHealth":
             total, healthy, error_counts = self._health_counts()
@@ -1429,8 +1863,8 @@ class SolaxSystemTotalSensor(CoordinatorEntity, SensorEntity):
             attrs["error_breakdown"] = error_counts
 
             if self.coordinator.last_successful_update is not None:
-                now = dt_util.utcnow()
+                now = _clock(self).utcnow()
                 delta = now - self.coordinator.last_successful_update
                 attrs["last_successful_refresh"] = self.coordinator.last_successful_update.isoformat()
                 attrs["seconds_since_last_successful_refresh"] = int(delta.total_seconds())
-        return attrs
+        return _lean_attributes(self, attrs)
@@ -0,0 +1,46 @@
+import calendar
+import math
+from datetime import UTC, datetime
+
+
+def solar_elevation(when: datetime, latitude: float, longitude: float) -> float:
+    """Return the sun elevation in degrees using the NOAA general solar position formula.
+
+    Accuracy is well within a degree, which is plenty for day/night decisions and
+    needs no network lookup.
+    """
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=UTC)
+    when = when.astimezone(UTC)
+
+    days_in_year = 366 if calendar.isleap(when.year) else 365
+    hour = when.hour + when.minute / 60 + when.second / 3600
+    gamma = 2 * math.pi / days_in_year * (when.timetuple().tm_yday - 1 + (hour - 12) / 24)
+
+    eqtime = 229.18 * (
+        0.000075
+        + 0.001868 * math.cos(gamma)
+        - 0.032077 * math.sin(gamma)
+        - 0.014615 * math.cos(2 * gamma)
+        - 0.040849 * math.sin(2 * gamma)
+    )
+    declination = (
+        0.006918
+        - 0.399912 * math.cos(gamma)
+        + 0.070257 * math.sin(gamma)
+        - 0.006758 * math.cos(2 * gamma)
+        + 0.000907 * math.sin(2 * gamma)
+        - 0.002697 * math.cos(3 * gamma)
+        + 0.00148 * math.sin(3 * gamma)
+    )
+
+    # True solar time in minutes; UTC input means no timezone offset term.
+    true_solar_time = hour * 60 + eqtime + 4 * longitude
+    hour_angle = math.radians(true_solar_time / 4 - 180)
+
+    lat = math.radians(latitude)
+    cos_zenith = math.sin(lat) * math.sin(declination) + math.cos(lat) * math.cos(
+        declination
+    ) * math.cos(hour_angle)
+    cos_zenith = max(-1.0, min(1.0, cos_zenith))
+    return 90 - math.degrees(math.acos(cos_zenith))
@@ -0,0 +1,108 @@
+import logging
+from collections.abc import Callable
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, STORAGE_SAVE_DELAY, STORAGE_VERSION
+
+_LOGGER = logging.getLogger(__name__)
+
+STORE_SECTIONS = ("estimators", "integrator", "scheduler", "quota")
+
+
+class SolaxStateStore:
+    """Compact persistence for estimator accumulators, scheduler state and API call counts.
+
+    Owners register snapshot callbacks per section/key. Snapshots are only
+    built when the debounced save actually runs, so per-update bookkeeping is
+    limited to re-arming the save timer.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str):
+        self.hass = hass
+        self._store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}")
+        self._loaded = {section: {} for section in STORE_SECTIONS}
+        self._providers = {section: {} for section in STORE_SECTIONS}
+        self._unsub_stop = None
+
+    async def async_load(self) -> None:
+        try:
+            stored = await self._store.async_load()
+        except (HomeAssistantError, ValueError, OSError) as err:
+            _LOGGER.warning("Could not load stored Solax state, starting fresh: %s", err)
+            stored = None
+
+        if isinstance(stored, dict):
+            for section in STORE_SECTIONS:
+                section_data = stored.get(section)
+                if isinstance(section_data, dict):
+                    self._loaded[section] = section_data
+
+        if self._unsub_stop is None:
+            self._unsub_stop = self.hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_STOP, self._async_handle_stop
+            )
+
+    def restored(self, section: str, key: str) -> dict | None:
+        """Return the last persisted snapshot for a key, if any."""
+        value = self._loaded.get(section, {}).get(key)
+        return value if isinstance(value, dict) else None
+
+    @callback
+    def async_register(
+        self, section: str, key: str, snapshot: Callable[[], dict | None]
+    ) -> Callable[[], None]:
+        self._providers[section][key] = snapshot
+
+        @callback
+        def _unregister() -> None:
+            if self._providers[section].get(key) is snapshot:
+                # Keep the final snapshot so a reload restores the same values.
+                value = snapshot()
+                if value is not None:
+                    self._loaded[section][key] = value
+                self._providers[section].pop(key, None)
+
+        return _unregister
+
+    @callback
+    def async_forget(self, section: str, key: str) -> None:
+        """Drop persisted state for a retired entity or serial."""
+        self._providers[section].pop(key, None)
+        if self._loaded[section].pop(key, None) is not None:
+            self.async_schedule_save()
+
+    @callback
+    def async_schedule_save(self) -> None:
+        self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict:
+        data = {}
+        for section in STORE_SECTIONS:
+            section_data = dict(self._loaded[section])
+            for key, snapshot in self._providers[section].items():
+                value = snapshot()
+                if value is not None:
+                    section_data[key] = value
+            data[section] = section_data
+        return data
+
+    async def async_flush(self) -> None:
+        await self._store.async_save(self._data_to_save())
+
+    async def _async_handle_stop(self, _event: Event) -> None:
+        self._unsub_stop = None
+        await self.async_flush()
+
+    async def async_unload(self) -> None:
+        if self._unsub_stop is not None:
+            self._unsub_stop()
+            self._unsub_stop = None
+        await self.async_flush()
+
+    async def async_remove(self) -> None:
+        await self._store.async_remove()
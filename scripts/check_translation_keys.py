@@ -28,6 +28,9 @@ EXTRA_SENSOR_KEYS = (
     "rateLimitStatus",
     "lastPollAttempt",
     "nextScheduledPoll",
+    "apiCallsMinute",
+    "apiCallsHour",
+    "apiCallsToday",
     "apiAccessStatus",
     "yieldtoday_total",
     "yieldtotal_total",
@@ -39,6 +42,24 @@ EXTRA_SENSOR_KEYS = (
     "estimatedSystemBatteryChargeEnergyTotal",
     "estimatedSystemBatteryDischargeEnergyToday",
     "estimatedSystemBatteryDischargeEnergyTotal",
+    "estimatedPv1EnergyToday",
+    "estimatedPv1EnergyTotal",
+    "estimatedPv2EnergyToday",
+    "estimatedPv2EnergyTotal",
+    "estimatedPv3EnergyToday",
+    "estimatedPv3EnergyTotal",
+    "estimatedPv4EnergyToday",
+    "estimatedPv4EnergyTotal",
+    "estimatedGridExportEnergyToday",
+    "estimatedGridExportEnergyTotal",
+    "estimatedGridImportEnergyToday",
+    "estimatedGridImportEnergyTotal",
+    "estimatedEps1EnergyToday",
+    "estimatedEps1EnergyTotal",
+    "estimatedEps2EnergyToday",
+    "estimatedEps2EnergyTotal",
+    "estimatedEps3EnergyToday",
+    "estimatedEps3EnergyTotal",
 )
 
 
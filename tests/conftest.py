@@ -26,6 +26,8 @@ from solax_cloud_api.const import (  # noqa: E402
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
 )
+from simulator import SolaxCloudSimulator  # noqa: E402
+from virtual_clock import VirtualClock  # noqa: E402
 
 
 @pytest.fixture
@@ -126,3 +128,25 @@ def runtime_coordinator_stub():
         )
 
     return _factory
+
+
+@pytest.fixture
+def virtual_clock() -> VirtualClock:
+    """Clock for the coordinator, scheduler and estimators that sleeps instantly."""
+    return VirtualClock()
+
+
+@pytest.fixture
+async def solax_cloud(socket_enabled):
+    """Start local SolaX Cloud simulators; each call serves one on localhost."""
+    simulators = []
+
+    async def _start(*args, **kwargs) -> SolaxCloudSimulator:
+        simulator = SolaxCloudSimulator(*args, **kwargs)
+        await simulator.start()
+        simulators.append(simulator)
+        return simulator
+
+    yield _start
+    for simulator in simulators:
+        await simulator.close()
@@ -0,0 +1,317 @@
+"""Load test: run the integration against the local SolaX Cloud simulator at fleet scale.
+
+Usage (from the repository root)::
+
+    python -m tests.loadtest --fleets 10 100 1000 --cycles 3 > loadtest.json
+
+Each fleet size gets a fresh Home Assistant test instance with one config entry
+holding every serial, set up through the config entry like a real install so the
+coordinator and the sensor platform both run. The simulator serves from its own
+thread, so event-loop and CPU numbers only cover Home Assistant and the
+integration. Pacing sleeps return at once (through the injected clock) and the per-minute budget is lifted;
+the numbers describe integration overhead, not SolaX Cloud quota behaviour.
+Memory is measured in one extra cycle under tracemalloc so tracing does not
+skew the timings.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from contextlib import contextmanager
+import importlib
+import json
+from pathlib import Path
+import platform
+import resource
+import statistics
+import sys
+import threading
+import time
+import tracemalloc
+from types import SimpleNamespace
+
+ROOT = Path(__file__).resolve().parents[1]
+for path in (ROOT, ROOT / "custom_components", Path(__file__).resolve().parent):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from homeassistant.const import EVENT_STATE_CHANGED  # noqa: E402
+from homeassistant.helpers.entity import Entity  # noqa: E402
+from homeassistant.loader import DATA_CUSTOM_COMPONENTS  # noqa: E402
+from pytest_homeassistant_custom_component.common import (  # noqa: E402
+    MockConfigEntry,
+    async_test_home_assistant,
+)
+
+from simulator import SolaxCloudSimulator  # noqa: E402
+from solax_cloud_api.clock import SolaxClock  # noqa: E402
+
+DEFAULT_FLEETS = (10, 100, 1000)
+
+
+def _percentiles(samples: list[float]) -> dict:
+    """Return count, mean and p50/p90/p99/max of millisecond samples."""
+    if not samples:
+        return {"count": 0}
+    ordered = sorted(samples)
+
+    def _at(fraction: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(fraction * len(ordered)))], 3)
+
+    return {
+        "count": len(ordered),
+        "mean": round(statistics.fmean(ordered), 3),
+        "p50": _at(0.50),
+        "p90": _at(0.90),
+        "p99": _at(0.99),
+        "max": round(ordered[-1], 3),
+    }
+
+
+class _SimulatorThread:
+    """Serve a simulator from a private event loop in a daemon thread."""
+
+    def __init__(self, simulator: SolaxCloudSimulator):
+        self.simulator = simulator
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+
+    def __enter__(self) -> str:
+        self._thread.start()
+        return asyncio.run_coroutine_threadsafe(self.simulator.start(), self._loop).result()
+
+    def __exit__(self, *_exc) -> None:
+        asyncio.run_coroutine_threadsafe(self.simulator.close(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+
+class _LoopBusyMeter:
+    """Split event-loop wall time into time spent waiting in select() and the rest."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self._selector = loop._selector
+        self._select = self._selector.select
+        self.idle = 0.0
+
+    def __enter__(self):
+        def _select(timeout=None):
+            started = time.perf_counter()
+            try:
+                return self._select(timeout)
+            finally:
+                self.idle += time.perf_counter() - started
+
+        self._selector.select = _select
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self._selector.select = self._select
+
+
+@contextmanager
+def _counting_state_writes():
+    """Count Entity.async_write_ha_state calls while the block runs."""
+    counter = SimpleNamespace(writes=0)
+    original = Entity.async_write_ha_state
+
+    def _write(entity):
+        counter.writes += 1
+        original(entity)
+
+    Entity.async_write_ha_state = _write
+    try:
+        yield counter
+    finally:
+        Entity.async_write_ha_state = original
+
+
+def _ensure_integration_importable() -> None:
+    """Make `custom_components.solax_cloud_api` resolvable by the Home Assistant loader.
+
+    Under pytest, the plugin's own testing `custom_components` package is usually
+    imported first; the repository's directory is appended to its search path.
+    """
+    custom_components = importlib.import_module("custom_components")
+    path = str(ROOT / "custom_components")
+    if path not in list(custom_components.__path__):
+        custom_components.__path__.append(path)
+
+
+class _UnpacedClock(SolaxClock):
+    """Real time, but pacing delays return at once."""
+
+    async def sleep(self, delay: float) -> None:
+        await asyncio.sleep(0)
+
+
+def _time_requests(client, latencies: list[float]) -> None:
+    """Record the round trip of every HTTP request the client makes."""
+    post = client._post
+
+    async def _timed(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return await post(*args, **kwargs)
+        finally:
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    client._post = _timed
+
+
+async def _run_fleet(size: int, cycles: int, latency: tuple[float, float], seed: int) -> dict:
+    """Set up one entry with `size` serials and measure `cycles` refreshes."""
+    _ensure_integration_importable()
+    from custom_components.solax_cloud_api.const import (
+        CONF_API_ENDPOINTS,
+        CONF_ENTITY_PREFIX,
+        CONF_INVERTERS,
+        CONF_SCAN_INTERVAL,
+        CONF_SYSTEM_NAME,
+        CONF_TOKEN,
+        DOMAIN,
+        RUNTIME_SCHEDULER,
+    )
+    from custom_components.solax_cloud_api.scheduler import SolaxRequestScheduler
+
+    simulator = SolaxCloudSimulator(size, calls_per_minute=None, latency=latency, seed=seed)
+    with _SimulatorThread(simulator) as url:
+        async with async_test_home_assistant() as hass:
+            hass.data.pop(DATA_CUSTOM_COMPONENTS, None)
+            # Lift the shared budget and spacing; the load test is about overhead.
+            hass.data[RUNTIME_SCHEDULER] = SolaxRequestScheduler(
+                calls_per_minute=10**9, spacing=0, clock=_UnpacedClock()
+            )
+            entry = MockConfigEntry(
+                domain=DOMAIN,
+                title=f"Load test {size}",
+                data={
+                    CONF_TOKEN: "loadtest-token",
+                    CONF_INVERTERS: simulator.serials,
+                    CONF_SCAN_INTERVAL: 300,
+                    CONF_SYSTEM_NAME: f"Load test {size}",
+                    CONF_ENTITY_PREFIX: f"load_{size}",
+                },
+                options={CONF_API_ENDPOINTS: [url]},
+            )
+            entry.add_to_hass(hass)
+
+            state_changes = SimpleNamespace(count=0)
+
+            def _count_change(_event):
+                state_changes.count += 1
+
+            hass.bus.async_listen(EVENT_STATE_CHANGED, _count_change)
+            loop = asyncio.get_running_loop()
+
+            with _counting_state_writes() as writes:
+                setup_started = time.perf_counter()
+                assert await hass.config_entries.async_setup(entry.entry_id)
+                await hass.async_block_till_done()
+                setup_seconds = time.perf_counter() - setup_started
+
+                coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+                latencies: list[float] = []
+                _time_requests(coordinator.client, latencies)
+
+                results = []
+                for _ in range(cycles):
+                    writes.writes = 0
+                    state_changes.count = 0
+                    latencies.clear()
+                    cpu_started = time.process_time()
+                    with _LoopBusyMeter(loop) as meter:
+                        started = time.perf_counter()
+                        await coordinator.async_refresh()
+                        await hass.async_block_till_done()
+                        wall = time.perf_counter() - started
+                    results.append(
+                        {
+                            "wall_seconds": round(wall, 4),
+                            "loop_busy_seconds": round(wall - meter.idle, 4),
+                            "cpu_seconds": round(time.process_time() - cpu_started, 4),
+                            "state_writes": writes.writes,
+                            "state_changes": state_changes.count,
+                            "request_latency_ms": _percentiles(latencies),
+                        }
+                    )
+
+                tracemalloc.start()
+                await coordinator.async_refresh()
+                await hass.async_block_till_done()
+                traced_current, traced_peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+
+            entities = len(hass.states.async_entity_ids())
+            await hass.config_entries.async_unload(entry.entry_id)
+            await hass.async_block_till_done()
+            await hass.async_stop(force=True)
+
+    return {
+        "serials": size,
+        "entities": entities,
+        "setup_seconds": round(setup_seconds, 4),
+        "cycles": results,
+        "summary": {
+            "wall_seconds_mean": round(statistics.fmean(c["wall_seconds"] for c in results), 4),
+            "loop_busy_seconds_mean": round(
+                statistics.fmean(c["loop_busy_seconds"] for c in results), 4
+            ),
+            "state_writes_per_cycle": max(c["state_writes"] for c in results),
+        },
+        "memory": {
+            "tracemalloc_cycle_peak_bytes": traced_peak,
+            "tracemalloc_cycle_retained_bytes": traced_current,
+            "peak_rss_bytes": _peak_rss(),
+        },
+        "simulator": dict(simulator.stats),
+    }
+
+
+def _peak_rss() -> int:
+    """Process high-water RSS; ru_maxrss is KiB on Linux and bytes on macOS."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+async def _async_main(args: argparse.Namespace) -> dict:
+    fleets = []
+    for size in args.fleets:
+        fleets.append(
+            await _run_fleet(size, args.cycles, (args.latency_min / 1000, args.latency_max / 1000), args.seed)
+        )
+    manifest = json.loads((ROOT / "custom_components" / "solax_cloud_api" / "manifest.json").read_text())
+
+    return {
+        "integration_version": manifest["version"],
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cycles_per_fleet": args.cycles,
+        "simulated_latency_ms": [args.latency_min, args.latency_max],
+        "fleets": fleets,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fleets", type=int, nargs="+", default=list(DEFAULT_FLEETS))
+    parser.add_argument("--cycles", type=int, default=3, help="timed refreshes per fleet")
+    parser.add_argument("--latency-min", type=float, default=1.0, help="simulated ms")
+    parser.add_argument("--latency-max", type=float, default=5.0, help="simulated ms")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="write JSON here instead of stdout")
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(_async_main(args))
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
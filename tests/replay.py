@@ -0,0 +1,145 @@
+"""Replay a response recording through SolaxCoordinator on a virtual clock.
+
+A recording is what the "Record API responses" option writes: one gzip JSONL
+line per HTTP attempt, grouped by coordinator poll. Replaying it serves those
+replies instead of SolaX Cloud, poll by poll, with the clock moved to each
+poll's recorded start, so a day of field data runs through the coordinator and
+the entities in seconds::
+
+    replay = SolaxReplay.from_files(path)
+    coordinator = SolaxCoordinator(hass, "token", replay.serials, 300, clock=replay.clock)
+    with replay.installed():
+        await replay.async_run(coordinator.async_refresh)
+
+Serials in a recording are masked; replay gives each one an entity-safe alias
+(`REPLAY0001`, ...) and rewrites it in the replies. Pass `speed` to also wait
+out each recorded round trip, divided by that factor.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter, deque
+from collections.abc import Awaitable, Callable, Iterable
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+import gzip
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+from solax_cloud_api.client import SolaxCloudClient
+from virtual_clock import VirtualClock
+
+
+def read_recording(paths: Iterable[str | Path]) -> list[dict]:
+    """Return the lines of one or more recording files, in the order given."""
+    records = []
+    for path in paths:
+        with gzip.open(path, "rt", encoding="utf-8") as recording:
+            records.extend(json.loads(line) for line in recording if line.strip())
+    return records
+
+
+class SolaxReplay:
+    """Serve recorded SolaX Cloud replies to any client, one recorded poll at a time."""
+
+    def __init__(self, records: list[dict], *, speed: float | None = None):
+        polls: dict[int, list[dict]] = {}
+        for record in records:
+            polls.setdefault(record["poll"], []).append(record)
+        self.polls = list(polls.values())
+        self.speed = speed
+        self.aliases = {}
+        for record in records:
+            for masked in record["wifi_sn"].split(","):
+                self.aliases.setdefault(masked, f"REPLAY{len(self.aliases) + 1:04d}")
+        self._masked = {alias: masked for masked, alias in self.aliases.items()}
+        self.endpoints = list(dict.fromkeys(record["endpoint"] for record in records))
+        start = _parse_time(records[0]["time"]) if records else None
+        self.clock = VirtualClock(start - timedelta(seconds=1) if start else None)
+        self.position = 0
+        self.stats = Counter()
+        self._pending: dict[tuple[str, str], deque] = {}
+
+    @classmethod
+    def from_files(cls, *paths: str | Path, **kwargs) -> SolaxReplay:
+        """Load rotated files oldest first (`name.2.jsonl.gz`, `name.1...`, `name...`)."""
+        return cls(read_recording(paths), **kwargs)
+
+    @property
+    def serials(self) -> list[str]:
+        return list(self.aliases.values())
+
+    def _unmask(self, payload):
+        text = json.dumps(payload)
+        for masked, alias in self.aliases.items():
+            text = text.replace(json.dumps(masked)[1:-1], alias)
+        return json.loads(text)
+
+    async def _post(self, client, session, endpoint, path: str, wifi_sn: str):
+        key = (path, ",".join(self._masked.get(sn, sn) for sn in wifi_sn.split(",")))
+        queue = self._pending.get(key)
+        endpoint.requests += 1
+        loop = asyncio.get_running_loop()
+        if not queue:
+            self.stats["missing"] += 1
+            endpoint.record_failure("Not in recording", loop.time(), client.retry_after)
+            return None, {"error": "Not in recording"}
+        record = queue.popleft()
+        self.stats["replayed"] += 1
+        if self.speed:
+            await asyncio.sleep(record["elapsed_ms"] / 1000 / self.speed)
+        status = record["status"]
+        if status is None or status >= 500:
+            endpoint.record_failure(
+                record["response"].get("error", f"HTTP {status}"), loop.time(), client.retry_after
+            )
+        else:
+            endpoint.record_success(record["elapsed_ms"] / 1000)
+        return status, self._unmask(record["response"])
+
+    @contextmanager
+    def installed(self):
+        """Route every SolaxCloudClient request, and no probe, to this replay."""
+        replay = self
+
+        async def _post(client, session, endpoint, path, wifi_sn):
+            return await replay._post(client, session, endpoint, path, wifi_sn)
+
+        async def _probe(client, session, endpoint):
+            return None
+
+        with (
+            patch.object(SolaxCloudClient, "_post", _post),
+            patch.object(SolaxCloudClient, "_probe", _probe),
+        ):
+            yield self
+
+    async def async_step(self, refresh: Callable[[], Awaitable]) -> list[dict] | None:
+        """Serve the next recorded poll to `refresh()`; None once the recording is done."""
+        if self.position >= len(self.polls):
+            return None
+        records = self.polls[self.position]
+        self.position += 1
+        started = _parse_time(records[0]["time"])
+        if started > self.clock.now:
+            self.clock.advance((started - self.clock.now).total_seconds())
+        self._pending = {}
+        for record in records:
+            self._pending.setdefault((record["path"], record["wifi_sn"]), deque()).append(record)
+        await refresh()
+        self.stats["unused"] += sum(len(queue) for queue in self._pending.values())
+        self._pending = {}
+        return records
+
+    async def async_run(self, refresh: Callable[[], Awaitable]) -> int:
+        """Serve every remaining poll; return how many were replayed."""
+        polls = 0
+        while await self.async_step(refresh) is not None:
+            polls += 1
+        return polls
+
+
+def _parse_time(value: str) -> datetime:
+    return datetime.fromisoformat(value)
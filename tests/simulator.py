@@ -0,0 +1,329 @@
+"""Local SolaX Cloud simulator serving `realtimeInfo/get` for offline and load tests."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import random
+import time
+from collections import Counter, defaultdict, deque
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+from aiohttp import web
+
+from solax_cloud_api.const import API_BATCH_PATH, API_REALTIME_PATH
+
+RATE_LIMIT_WINDOW = 60
+# Longer than the client's request timeout, so an injected stall surfaces as a timeout.
+DEFAULT_TIMEOUT_DELAY = 20.0
+# Soft cap on replayed sample steps per serial; older history is skipped.
+_MAX_CATCH_UP_STEPS = 2 * 24 * 12
+
+_RATE_LIMIT_REPLIES = {
+    104: "Request calls within the current minute > threshold",
+    3: "Exceeded the maximum call threshold limit, suspend the request",
+}
+
+
+@dataclass(slots=True)
+class SimulatedInverter:
+    """Static plant description plus the rolling battery state of one synthetic serial."""
+
+    serial: str
+    inverter_sn: str
+    peak_power: float
+    strings: int
+    battery_capacity: float
+    base_load: float
+    yield_offset: float
+    soc: float = 50.0
+    stepped_at: float | None = None
+
+    @property
+    def has_battery(self) -> bool:
+        return self.battery_capacity > 0
+
+
+class SolaxCloudSimulator:
+    """Answer realtime requests with plausible solar, battery and grid values.
+
+    PV output follows a sine between sunrise and sunset (UTC hours) with seeded
+    cloud noise. Samples only advance on the `upload_interval` grid, like the
+    real cloud, so polls within one upload window return the same `uploadTime`.
+    Per-token call limits, 1003 serials, timeouts, 5xx replies and latency
+    jitter are all configurable; the seed makes every run reproducible.
+    """
+
+    def __init__(
+        self,
+        serials: int | Iterable[str] = 10,
+        *,
+        calls_per_minute: int | None = 10,
+        rate_limit_code: int = 104,
+        unauthorized: Iterable[str] = (),
+        timeout_rate: float = 0.0,
+        server_error_rate: float = 0.0,
+        latency: tuple[float, float] = (0.0, 0.0),
+        timeout_delay: float = DEFAULT_TIMEOUT_DELAY,
+        upload_interval: int = 300,
+        sunrise: float = 6.0,
+        sunset: float = 20.0,
+        battery_share: float = 0.5,
+        batch: bool = False,
+        seed: int = 0,
+        clock: Callable[[], float] = time.time,
+    ):
+        if rate_limit_code not in _RATE_LIMIT_REPLIES:
+            raise ValueError(f"Unsupported rate limit code: {rate_limit_code}")
+        self.calls_per_minute = calls_per_minute
+        self.rate_limit_code = rate_limit_code
+        self.unauthorized = {sn.casefold() for sn in unauthorized}
+        self.timeout_rate = timeout_rate
+        self.server_error_rate = server_error_rate
+        self.latency = latency
+        self.timeout_delay = timeout_delay
+        self.upload_interval = upload_interval
+        self.sunrise = sunrise
+        self.sunset = sunset
+        self.batch = batch
+        self.clock = clock
+        self.url: str | None = None
+        self.stats: Counter[str] = Counter()
+        self._rng = random.Random(seed)
+        self._seed = seed
+        self._calls: dict[str, deque[float]] = defaultdict(deque)
+        self._runner: web.AppRunner | None = None
+
+        if isinstance(serials, int):
+            serials = [f"SIM{index:06d}" for index in range(1, serials + 1)]
+        plant_rng = random.Random(seed)
+        self.inverters: dict[str, SimulatedInverter] = {}
+        for serial in serials:
+            with_battery = plant_rng.random() < battery_share
+            self.inverters[serial.casefold()] = SimulatedInverter(
+                serial=serial,
+                inverter_sn=f"INV{serial}",
+                peak_power=plant_rng.uniform(2500, 9000),
+                strings=plant_rng.choice((1, 2)),
+                battery_capacity=plant_rng.uniform(5000, 15000) if with_battery else 0.0,
+                base_load=plant_rng.uniform(250, 900),
+                yield_offset=plant_rng.uniform(500, 20000),
+                soc=plant_rng.uniform(20, 80),
+            )
+
+    @property
+    def serials(self) -> list[str]:
+        return [inverter.serial for inverter in self.inverters.values()]
+
+    # Physical model ---------------------------------------------------------
+
+    def _day_fraction(self, hour: float) -> float | None:
+        """Return the position within daylight (0..1), or None at night."""
+        if not self.sunrise <= hour < self.sunset:
+            return None
+        return (hour - self.sunrise) / (self.sunset - self.sunrise)
+
+    def _noise(self, inverter: SimulatedInverter, sample_at: float) -> float:
+        # Stable per serial and upload window, independent of request order.
+        return random.Random(f"{self._seed}:{inverter.serial}:{int(sample_at)}").uniform(0.7, 1.0)
+
+    def pv_power(self, inverter: SimulatedInverter, sample_at: float) -> float:
+        hour = (sample_at % 86400) / 3600
+        fraction = self._day_fraction(hour)
+        if fraction is None:
+            return 0.0
+        return inverter.peak_power * math.sin(math.pi * fraction) * self._noise(inverter, sample_at)
+
+    def load_power(self, inverter: SimulatedInverter, sample_at: float) -> float:
+        hour = (sample_at % 86400) / 3600
+        # Morning and evening peaks on top of the base load.
+        peaks = 0.8 * math.exp(-((hour - 7.5) ** 2) / 2) + 1.5 * math.exp(-((hour - 19) ** 2) / 3)
+        return inverter.base_load * (1 + peaks)
+
+    def yield_today(self, inverter: SimulatedInverter, sample_at: float) -> float:
+        """Closed-form kWh of the noiseless curve since sunrise (scaled by mean noise)."""
+        hour = (sample_at % 86400) / 3600
+        daylight = (self.sunset - self.sunrise) * 3600
+        if hour < self.sunrise:
+            return 0.0
+        fraction = min(1.0, (hour - self.sunrise) / (self.sunset - self.sunrise))
+        energy_ws = inverter.peak_power * 0.85 * daylight / math.pi * (1 - math.cos(math.pi * fraction))
+        return energy_ws / 3_600_000
+
+    def _battery_power(self, inverter: SimulatedInverter, surplus: float) -> float:
+        """Positive while charging, negative while discharging (SolaX sign convention)."""
+        if not inverter.has_battery:
+            return 0.0
+        max_rate = inverter.battery_capacity / 2
+        if surplus > 0 and inverter.soc < 100:
+            return min(surplus, max_rate)
+        if surplus < 0 and inverter.soc > 10:
+            return max(surplus, -max_rate)
+        return 0.0
+
+    def _advance_battery(self, inverter: SimulatedInverter, sample_at: float) -> None:
+        if not inverter.has_battery:
+            inverter.stepped_at = sample_at
+            return
+        step = self.upload_interval
+        start = inverter.stepped_at
+        if start is None or sample_at - start > _MAX_CATCH_UP_STEPS * step or sample_at < start:
+            start = sample_at - step
+        at = start + step
+        while at <= sample_at:
+            surplus = self.pv_power(inverter, at) - self.load_power(inverter, at)
+            power = self._battery_power(inverter, surplus)
+            inverter.soc = min(100.0, max(10.0, inverter.soc + power * step / 36 / inverter.battery_capacity))
+            at += step
+        inverter.stepped_at = sample_at
+
+    def sample(self, inverter: SimulatedInverter, now: float | None = None) -> dict:
+        """Build the `result` object for the latest upload window of a serial."""
+        now = self.clock() if now is None else now
+        sample_at = now - now % self.upload_interval
+        self._advance_battery(inverter, sample_at)
+        pv = self.pv_power(inverter, sample_at)
+        load = self.load_power(inverter, sample_at)
+        bat_power = self._battery_power(inverter, pv - load)
+        feed_in = pv - load - bat_power
+        days = sample_at / 86400
+        uploaded = datetime.fromtimestamp(sample_at, UTC)
+        per_string = pv / inverter.strings
+        result = {
+            "inverterSN": inverter.inverter_sn,
+            "sn": inverter.serial,
+            "acpower": round(pv - max(bat_power, 0) + max(-bat_power, 0), 1),
+            "yieldtoday": round(self.yield_today(inverter, sample_at), 1),
+            "yieldtotal": round(
+                inverter.yield_offset + days * inverter.peak_power * 0.004 + self.yield_today(inverter, sample_at),
+                1,
+            ),
+            "feedinpower": round(feed_in, 1),
+            "feedinenergy": round(inverter.yield_offset * 0.4 + days * inverter.peak_power * 0.0015, 2),
+            "consumeenergy": round(inverter.yield_offset * 0.3 + days * inverter.base_load * 0.012, 2),
+            "feedinpowerM2": 0.0,
+            "soc": round(inverter.soc) if inverter.has_battery else None,
+            "peps1": 0.0 if inverter.has_battery else None,
+            "peps2": None,
+            "peps3": None,
+            "inverterType": "3" if inverter.has_battery else "4",
+            "inverterStatus": "102" if pv > 0 or inverter.has_battery else "100",
+            "uploadTime": uploaded.strftime("%Y-%m-%d %H:%M:%S"),
+            "utcDateTime": uploaded.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "batPower": round(bat_power, 1) if inverter.has_battery else None,
+            "powerdc1": round(per_string, 1),
+            "powerdc2": round(per_string, 1) if inverter.strings > 1 else None,
+            "powerdc3": None,
+            "powerdc4": None,
+            "batStatus": "0" if inverter.has_battery else None,
+        }
+        return result
+
+    # HTTP ---------------------------------------------------------------------
+
+    def _take_call(self, token: str) -> bool:
+        """Record a call against the token's minute window; False when over the limit."""
+        if self.calls_per_minute is None:
+            return True
+        now = self.clock()
+        calls = self._calls[token]
+        while calls and calls[0] <= now - RATE_LIMIT_WINDOW:
+            calls.popleft()
+        if len(calls) >= self.calls_per_minute:
+            return False
+        calls.append(now)
+        return True
+
+    async def _gate(self, request: web.Request) -> web.Response | None:
+        """Apply latency, injected faults, token and rate checks shared by both paths."""
+        self.stats["requests"] += 1
+        low, high = self.latency
+        if high > 0:
+            await asyncio.sleep(self._rng.uniform(low, high))
+        if self.timeout_rate and self._rng.random() < self.timeout_rate:
+            self.stats["timeouts"] += 1
+            await asyncio.sleep(self.timeout_delay)
+        if self.server_error_rate and self._rng.random() < self.server_error_rate:
+            self.stats["server_errors"] += 1
+            return web.Response(status=503, text="Service Unavailable")
+        token = request.headers.get("tokenId")
+        if not token:
+            self.stats["token_invalid"] += 1
+            return web.json_response(
+                {"success": False, "code": 1001, "exception": "Interface Unauthorized"}
+            )
+        if not self._take_call(token):
+            self.stats["rate_limited"] += 1
+            return web.json_response(
+                {
+                    "success": False,
+                    "code": self.rate_limit_code,
+                    "exception": _RATE_LIMIT_REPLIES[self.rate_limit_code],
+                }
+            )
+        return None
+
+    def _lookup(self, serial: str) -> SimulatedInverter | None:
+        key = serial.casefold()
+        if key in self.unauthorized:
+            return None
+        return self.inverters.get(key)
+
+    async def _handle_root(self, _request: web.Request) -> web.Response:
+        self.stats["probes"] += 1
+        return web.Response(text="SolaX Cloud simulator")
+
+    async def _handle_realtime(self, request: web.Request) -> web.Response:
+        if (rejected := await self._gate(request)) is not None:
+            return rejected
+        serial = str((await request.json()).get("wifiSn", ""))
+        inverter = self._lookup(serial)
+        if inverter is None:
+            self.stats["unauthorized"] += 1
+            return web.json_response(
+                {"success": False, "code": 1003, "exception": "Data Unauthorized"}
+            )
+        self.stats["ok"] += 1
+        return web.json_response(
+            {"success": True, "code": 0, "exception": "Query success!", "result": self.sample(inverter)}
+        )
+
+    async def _handle_batch(self, request: web.Request) -> web.Response:
+        if not self.batch:
+            return web.Response(status=404, text="Not Found")
+        if (rejected := await self._gate(request)) is not None:
+            return rejected
+        serials = str((await request.json()).get("wifiSn", "")).split(",")
+        results = [
+            self.sample(inverter)
+            for serial in serials
+            if (inverter := self._lookup(serial.strip())) is not None
+        ]
+        self.stats["ok"] += 1
+        return web.json_response(
+            {"success": True, "code": 0, "exception": "Query success!", "result": results}
+        )
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get("/", self._handle_root)
+        app.router.add_post(API_REALTIME_PATH, self._handle_realtime)
+        app.router.add_post(API_BATCH_PATH, self._handle_batch)
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Serve the simulator and return its base URL."""
+        self._runner = web.AppRunner(self.app())
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound_host, bound_port = self._runner.addresses[0][:2]
+        self.url = f"http://{bound_host}:{bound_port}"
+        return self.url
+
+    async def close(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
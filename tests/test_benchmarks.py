@@ -0,0 +1,254 @@
+"""Micro-benchmarks for the code Home Assistant runs on every state write.
+
+Needs pytest-benchmark; the module is skipped without it. Compare against the
+stored baseline (per machine, under `tests/benchmarks/`)::
+
+    pytest tests/test_benchmarks.py --benchmark-only \
+        --benchmark-storage=tests/benchmarks --benchmark-compare \
+        --benchmark-compare-fail=mean:25%
+
+and refresh it on a release with `--benchmark-autosave` instead of the compare flags.
+Payloads come from the SolaX Cloud simulator, so fleets look like real ones.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from homeassistant.helpers import device_registry as dr  # noqa: E402
+from homeassistant.helpers import entity_registry as er  # noqa: E402
+
+from simulator import SolaxCloudSimulator  # noqa: E402
+from solax_cloud_api import sensor as sensor_platform  # noqa: E402
+from solax_cloud_api.const import DOMAIN  # noqa: E402
+
+_NOON = datetime(2026, 6, 21, 12, 0, tzinfo=UTC).timestamp()
+_FLEET_SIZES = (1, 10, 100)
+_TRANSLATIONS = {
+    f"component.{DOMAIN}.{key}": value
+    for key, value in sensor_platform._flatten_translations(
+        json.loads(
+            (
+                Path(sensor_platform.__file__).parent / "translations" / "en.json"
+            ).read_text(encoding="utf-8")
+        )
+    ).items()
+}
+
+
+class _BenchCoordinator:
+    """Coordinator stand-in holding one simulated payload per serial."""
+
+    def __init__(self, data: dict[str, dict]):
+        self.data = data
+        self.inverters = list(data)
+        self.last_update_success = True
+        self.rate_limited_inverters = []
+        self.rate_limited_details = {}
+        self.unauthorized_inverters = []
+        self.unauthorized_details = {}
+        self.last_rate_limit_at = None
+        self.last_update_attempt = None
+        self.last_successful_update = None
+        self.update_interval = None
+
+    def async_add_listener(self, _update_callback, _context=None):
+        return lambda: None
+
+
+def _fleet_samples(simulator: SolaxCloudSimulator, at: float) -> dict[str, dict]:
+    return {
+        inverter.serial: simulator.sample(inverter, at)
+        for inverter in simulator.inverters.values()
+    }
+
+
+@pytest.fixture
+def fleet(hass, mock_solax_entry, monkeypatch):
+    """Set up the sensor platform for a simulated fleet and return its entities."""
+    monkeypatch.setattr(
+        sensor_platform, "async_get_translations", AsyncMock(return_value=_TRANSLATIONS)
+    )
+
+    async def _setup(size: int):
+        simulator = SolaxCloudSimulator(size, battery_share=1.0)
+        coordinator = _BenchCoordinator(_fleet_samples(simulator, _NOON))
+        entry = mock_solax_entry(inverters=simulator.serials, entity_prefix=f"bench_{size}")
+        hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {"coordinator": coordinator}
+        added = []
+        await sensor_platform.async_setup_entry(
+            hass, entry, lambda entities, update_before_add=False: added.extend(entities)
+        )
+        return simulator, coordinator, entry, added
+
+    return _setup
+
+
+def _pick(entities, cls, **attrs):
+    for entity in entities:
+        if isinstance(entity, cls) and all(
+            getattr(entity, name) == value for name, value in attrs.items()
+        ):
+            return entity
+    raise AssertionError(f"No {cls.__name__} with {attrs}")
+
+
+def _write_state(entity):
+    """What a state write evaluates: the state and the attributes."""
+    return entity.native_value, entity.extra_state_attributes
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("field", ["acpower", "yieldtoday", "inverterStatus"])
+async def test_field_sensor_state_write(benchmark, fleet, field):
+    _simulator, _coordinator, _entry, entities = await fleet(1)
+    entity = _pick(entities, sensor_platform.SolaxFieldSensor, _field=field)
+
+    value, _attrs = benchmark(_write_state, entity)
+
+    assert value is not None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("size", _FLEET_SIZES)
+@pytest.mark.parametrize(
+    "metric", ["ac_total", "yieldtoday_total", "systemEfficiency", "systemHealth"]
+)
+async def test_system_total_state_write(benchmark, fleet, size, metric):
+    _simulator, _coordinator, _entry, entities = await fleet(size)
+    entity = _pick(entities, sensor_platform.SolaxSystemTotalSensor, _metric=metric)
+
+    value, attrs = benchmark(_write_state, entity)
+
+    assert value is not None
+    assert attrs["total_inverters"] == size
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("unauthorized", [False, True])
+async def test_api_access_status_key(benchmark, fleet, unauthorized):
+    _simulator, coordinator, _entry, entities = await fleet(10)
+    entity = _pick(entities, sensor_platform.SolaxInverterApiAccessStatusSensor)
+    if unauthorized:
+        coordinator.data[entity._serial] = {"error": "data_unauthorized", "code": 1003}
+
+    status = benchmark(entity._status_key)
+
+    assert status == ("serial_unauthorized" if unauthorized else "ok")
+
+
+@pytest.mark.parametrize(
+    ("sensor_key", "state_value"),
+    [("systemEfficiency", None), ("inverterStatus", "102"), ("inverterType", "999")],
+)
+def test_get_translation_name(benchmark, sensor_key, state_value):
+    name = benchmark(
+        sensor_platform.get_translation_name, _TRANSLATIONS, DOMAIN, sensor_key, state_value
+    )
+
+    assert name
+
+
+@pytest.mark.asyncio
+async def test_estimated_battery_update_estimate(benchmark, fleet):
+    simulator, _coordinator, _entry, entities = await fleet(1)
+    entity = _pick(
+        entities, sensor_platform.SolaxEstimatedBatteryEnergySensor, _direction="charge"
+    )
+    inverter = next(iter(simulator.inverters.values()))
+    samples = iter(simulator.sample(inverter, _NOON + step * 300) for step in range(10**6))
+    # Seed the first sample so every measured round takes the integration path.
+    entity._update_estimate(next(samples))
+
+    benchmark.pedantic(
+        entity._update_estimate, setup=lambda: ((next(samples),), {}), rounds=500
+    )
+
+    assert entity._total_kwh > 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("size", _FLEET_SIZES)
+async def test_system_estimated_battery_update_estimate(benchmark, fleet, size):
+    simulator, coordinator, _entry, entities = await fleet(size)
+    entity = _pick(
+        entities, sensor_platform.SolaxSystemEstimatedBatteryEnergySensor, _direction="charge"
+    )
+    cycles = iter(_fleet_samples(simulator, _NOON + step * 300) for step in range(10**6))
+
+    def _next_cycle():
+        coordinator.data = next(cycles)
+        return (), {}
+
+    _next_cycle()
+    entity._update_estimate()
+    benchmark.pedantic(entity._update_estimate, setup=_next_cycle, rounds=100)
+
+    assert entity._total_kwh > 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("size", _FLEET_SIZES)
+async def test_cleanup_removed_inverter_artifacts(benchmark, hass, fleet, size):
+    """Steady-state registry scan: every registered entity still belongs to the fleet."""
+    simulator, _coordinator, entry, entities = await fleet(size)
+    registry = er.async_get(hass)
+    for entity in entities:
+        if entity.unique_id:
+            registry.async_get_or_create(
+                "sensor", DOMAIN, entity.unique_id, config_entry=entry
+            )
+    registered = len(er.async_entries_for_config_entry(registry, entry.entry_id))
+
+    benchmark(
+        sensor_platform._cleanup_removed_inverter_artifacts,
+        hass,
+        entry,
+        f"bench_{size}",
+        simulator.serials,
+    )
+
+    assert len(er.async_entries_for_config_entry(registry, entry.entry_id)) == registered
+
+
+def _populate_registry(hass, entry, serials):
+    """Register a device and ten sensors per serial, like a full-profile fleet."""
+    entity_registry = er.async_get(hass)
+    device_registry = dr.async_get(hass)
+    for serial in serials:
+        device_registry.async_get_or_create(
+            config_entry_id=entry.entry_id, identifiers={(DOMAIN, serial)}
+        )
+        for metric in ("acpower", "yieldtoday", "yieldtotal", "powerdc1", "batpower"):
+            for unique_id in (f"bench_{metric}_{serial}", f"bench_estimated_{metric}_today_{serial}"):
+                entity_registry.async_get_or_create(
+                    "sensor", DOMAIN, unique_id.lower(), config_entry=entry
+                )
+
+
+@pytest.mark.asyncio
+async def test_cleanup_removed_inverters_from_2000_registry_entries(
+    benchmark, hass, mock_solax_entry
+):
+    """Dropping 50 of 200 serials from a 2000-entry registry, re-populated every round."""
+    serials = [f"SERIAL{i:03d}" for i in range(200)]
+    kept = serials[:150]
+    entry = mock_solax_entry(inverters=serials, entity_prefix="bench")
+    _populate_registry(hass, entry, serials)
+
+    benchmark.pedantic(
+        sensor_platform._cleanup_removed_inverter_artifacts,
+        args=(hass, entry, "bench", kept),
+        setup=lambda: _populate_registry(hass, entry, serials[150:]),
+        rounds=20,
+    )
+
+    registry = er.async_get(hass)
+    assert len(er.async_entries_for_config_entry(registry, entry.entry_id)) == 1500
@@ -0,0 +1,76 @@
+"""Shared on-disk response cache tests."""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from solax_cloud_api.cache import SolaxResponseCache
+from solax_cloud_api.coordinator import SolaxCoordinator
+
+_OK = {"success": True, "code": 0, "result": {"acpower": 900, "uploadTime": "2026-03-19 12:00:00"}}
+
+
+@pytest.mark.asyncio
+async def test_cache_reuses_fresh_responses_and_counts_hits(hass, tmp_path, monkeypatch):
+    """Responses younger than the TTL are served from disk; older ones are misses."""
+    cache = SolaxResponseCache(hass, str(tmp_path), ttl=60)
+    assert await cache.async_get("token", "SERIAL1") is None
+
+    await cache.async_put("token", "SERIAL1", _OK)
+    assert await cache.async_get("token", "serial1") == _OK
+    # Another token never sees the cached response.
+    assert await cache.async_get("other-token", "SERIAL1") is None
+
+    now = os.path.getmtime(next(tmp_path.glob("*.json")))
+    monkeypatch.setattr("solax_cloud_api.cache.time", SimpleNamespace(time=lambda: now + 120))
+    assert await cache.async_get("token", "SERIAL1") is None
+    assert cache.as_dict()["hits"] == 1
+    assert cache.as_dict()["misses"] == 3
+    assert cache.as_dict()["writes"] == 1
+
+
+def test_cache_writes_are_atomic_with_concurrent_writers(hass, tmp_path):
+    """Concurrent writers must always leave one complete JSON file behind."""
+    cache = SolaxResponseCache(hass, str(tmp_path), ttl=60)
+    path = cache._path("token", "SERIAL1")
+
+    def _writer(index):
+        for _ in range(50):
+            cache._write(path, {"success": True, "code": 0, "result": {"writer": index}})
+
+    threads = [threading.Thread(target=_writer, args=(index,)) for index in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    with open(path, encoding="utf-8") as cache_file:
+        assert json.load(cache_file)["response"]["result"]["writer"] in range(4)
+    assert [p.name for p in tmp_path.iterdir()] == [os.path.basename(path)]
+
+
+@pytest.mark.asyncio
+async def test_coordinator_checks_cache_before_calling_the_api(hass, tmp_path):
+    """A second entry polling the same serial reuses the first entry's response."""
+    first = SolaxCoordinator(
+        hass, "token", ["SERIAL1"], 120, response_cache=SolaxResponseCache(hass, str(tmp_path), 60)
+    )
+    second = SolaxCoordinator(
+        hass, "token", ["SERIAL1"], 120, response_cache=SolaxResponseCache(hass, str(tmp_path), 60)
+    )
+    for coordinator in (first, second):
+        coordinator._request_one = AsyncMock(return_value=_OK)
+
+    await first._async_update_data()
+    data = await second._async_update_data()
+
+    assert first._request_one.await_count == 1
+    assert second._request_one.await_count == 0
+    assert data["SERIAL1"]["acpower"] == 900
+    assert second.response_cache.as_dict()["hits"] == 1
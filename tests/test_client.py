@@ -0,0 +1,271 @@
+"""SolaX Cloud client tests (outcomes, batching, failover) against a local stand-in API."""
+
+from __future__ import annotations
+
+import asyncio
+import subprocess
+import sys
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from solax_cloud_api import client as client_module
+from solax_cloud_api.client import SolaxCloudClient, SolaxOutcome
+from solax_cloud_api.coordinator import SolaxCoordinator
+from virtual_clock import VirtualClock
+
+_SINGLE_PATH = "/api/v2/dataAccess/realtimeInfo/get"
+_BATCH_PATH = "/api/v2/dataAccess/batchRealtimeInfo/get"
+
+
+class _StandInApi:
+    """Answer realtime requests for a fixed set of known serials."""
+
+    def __init__(
+        self, known, *, batch_status=200, batch_reply=None, status=200, delay=0.0, failures=0
+    ):
+        self.known = {sn.casefold() for sn in known}
+        # Single-serial requests answered with a 503 before the API recovers.
+        self.failures = failures
+        self.batch_status = batch_status
+        self.batch_reply = batch_reply
+        self.status = status
+        self.delay = delay
+        self.single_requests = []
+        self.batch_requests = []
+        self.probes = 0
+
+    async def root(self, _request):
+        self.probes += 1
+        await asyncio.sleep(self.delay)
+        return web.Response(status=self.status, text="SolaX Cloud")
+
+    def _result(self, sn):
+        return {"sn": sn, "inverterSN": f"INV{sn}", "acpower": 100 + len(sn), "soc": None}
+
+    async def single(self, request):
+        sn = (await request.json())["wifiSn"]
+        self.single_requests.append(sn)
+        if self.status != 200 or len(self.single_requests) <= self.failures:
+            return web.Response(status=self.status if self.status != 200 else 503, text="down")
+        if sn.casefold() not in self.known:
+            return web.json_response({"success": False, "code": 1003, "exception": "Data Unauthorized"})
+        return web.json_response({"success": True, "code": 0, "result": self._result(sn)})
+
+    async def batch(self, request):
+        serials = (await request.json())["wifiSn"].split(",")
+        self.batch_requests.append(serials)
+        if self.batch_status != 200:
+            return web.Response(status=self.batch_status, text="not found")
+        if self.batch_reply is not None:
+            return web.json_response(self.batch_reply)
+        return web.json_response(
+            {
+                "success": True,
+                "code": 0,
+                "exception": "Query success!",
+                "result": [self._result(sn) for sn in serials if sn.casefold() in self.known],
+            }
+        )
+
+
+@pytest.fixture
+async def stand_in(socket_enabled):
+    """Serve the stand-in API on localhost."""
+    servers = []
+
+    async def _start(api):
+        app = web.Application()
+        app.router.add_get("/", api.root)
+        app.router.add_post(_SINGLE_PATH, api.single)
+        app.router.add_post(_BATCH_PATH, api.batch)
+        server = TestServer(app)
+        await server.start_server()
+        servers.append(server)
+        return server
+
+    yield _start
+    for server in servers:
+        await server.close()
+
+
+def _coordinator(hass, servers, serials, batch_size=1):
+    if not isinstance(servers, list):
+        servers = [servers]
+    return SolaxCoordinator(
+        hass,
+        "token",
+        serials,
+        120,
+        batch_size=batch_size,
+        api_endpoints=[str(server.make_url("/")) for server in servers],
+        # Pacing sleeps return at once.
+        clock=VirtualClock(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_batches_are_split_into_per_serial_results(hass, stand_in):
+    """Chunks of serials go out as one call each; missing serials fall back to single calls."""
+    api = _StandInApi(["SN1", "SN2", "SN3", "SN4"])
+    server = await stand_in(api)
+    coordinator = _coordinator(hass, server, ["SN1", "SN2", "BAD1", "SN3", "SN4"], 3)
+
+    data = await coordinator._async_update_data()
+
+    assert api.batch_requests == [["SN1", "SN2", "BAD1"], ["SN3", "SN4"]]
+    assert api.single_requests == ["BAD1"]
+    assert data["SN1"]["acpower"] == 103
+    assert "soc" not in data["SN4"]
+    assert data["BAD1"]["error"] == "data_unauthorized"
+    assert coordinator.unauthorized_inverters == ["BAD1"]
+    assert coordinator.api_call_counter.count("minute") == 3
+    assert coordinator.client.batch_supported is True
+
+
+@pytest.mark.asyncio
+async def test_unsupported_batch_endpoint_falls_back_to_single_calls(hass, stand_in):
+    """A rejected batch call switches batching off for good, across restarts."""
+    api = _StandInApi(["SN1", "SN2", "SN3"], batch_status=404)
+    server = await stand_in(api)
+    coordinator = _coordinator(hass, server, ["SN1", "SN2", "SN3"], 10)
+
+    data = await coordinator._async_update_data()
+    assert len(api.batch_requests) == 1
+    assert api.single_requests == ["SN1", "SN2", "SN3"]
+    assert all(not payload.get("error") for payload in data.values())
+    assert coordinator.client.batch_supported is False
+
+    coordinator.client.set_chunk_size(5)
+    await coordinator._async_update_data()
+    assert len(api.batch_requests) == 1
+    assert coordinator.client.as_dict()["batch_fallbacks"] == 1
+
+    # The rejection survives a restart, so the probe call is not spent again.
+    restarted = _coordinator(hass, server, ["SN1", "SN2", "SN3"], 10)
+    restarted._restore_scheduler_state(coordinator._scheduler_snapshot())
+    await restarted._async_update_data()
+    assert len(api.batch_requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_batch_marks_every_serial_of_the_chunk(hass, stand_in):
+    """A throttled batch call is a rate limit for each serial, not a missing batch endpoint."""
+    api = _StandInApi(
+        ["SN1", "SN2"],
+        batch_reply={"success": False, "code": 104, "exception": "exceed the maximum call threshold"},
+    )
+    server = await stand_in(api)
+    coordinator = _coordinator(hass, server, ["SN1", "SN2"], 5)
+
+    data = await coordinator._async_update_data()
+
+    assert api.single_requests == []
+    assert coordinator.rate_limited_inverters == ["SN1", "SN2"]
+    assert data["SN2"]["error"] == "rate_limit"
+    assert coordinator.client.batch_supported is None
+
+
+@pytest.mark.asyncio
+async def test_requests_fail_over_to_the_next_endpoint_on_5xx(hass, stand_in):
+    """A 5xx host is skipped for the retry window; its errors show in the stats."""
+    down_api = _StandInApi(["SN1", "SN2"], status=503)
+    up_api = _StandInApi(["SN1", "SN2"])
+    down = await stand_in(down_api)
+    up = await stand_in(up_api)
+    coordinator = _coordinator(hass, [down, up], ["SN1", "SN2"])
+
+    data = await coordinator._async_update_data()
+
+    assert down_api.single_requests == ["SN1"]
+    assert up_api.single_requests == ["SN1", "SN2"]
+    assert not data["SN2"].get("error")
+    endpoints = coordinator.client.as_dict()["endpoints"]
+    assert [endpoint["healthy"] for endpoint in endpoints] == [True, False]
+    assert endpoints[1]["errors"] == 1
+    assert endpoints[1]["last_error"] == "HTTP 503"
+    assert endpoints[0]["latency_ms"] is not None
+
+
+@pytest.mark.asyncio
+async def test_probe_prefers_the_fastest_healthy_endpoint(hass, stand_in):
+    """The latency probe reorders hosts without spending API calls."""
+    slow_api = _StandInApi(["SN1"], delay=0.2)
+    fast_api = _StandInApi(["SN1"])
+    slow = await stand_in(slow_api)
+    fast = await stand_in(fast_api)
+    coordinator = _coordinator(hass, [slow, fast], ["SN1"])
+
+    await coordinator.async_probe_endpoints()
+    await coordinator._async_update_data()
+
+    assert slow_api.probes == fast_api.probes == 1
+    assert fast_api.single_requests == ["SN1"]
+    assert slow_api.single_requests == []
+    assert coordinator.api_call_counter.count("minute") == 1
+
+
+_LOAD_WITHOUT_HOME_ASSISTANT = """
+import importlib.abc
+import importlib.util
+import sys
+
+
+class _BlockHomeAssistant(importlib.abc.MetaPathFinder):
+    def find_spec(self, name, path=None, target=None):
+        if name == "homeassistant" or name.startswith("homeassistant."):
+            raise ImportError(f"blocked: {name}")
+        return None
+
+
+sys.meta_path.insert(0, _BlockHomeAssistant())
+spec = importlib.util.spec_from_file_location("solax_client", sys.argv[1])
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+client = module.SolaxCloudClient("token", chunk_size=5)
+assert client.chunks(["A", "B", "C"]) == [["A", "B", "C"]]
+assert module.classify_response({"success": True, "code": 0}) is module.SolaxOutcome.OK
+assert not any(name.startswith("homeassistant") for name in sys.modules)
+"""
+
+
+def test_client_module_loads_without_home_assistant():
+    """Fleet tools can load client.py by path with Home Assistant unavailable."""
+    result = subprocess.run(
+        [sys.executable, "-c", _LOAD_WITHOUT_HOME_ASSISTANT, client_module.__file__],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert result.returncode == 0, result.stderr
+
+
+@pytest.mark.asyncio
+async def test_standalone_client_classifies_replies_and_retries(hass, stand_in):
+    """A client with its own session types each reply and retries transient failures."""
+    api = _StandInApi(["SN1"], failures=1)
+    server = await stand_in(api)
+    paced = []
+
+    async def _pace():
+        paced.append(True)
+
+    async with SolaxCloudClient(
+        "token",
+        endpoints=[str(server.make_url("/"))],
+        retries=1,
+        retry_delay=0,
+        retry_after=0,
+        pacer=_pace,
+    ) as client:
+        first = await client.async_fetch("SN1")
+        unknown = await client.async_fetch("BAD1")
+
+    assert first.outcome is SolaxOutcome.OK
+    assert first.payload["result"]["acpower"] == 103
+    assert unknown.outcome is SolaxOutcome.DATA_UNAUTHORIZED
+    assert unknown.code == 1003
+    assert api.single_requests == ["SN1", "SN1", "BAD1"]
+    assert len(paced) == 3
+    assert client.as_dict()["retried_calls"] == 1
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock
 
 import pytest
 from homeassistant.data_entry_flow import FlowResultType
 
-from solax_cloud_api.config_flow import SolaxFlowHandler
+from solax_cloud_api.config_flow import (
+    SolaxFlowHandler,
+    _classify_preflight_inverters,
+    _parse_serial_list,
+)
 from solax_cloud_api.const import (
     CONF_INVERTERS,
     CONF_SCAN_INTERVAL,
@@ -16,16 +21,25 @@ from solax_cloud_api.const import (
 )
 
 
+async def _run_preflight(flow):
+    """Drive the progress step to completion and return the next step id."""
+    result = await flow.async_step_preflight()
+    assert result["type"] is FlowResultType.SHOW_PROGRESS
+    await flow._preflight_task
+    result = await flow.async_step_preflight()
+    assert result["type"] is FlowResultType.SHOW_PROGRESS_DONE
+    return result["step_id"]
+
+
 @pytest.mark.asyncio
 async def test_user_step_invalid_token_stays_on_user_form(hass, monkeypatch):
-    """Invalid token must block the flow at user step."""
+    """A token rejected by the first serial's preflight must return to the user form."""
     monkeypatch.setattr(
-        "solax_cloud_api.config_flow._test_api_connection",
-        AsyncMock(return_value=False),
+        "solax_cloud_api.config_flow._classify_preflight_inverters",
+        AsyncMock(return_value={"token_invalid": True}),
     )
     flow = SolaxFlowHandler()
     flow.hass = hass
-    monkeypatch.setattr(flow, "_async_current_entries", lambda: [])
 
     result = await flow.async_step_user(
         user_input={
@@ -34,18 +48,114 @@ async def test_user_step_invalid_token_stays_on_user_form(hass, monkeypatch):
             CONF_SCAN_INTERVAL: 120,
         },
     )
+    assert result["step_id"] == "add_inverter"
+    result = await flow.async_step_add_inverter(
+        user_input={"serial": "SERIAL1", "finish": True}
+    )
+    assert result["type"] is FlowResultType.SHOW_PROGRESS
+    await flow._preflight_task
+    result = await flow.async_step_preflight()
+    assert result["type"] is FlowResultType.SHOW_PROGRESS_DONE
+
+    result = await flow.async_step_user()
     assert result["type"] is FlowResultType.FORM
     assert result["step_id"] == "user"
     assert result["errors"]["base"] == "invalid_token"
 
+    result = await flow.async_step_user(
+        user_input={
+            CONF_TOKEN: "  ",
+            CONF_SYSTEM_NAME: "My System",
+            CONF_SCAN_INTERVAL: 120,
+        },
+    )
+    assert result["step_id"] == "user"
+    assert result["errors"]["base"] == "invalid_token"
+
 
 @pytest.mark.asyncio
-async def test_add_inverter_duplicate_and_no_inverters_validation(hass, monkeypatch):
-    """Duplicate serial and empty finish path should be rejected."""
+async def test_preflight_checks_serials_concurrently_within_budget(hass, monkeypatch):
+    """Serials beyond this minute's call budget are deferred to the first refresh."""
+    in_flight = 0
+    peak = 0
+
+    async def _fake_fetch(_client, serial):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return {"success": True, "code": 0, "result": {"inverterSN": serial}}
+
     monkeypatch.setattr(
-        "solax_cloud_api.config_flow._test_api_connection",
-        AsyncMock(return_value=True),
+        "solax_cloud_api.config_flow._fetch_preflight_response", _fake_fetch
     )
+    serials = [f"SERIAL{i}" for i in range(12)]
+
+    state = await _classify_preflight_inverters(hass, "token", serials, 120)
+
+    assert state["token_invalid"] is False
+    assert list(state["data"]) == serials[:9]
+    assert state["deferred_inverters"] == serials[9:]
+    assert state["api_calls"] == 9
+    assert peak == 8
+
+
+@pytest.mark.asyncio
+async def test_preflight_validates_token_with_first_reply_that_reaches_solax(hass, monkeypatch):
+    """A timed-out first serial does not validate the token; the next serial does."""
+    fetched = []
+
+    async def _fake_fetch(_client, serial):
+        fetched.append(serial)
+        if serial == "SERIAL0":
+            return {"error": "Timeout"}
+        return {"success": True, "code": 0, "result": {"inverterSN": serial}}
+
+    monkeypatch.setattr(
+        "solax_cloud_api.config_flow._fetch_preflight_response", _fake_fetch
+    )
+
+    state = await _classify_preflight_inverters(
+        hass, "token", ["SERIAL0", "SERIAL1", "SERIAL2"], 120
+    )
+
+    assert fetched[:2] == ["SERIAL0", "SERIAL1"]
+    assert state["token_invalid"] is False
+    assert state["data"]["SERIAL0"] == {"error": "Timeout"}
+    assert state["data"]["SERIAL2"] == {"inverterSN": "SERIAL2"}
+
+
+@pytest.mark.asyncio
+async def test_preflight_without_a_reply_from_solax_returns_to_user_form(hass, monkeypatch):
+    """When every checked serial times out, no entry is created with an unvalidated token."""
+    monkeypatch.setattr(
+        "solax_cloud_api.config_flow._fetch_preflight_response",
+        AsyncMock(return_value={"error": "Timeout"}),
+    )
+    flow = SolaxFlowHandler()
+    flow.hass = hass
+    await flow.async_step_user(
+        user_input={
+            CONF_TOKEN: "token",
+            CONF_SYSTEM_NAME: "My System",
+            CONF_SCAN_INTERVAL: 120,
+        },
+    )
+    await flow.async_step_add_inverter(user_input={"serial": "SERIAL1\nSERIAL2", "finish": True})
+
+    assert await _run_preflight(flow) == "user"
+    assert flow._initial_setup_state is None
+
+    result = await flow.async_step_user()
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "user"
+    assert result["errors"]["base"] == "cannot_connect"
+
+
+@pytest.mark.asyncio
+async def test_add_inverter_duplicate_and_no_inverters_validation(hass, monkeypatch):
+    """Duplicate serial and empty finish path should be rejected."""
     monkeypatch.setattr(
         "solax_cloud_api.config_flow._classify_preflight_inverters",
         AsyncMock(
@@ -61,7 +171,6 @@ async def test_add_inverter_duplicate_and_no_inverters_validation(hass, monkeypa
     )
     flow = SolaxFlowHandler()
     flow.hass = hass
-    monkeypatch.setattr(flow, "_async_current_entries", lambda: [])
 
     result = await flow.async_step_user(
         user_input={
@@ -95,10 +204,6 @@ async def test_add_inverter_duplicate_and_no_inverters_validation(hass, monkeypa
 @pytest.mark.asyncio
 async def test_rate_limit_notice_requires_acknowledge(hass, monkeypatch):
     """Rate-limit notice must be acknowledged before entry creation."""
-    monkeypatch.setattr(
-        "solax_cloud_api.config_flow._test_api_connection",
-        AsyncMock(return_value=True),
-    )
     monkeypatch.setattr(
         "solax_cloud_api.config_flow._classify_preflight_inverters",
         AsyncMock(
@@ -125,7 +230,6 @@ async def test_rate_limit_notice_requires_acknowledge(hass, monkeypatch):
     )
     flow = SolaxFlowHandler()
     flow.hass = hass
-    monkeypatch.setattr(flow, "_async_current_entries", lambda: [])
 
     result = await flow.async_step_user(
         user_input={
@@ -138,6 +242,10 @@ async def test_rate_limit_notice_requires_acknowledge(hass, monkeypatch):
         user_input={"serial": "SERIAL1", "finish": False}
     )
     result = await flow.async_step_add_inverter(user_input={"finish": True})
+    assert result["type"] is FlowResultType.SHOW_PROGRESS
+    assert await _run_preflight(flow) == "rate_limit_notice"
+
+    result = await flow.async_step_rate_limit_notice()
     assert result["type"] is FlowResultType.FORM
     assert result["step_id"] == "rate_limit_notice"
 
@@ -151,3 +259,93 @@ async def test_rate_limit_notice_requires_acknowledge(hass, monkeypatch):
     assert result["title"] == "Rate Limit System"
     assert result["data"][CONF_INVERTERS] == ["SERIAL1"]
     assert result["data"][CONF_TOKEN] == "good-token"
+
+
+def test_parse_serial_list_accepts_lines_commas_and_csv():
+    """Pasted lists are split on newlines/commas/semicolons and deduplicated."""
+    assert _parse_serial_list("SN1\nSN2, SN3;sn1\n\n  SN4  ") == ["SN1", "SN2", "SN3", "SN4"]
+    csv_export = 'Site,Serial Number,Type\n"Roof A",SN10,X1\n"Roof B",SN11,X3\n'
+    assert _parse_serial_list(csv_export) == ["SN10", "SN11"]
+    assert _parse_serial_list("") == []
+
+
+@pytest.mark.asyncio
+async def test_bulk_import_shows_results_and_drops_unauthorized(hass, monkeypatch):
+    """A pasted list is preflighted in one batch and can drop unauthorized serials."""
+    monkeypatch.setattr(
+        "solax_cloud_api.config_flow._classify_preflight_inverters",
+        AsyncMock(
+            return_value={
+                "token_invalid": False,
+                "data": {
+                    "SERIAL1": {"acpower": 100},
+                    "SERIAL2": {"error": "data_unauthorized", "code": 1003},
+                },
+                "rate_limited_inverters": [],
+                "rate_limited_details": {},
+                "unauthorized_inverters": ["SERIAL2"],
+                "unauthorized_details": {"SERIAL2": {"code": 1003}},
+                "deferred_inverters": ["SERIAL3"],
+                "api_calls": 2,
+            }
+        ),
+    )
+    flow = SolaxFlowHandler()
+    flow.hass = hass
+
+    await flow.async_step_user(
+        user_input={
+            CONF_TOKEN: "good-token",
+            CONF_SYSTEM_NAME: "Bulk System",
+            CONF_SCAN_INTERVAL: 120,
+        },
+    )
+    result = await flow.async_step_add_inverter(
+        user_input={"serial": "SERIAL1\nSERIAL2\nSERIAL3\nserial1", "finish": True}
+    )
+    assert result["type"] is FlowResultType.SHOW_PROGRESS
+    assert await _run_preflight(flow) == "import_results"
+
+    result = await flow.async_step_import_results()
+    assert result["type"] is FlowResultType.FORM
+    assert result["description_placeholders"]["ok_count"] == 1
+    assert result["description_placeholders"]["results"].splitlines() == [
+        "| SERIAL1 | OK |",
+        "| SERIAL2 | Data Unauthorized (1003) |",
+        "| SERIAL3 | Checked on first refresh |",
+    ]
+
+    result = await flow.async_step_import_results(user_input={"remove_invalid": True})
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert result["data"][CONF_INVERTERS] == ["SERIAL1", "SERIAL3"]
+
+
+@pytest.mark.asyncio
+async def test_second_entry_needs_own_name_and_serials(hass, mock_solax_entry):
+    """Further accounts can be added, but prefixes and serials stay unique per entry."""
+    mock_solax_entry(token="first-token", inverters=["SERIAL1"])
+    flow = SolaxFlowHandler()
+    flow.hass = hass
+
+    result = await flow.async_step_user(
+        user_input={
+            CONF_TOKEN: "second-token",
+            CONF_SYSTEM_NAME: "Test System",
+            CONF_SCAN_INTERVAL: 120,
+        },
+    )
+    assert result["step_id"] == "user"
+    assert result["errors"]["base"] == "system_name_in_use"
+
+    result = await flow.async_step_user(
+        user_input={
+            CONF_TOKEN: "second-token",
+            CONF_SYSTEM_NAME: "Second Site",
+            CONF_SCAN_INTERVAL: 120,
+        },
+    )
+    assert result["step_id"] == "add_inverter"
+
+    result = await flow.async_step_add_inverter(user_input={"serial": "serial1", "finish": False})
+    assert result["errors"]["base"] == "duplicate_inverter"
+    assert flow._inverters == []
@@ -3,11 +3,34 @@
 from __future__ import annotations
 
 import asyncio
+from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock
 
 import pytest
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
 
+from solax_cloud_api import (
+    _async_update_system_device_name,
+    _inverters_without_enabled_entities,
+    async_setup,
+    async_setup_entry,
+    async_unload_entry,
+)
+from solax_cloud_api.const import (
+    CONF_INVERTERS,
+    CONF_TOKEN,
+    DOMAIN,
+    RUNTIME_SCHEDULER,
+    SERVICE_BURST,
+    SERVICE_MANUAL_REFRESH,
+)
 from solax_cloud_api.coordinator import SolaxCoordinator
+from solax_cloud_api.quota import SolaxApiCallCounter, plan_burst_interval, plan_scan_interval
+from solax_cloud_api.scheduler import SolaxRequestScheduler
+from solax_cloud_api.solar import solar_elevation
 
 
 @pytest.fixture(autouse=True)
@@ -103,3 +126,426 @@ async def test_coordinator_cooldown_skips_request_and_keeps_cache(hass):
     assert data["SERIAL1"]["acpower"] == 111
     assert "SERIAL1" in coordinator.rate_limited_inverters
     assert coordinator.rate_limited_details["SERIAL1"]["reason"] == "cooldown_active"
+
+
+@pytest.mark.asyncio
+async def test_coordinator_skips_paused_inverters(hass):
+    """Serials without enabled entities should keep cached data and spend no API call."""
+    coordinator = SolaxCoordinator(hass, "token", ["SERIAL1", "SERIAL2"], 120)
+    coordinator.data = {"SERIAL2": {"acpower": 50}}
+    coordinator._fetch_one = AsyncMock(
+        return_value={"success": True, "code": 0, "result": {"acpower": 900}}
+    )
+    assert coordinator.set_paused_inverters(["serial2"]) is True
+    assert coordinator.set_paused_inverters(["SERIAL2"]) is False
+
+    data = await coordinator._async_update_data()
+    assert coordinator._fetch_one.await_count == 1
+    assert coordinator._fetch_one.await_args.args[1] == "SERIAL1"
+    assert data["SERIAL2"] == {"acpower": 50}
+
+
+@pytest.mark.asyncio
+async def test_paused_inverters_follow_entity_registry(hass, mock_solax_entry):
+    """Only serials whose registry entities are all disabled should be paused."""
+    entry = mock_solax_entry(inverters=["SERIAL1", "SERIAL2", "SERIAL3"])
+    entity_registry = er.async_get(hass)
+    disabled = er.RegistryEntryDisabler.USER
+    for unique_id, disabled_by in (
+        ("test_system_acpower_serial1", disabled),
+        ("test_system_api_access_status_serial1", disabled),
+        ("test_system_acpower_serial2", disabled),
+        ("test_system_api_access_status_serial2", None),
+        ("test_system_rate_limit_status_solax", None),
+        ("test_system_ac_power_solax", disabled),
+    ):
+        entity_registry.async_get_or_create(
+            "sensor", "solax_cloud_api", unique_id, config_entry=entry, disabled_by=disabled_by
+        )
+
+    inverters = ["SERIAL1", "SERIAL2", "SERIAL3"]
+    assert _inverters_without_enabled_entities(hass, entry, inverters) == {"serial1"}
+
+    # Enabled aggregating system totals read every inverter, so nothing is paused.
+    ac_total = entity_registry.async_get_entity_id(
+        "sensor", "solax_cloud_api", "test_system_ac_power_solax"
+    )
+    entity_registry.async_update_entity(ac_total, disabled_by=None)
+    assert _inverters_without_enabled_entities(hass, entry, inverters) == set()
+
+
+def test_solar_elevation_matches_known_positions():
+    """Local NOAA solar position should separate day and night without network access."""
+    # Stockholm around the June solstice: high sun at local noon, below horizon at midnight.
+    noon = datetime(2026, 6, 21, 11, 0, tzinfo=UTC)
+    midnight = datetime(2026, 6, 21, 23, 0, tzinfo=UTC)
+    assert solar_elevation(noon, 59.33, 18.07) == pytest.approx(54.1, abs=1.0)
+    assert solar_elevation(midnight, 59.33, 18.07) < 0
+    # Equator at the March equinox, solar noon at Greenwich.
+    assert solar_elevation(datetime(2026, 3, 20, 12, 7, tzinfo=UTC), 0.0, 0.0) > 88
+
+
+@pytest.mark.asyncio
+async def test_night_mode_stretches_polling_after_zero_dc_samples(
+    hass, monkeypatch, virtual_clock
+):
+    """PV-only serials are deferred at night; battery serials use the night battery rate."""
+    monkeypatch.setattr("solax_cloud_api.coordinator.solar_elevation", lambda *_args: -12.0)
+    coordinator = SolaxCoordinator(
+        hass,
+        "token",
+        ["PVONLY", "BATTERY"],
+        120,
+        night_mode=True,
+        night_battery_interval=240,
+        clock=virtual_clock,
+    )
+    payloads = {
+        "PVONLY": {"acpower": 0, "powerdc1": 0, "powerdc2": 0},
+        "BATTERY": {"acpower": 300, "powerdc1": 0, "batPower": -300},
+    }
+
+    async def _fetch(_session, sn):
+        return {"success": True, "code": 0, "result": payloads[sn]}
+
+    coordinator._fetch_one = AsyncMock(side_effect=_fetch)
+    for _ in range(3):
+        coordinator.data = await coordinator._async_update_data()
+        virtual_clock.advance(120)
+    assert coordinator._fetch_one.await_count == 6
+
+    coordinator._fetch_one.reset_mock()
+    coordinator.data = await coordinator._async_update_data()
+    assert coordinator._fetch_one.await_count == 0
+    assert coordinator.night_inverters == {"pvonly", "battery"}
+    assert coordinator.data["PVONLY"]["powerdc1"] == 0
+
+    virtual_clock.advance(120)
+    coordinator.data = await coordinator._async_update_data()
+    polled = [call.args[1] for call in coordinator._fetch_one.await_args_list]
+    assert polled == ["BATTERY"]
+
+
+def test_api_call_counter_windows_and_snapshot():
+    """Per-token call counts should roll over per UTC window and survive a snapshot."""
+    counter = SolaxApiCallCounter()
+    start = datetime(2026, 3, 19, 23, 59, 30, tzinfo=UTC)
+    counter.record(start)
+    counter.record(start)
+    assert counter.count("minute", start) == 2
+    assert counter.count("day", start) == 2
+
+    next_day = datetime(2026, 3, 20, 0, 0, 10, tzinfo=UTC)
+    assert counter.count("day", next_day) == 0
+    counter.record(next_day)
+    assert counter.count("hour", next_day) == 1
+
+    restored = SolaxApiCallCounter()
+    restored.load(counter.snapshot())
+    assert restored.count("day", next_day) == 1
+
+
+def test_scan_interval_planner_scales_with_fleet_size():
+    """The planner should respect the per-minute and per-day token limits."""
+    assert plan_scan_interval(1) == 120
+    # 40 serials: 40 * 86400 / (10000 * 0.9) = 384s -> rounded up to 390s.
+    assert plan_scan_interval(40) == 390
+    assert plan_scan_interval(1000) == 3600
+    # 40 serials in chunks of 5 are 8 calls per cycle.
+    assert plan_scan_interval(40, batch_size=5) == 120
+
+
+@pytest.mark.asyncio
+async def test_recommended_scan_interval_counts_every_entry_on_the_token(hass):
+    """Entries sharing a token share its quota, so the planner sees all their serials."""
+    scheduler = SolaxRequestScheduler()
+    first_serials = [f"SERIAL{i}" for i in range(20)]
+    second_serials = [f"SERIAL{i}" for i in range(20, 40)]
+    scheduler.register("entry1", "token", first_serials)
+    scheduler.register("entry2", "token", second_serials)
+    scheduler.register("entry3", "other-token", ["SERIAL99"])
+    coordinator = SolaxCoordinator(
+        hass, "token", first_serials, 120, scheduler=scheduler, batch_size=5
+    )
+    assert scheduler.inverter_count("token") == 40
+    assert scheduler.inverter_count("token", exclude_entry_id="entry1") == 20
+    assert coordinator.recommended_scan_interval() == plan_scan_interval(40) == 390
+
+    # The chunk size only counts once the account answered a batch call.
+    coordinator.client.batch_supported = True
+    assert coordinator.recommended_scan_interval() == 120
+
+    second_serials.append("SERIAL40")
+    assert scheduler.inverter_count("token") == 41
+
+
+def test_burst_planner_caps_interval_to_remaining_budget():
+    """Bursts should slow down rather than exceed the minute or day budget."""
+    assert plan_burst_interval(60, 1, 0, 120, 900, calls_today=0) == 60
+    assert plan_burst_interval(10, 1, 0, 120, 900, calls_today=0) == 30
+    # 20 serials at 9 usable calls/minute need at least 134s.
+    assert plan_burst_interval(60, 20, 0, 120, 900, calls_today=0) == 134
+    # Only 10 usable calls left today for a 900s burst.
+    assert plan_burst_interval(60, 1, 0, 120, 900, calls_today=8990) == 90
+    assert plan_burst_interval(60, 1, 0, 120, 900, calls_today=9000) is None
+
+
+@pytest.mark.asyncio
+async def test_burst_polls_selected_serials_and_reverts(hass):
+    """Burst serials poll every cycle while the rest stay on the scan interval."""
+    coordinator = SolaxCoordinator(hass, "token", ["SERIAL1", "SERIAL2"], 120)
+    coordinator._fetch_one = AsyncMock(
+        return_value={"success": True, "code": 0, "result": {"acpower": 900}}
+    )
+    coordinator.data = await coordinator._async_update_data()
+    assert coordinator._fetch_one.await_count == 2
+
+    coordinator.async_start_burst(["serial1"], 60, 600)
+    assert coordinator.update_interval.total_seconds() == 60
+    for serial_key in coordinator._last_polled_at:
+        coordinator._last_polled_at[serial_key] -= 60
+
+    coordinator._fetch_one.reset_mock()
+    coordinator.data = await coordinator._async_update_data()
+    polled = [call.args[1] for call in coordinator._fetch_one.await_args_list]
+    assert polled == ["SERIAL1"]
+
+    coordinator.async_cancel_burst()
+    assert coordinator.burst is None
+    assert coordinator.update_interval.total_seconds() == 120
+
+
+@pytest.mark.asyncio
+async def test_manual_refresh_targets_serials_and_coalesces(hass):
+    """Manual refreshes fetch only due targets and fold into an imminent scheduled cycle."""
+    coordinator = SolaxCoordinator(hass, "token", ["SERIAL1", "SERIAL2"], 120)
+    coordinator._fetch_one = AsyncMock(
+        return_value={"success": True, "code": 0, "result": {"acpower": 900}}
+    )
+    coordinator.data = await coordinator._async_update_data()
+    coordinator._fetch_one.reset_mock()
+
+    result = await coordinator.async_manual_refresh(["SERIAL1"])
+    assert result == {
+        "mode": "skipped",
+        "fetched": [],
+        "skipped": {"SERIAL1": "recently_polled"},
+    }
+    assert coordinator._fetch_one.await_count == 0
+
+    for serial_key in coordinator._last_polled_at:
+        coordinator._last_polled_at[serial_key] -= 90
+    result = await coordinator.async_manual_refresh(["SERIAL1"])
+    assert result == {"mode": "targeted", "fetched": ["SERIAL1"], "skipped": {}}
+    assert [call.args[1] for call in coordinator._fetch_one.await_args_list] == ["SERIAL1"]
+    assert coordinator.data["SERIAL2"] == {"acpower": 900}
+
+    # The scheduled cycle is due in 10s: run it now instead of an extra targeted poll.
+    coordinator._fetch_one.reset_mock()
+    for serial_key in coordinator._last_polled_at:
+        coordinator._last_polled_at[serial_key] -= 90
+    coordinator.last_update_attempt = dt_util.utcnow() - timedelta(seconds=110)
+    result = await coordinator.async_manual_refresh(["SERIAL2"])
+    assert result == {"mode": "scheduled", "fetched": ["SERIAL2"], "skipped": {}}
+    assert coordinator._fetch_one.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_added_inverters_start_from_preflight_and_fetch_the_rest_later(
+    hass, mock_solax_entry, monkeypatch
+):
+    """Adding serials never waits on pacing; a cycle in flight does not drop the fetch."""
+    entry = mock_solax_entry(inverters=["SERIAL1"])
+    monkeypatch.setattr(SolaxCoordinator, "async_probe_endpoints", AsyncMock())
+    monkeypatch.setattr(SolaxCoordinator, "async_config_entry_first_refresh", AsyncMock())
+    monkeypatch.setattr(hass.config_entries, "async_forward_entry_setups", AsyncMock())
+    assert await async_setup_entry(hass, entry)
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    coordinator.data = {"SERIAL1": {"acpower": 100}}
+    fetched = asyncio.Event()
+
+    async def _manual_refresh(serials):
+        if coordinator.async_manual_refresh.await_count == 1:
+            return {"mode": "in_flight", "fetched": [], "skipped": {}}
+        fetched.set()
+        return {"mode": "targeted", "fetched": serials, "skipped": {}}
+
+    coordinator.async_manual_refresh = AsyncMock(side_effect=_manual_refresh)
+
+    hass.config_entries.async_update_entry(
+        entry, data={**entry.data, CONF_INVERTERS: ["SERIAL1", "SERIAL2", "SERIAL3", "SERIAL4"]}
+    )
+    deferred = await hass.data[DOMAIN][entry.entry_id]["apply_inverters"](
+        {
+            "data": {
+                "SERIAL2": {"acpower": 200},
+                "SERIAL3": {"error": "rate_limit", "code": 104},
+            },
+            "rate_limited_inverters": ["SERIAL3"],
+            "rate_limited_details": {"SERIAL3": {"reason": "api_rate_limit", "code": 104}},
+            "unauthorized_inverters": [],
+            "unauthorized_details": {},
+            "deferred_inverters": ["SERIAL4"],
+            "api_calls": 2,
+        }
+    )
+    assert deferred == ["SERIAL4"]
+    assert coordinator.data["SERIAL2"] == {"acpower": 200}
+    assert coordinator.rate_limited_inverters == ["SERIAL3"]
+    assert hass.data[RUNTIME_SCHEDULER].calls_last_minute(entry.data[CONF_TOKEN]) == 2
+
+    await asyncio.wait_for(fetched.wait(), 1)
+    assert [call.args for call in coordinator.async_manual_refresh.await_args_list] == [
+        (["SERIAL4"],),
+        (["SERIAL4"],),
+    ]
+    monkeypatch.setattr(hass.config_entries, "async_unload_platforms", AsyncMock(return_value=True))
+    assert await async_unload_entry(hass, entry)
+    await entry._async_process_on_unload(hass)
+
+
+@pytest.mark.asyncio
+async def test_manual_refresh_service_returns_per_entry_response(hass):
+    """The service should resolve serials per entry and report what was fetched."""
+    coordinator = SolaxCoordinator(hass, "token", ["SERIAL1", "SERIAL2"], 120)
+    coordinator._fetch_one = AsyncMock(
+        return_value={"success": True, "code": 0, "result": {"acpower": 900}}
+    )
+    coordinator.data = await coordinator._async_update_data()
+    for serial_key in coordinator._last_polled_at:
+        coordinator._last_polled_at[serial_key] -= 90
+    hass.data[DOMAIN] = {"entry1": {"coordinator": coordinator}}
+    await async_setup(hass, {})
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_MANUAL_REFRESH,
+        {"serials": ["serial2", "UNKNOWN"]},
+        blocking=True,
+        return_response=True,
+    )
+    assert response == {
+        "entries": {"entry1": {"mode": "targeted", "fetched": ["SERIAL2"], "skipped": {}}},
+        "unknown_serials": ["unknown"],
+    }
+
+
+@pytest.mark.asyncio
+async def test_burst_service_plans_entries_sharing_a_token_together(hass):
+    """Entries on one token share its minute budget when a burst is planned."""
+    first = SolaxCoordinator(hass, "token", ["SERIAL1", "SERIAL2", "SERIAL3"], 120)
+    second = SolaxCoordinator(hass, "token", ["SERIAL4", "SERIAL5", "SERIAL6"], 120)
+    for coordinator in (first, second):
+        coordinator.async_request_refresh = AsyncMock()
+    hass.data[DOMAIN] = {
+        "entry1": {"coordinator": first},
+        "entry2": {"coordinator": second},
+    }
+    await async_setup(hass, {})
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_BURST,
+        {"duration": 600, "interval": 30},
+        blocking=True,
+        return_response=True,
+    )
+    # Six serials on one token at 9 usable calls/minute need at least 40s.
+    assert response["bursts"]["entry1"]["interval"] == 40
+    assert response["bursts"]["entry2"]["interval"] == 40
+    first.async_cancel_burst()
+    second.async_cancel_burst()
+
+
+@pytest.mark.asyncio
+async def test_burst_service_skips_tokens_without_budget(hass):
+    """A token out of budget is skipped and reported; other tokens still burst."""
+    first = SolaxCoordinator(hass, "token-a", ["SERIAL1"], 120)
+    second = SolaxCoordinator(hass, "token-b", ["SERIAL2"], 120)
+    second.api_call_counter.record(calls=10000)
+    for coordinator in (first, second):
+        coordinator.async_request_refresh = AsyncMock()
+    hass.data[DOMAIN] = {
+        "entry1": {"coordinator": first},
+        "entry2": {"coordinator": second},
+    }
+    await async_setup(hass, {})
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_BURST,
+        {"duration": 600, "interval": 30},
+        blocking=True,
+        return_response=True,
+    )
+    assert list(response["bursts"]) == ["entry1"]
+    assert response["skipped_serials"] == ["SERIAL2"]
+    assert second.burst is None
+    first.async_cancel_burst()
+
+    with pytest.raises(HomeAssistantError, match="Not enough API budget"):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_BURST,
+            {"duration": 600, "interval": 30, "serials": ["SERIAL2"]},
+            blocking=True,
+            return_response=True,
+        )
+
+
+@pytest.mark.asyncio
+async def test_apply_settings_updates_interval_in_place(hass):
+    """Option changes should reach the running coordinator without a reload."""
+    coordinator = SolaxCoordinator(hass, "token", ["SERIAL1"], 120)
+    coordinator.async_apply_settings(
+        scan_interval=300, lean_attributes=True, night_mode=False, night_battery_interval=600
+    )
+    assert coordinator.update_interval.total_seconds() == 300
+    assert coordinator.lean_attributes is True
+
+    coordinator.async_start_burst(["SERIAL1"], 60, 600)
+    coordinator.async_apply_settings(
+        scan_interval=600, lean_attributes=True, night_mode=False, night_battery_interval=600
+    )
+    assert coordinator.update_interval.total_seconds() == 60
+    coordinator.async_cancel_burst()
+    assert coordinator.update_interval.total_seconds() == 600
+
+
+@pytest.mark.asyncio
+async def test_system_name_change_renames_system_device(hass, mock_solax_entry):
+    """Only the System Totals device should follow a system name change."""
+    entry = mock_solax_entry(inverters=["SERIAL1"], system_name="New Name")
+    device_registry = dr.async_get(hass)
+    system_device = device_registry.async_get_or_create(
+        config_entry_id=entry.entry_id,
+        identifiers={(DOMAIN, "system_totals_test_system")},
+        name="Old Name System Totals",
+    )
+    inverter_device = device_registry.async_get_or_create(
+        config_entry_id=entry.entry_id,
+        identifiers={(DOMAIN, "SERIAL1")},
+        name="Solax Inverter SERIAL1",
+    )
+
+    _async_update_system_device_name(hass, entry)
+    assert device_registry.async_get(system_device.id).name == "New Name System Totals"
+    assert device_registry.async_get(inverter_device.id).name == "Solax Inverter SERIAL1"
+
+
+@pytest.mark.asyncio
+async def test_set_inverters_mutates_shared_list_and_drops_removed_state(hass):
+    """Runtime serial changes should keep the list object and forget removed serials."""
+    inverters = ["SERIAL1", "SERIAL2"]
+    coordinator = SolaxCoordinator(hass, "token", inverters, 120)
+    coordinator._fetch_one = AsyncMock(
+        return_value={"success": True, "code": 0, "result": {"acpower": 900}}
+    )
+    coordinator.data = await coordinator._async_update_data()
+
+    removed = coordinator.async_set_inverters(["SERIAL1", "SERIAL3"])
+    assert removed == ["SERIAL2"]
+    assert inverters == ["SERIAL1", "SERIAL3"]
+    assert coordinator.inverters is inverters
+    assert "SERIAL2" not in coordinator.data
+    assert "serial2" not in coordinator._last_polled_at
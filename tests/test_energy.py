@@ -0,0 +1,77 @@
+"""Batched energy integration tests."""
+
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from solax_cloud_api.energy import SolaxEnergyIntegrator
+
+
+def _sample(utc: str, **fields) -> dict:
+    payload = {"uploadTime": utc.replace("T", " ")[:19], "utcDateTime": utc}
+    payload.update(fields)
+    return payload
+
+
+def test_integrator_accumulates_all_sources_in_one_pass():
+    """Every configured power field of every inverter should integrate per update."""
+    integrator = SolaxEnergyIntegrator()
+    integrator.integrate(
+        {
+            "SERIAL1": _sample("2026-03-19T12:00:00+00:00", powerdc1=1000, feedinpower=500),
+            "SERIAL2": _sample("2026-03-19T12:00:00+00:00", peps1=200),
+        }
+    )
+    integrator.integrate(
+        {
+            "SERIAL1": _sample("2026-03-19T12:30:00+00:00", powerdc1=2000, feedinpower=-400),
+            "SERIAL2": _sample("2026-03-19T12:30:00+00:00", peps1=200),
+        }
+    )
+
+    assert integrator.total_kwh("SERIAL1", "pv1") == pytest.approx(1.0)
+    assert integrator.total_kwh("SERIAL1", "grid_export") == pytest.approx(0.0)
+    assert integrator.total_kwh("SERIAL1", "grid_import") == pytest.approx(0.2)
+    assert integrator.total_kwh("SERIAL2", "eps1") == pytest.approx(0.1)
+    assert integrator.total_kwh("SERIAL2", "pv1") == 0.0
+
+
+def test_integrator_ignores_repeated_samples_and_errors():
+    """Unchanged upload samples and error payloads must not add energy."""
+    integrator = SolaxEnergyIntegrator()
+    first = _sample("2026-03-19T12:00:00+00:00", powerdc1=1000)
+    integrator.integrate({"SERIAL1": first})
+    integrator.integrate({"SERIAL1": dict(first)})
+    integrator.integrate({"SERIAL1": {"error": "rate_limit"}})
+    assert integrator.total_kwh("SERIAL1", "pv1") == 0.0
+
+
+def test_integrator_today_resets_on_new_local_day():
+    """Today values should restart at a new local day while totals keep growing."""
+    integrator = SolaxEnergyIntegrator()
+    integrator.integrate({"SERIAL1": _sample("2026-03-19T10:00:00+00:00", powerdc1=1000)})
+    integrator.integrate({"SERIAL1": _sample("2026-03-19T11:00:00+00:00", powerdc1=1000)})
+    assert integrator.today_kwh("SERIAL1", "pv1") == pytest.approx(1.0)
+
+    integrator.integrate({"SERIAL1": _sample("2026-03-20T10:00:00+00:00", powerdc1=0)})
+    assert integrator.total_kwh("SERIAL1", "pv1") == pytest.approx(1.0)
+    assert integrator.today_kwh("SERIAL1", "pv1") == 0.0
+    assert integrator.today_date("SERIAL1") == date(2026, 3, 20)
+
+
+def test_integrator_snapshot_round_trip_keeps_accumulators():
+    """Persisted accumulators should load back without replaying old samples."""
+    integrator = SolaxEnergyIntegrator()
+    integrator.integrate({"SERIAL1": _sample("2026-03-19T10:00:00+00:00", powerdc1=1000)})
+    integrator.integrate({"SERIAL1": _sample("2026-03-19T12:00:00+00:00", powerdc1=1000)})
+
+    restored = SolaxEnergyIntegrator()
+    restored.load(integrator.snapshot())
+    assert restored.total_kwh("SERIAL1", "pv1") == pytest.approx(2.0)
+    assert restored.today_kwh("SERIAL1", "pv1") == pytest.approx(2.0)
+
+    # The first post-restart sample only re-establishes the sample baseline.
+    restored.integrate({"SERIAL1": _sample("2026-03-19T13:00:00+00:00", powerdc1=1000)})
+    assert restored.total_kwh("SERIAL1", "pv1") == pytest.approx(2.0)
@@ -6,7 +6,9 @@ from datetime import timedelta
 from unittest.mock import AsyncMock
 
 import pytest
+from homeassistant.helpers import entity_registry as er
 from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
 
 from solax_cloud_api import sensor as sensor_platform
 from solax_cloud_api.const import DOMAIN
@@ -25,6 +27,7 @@ class _FakeCoordinator:
 
     def __init__(self, data: dict[str, dict]):
         self.data = data
+        self.inverters = list(data)
         self.last_update_success = True
         self.rate_limited_inverters = []
         self.rate_limited_details = {}
@@ -86,7 +89,7 @@ async def test_sensor_setup_creates_api_status_and_system_totals(
         for entity in added
         if isinstance(entity, sensor_platform.SolaxSystemTotalSensor)
     ]
-    assert len(system_total_entities) == 9
+    assert len(system_total_entities) == 12
 
 
 @pytest.mark.asyncio
@@ -170,3 +173,365 @@ async def test_estimated_battery_sensors_only_created_when_batpower_exists(
     assert len(system_estimated) == 4
     assert all(entity.entity_registry_enabled_default is False for entity in inverter_estimated)
     assert all(entity.entity_registry_enabled_default is False for entity in system_estimated)
+
+
+@pytest.mark.asyncio
+async def test_integrated_energy_sensors_created_disabled_for_present_power_fields(
+    hass, mock_solax_entry, monkeypatch, payload_factory
+):
+    """Per-string energy sensors should exist only for present power fields."""
+    entry = mock_solax_entry(inverters=["SERIAL1"], entity_prefix="energy_system")
+    coordinator = _FakeCoordinator({"SERIAL1": payload_factory(extra={"feedinpower": -50})})
+    coordinator.last_update_attempt = dt_util.utcnow()
+    coordinator.last_successful_update = dt_util.utcnow()
+
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {"coordinator": coordinator}
+    monkeypatch.setattr(
+        sensor_platform,
+        "async_get_translations",
+        AsyncMock(return_value=_minimal_entity_translations()),
+    )
+
+    added = []
+
+    def _add_entities(entities, update_before_add=False):
+        added.extend(entities)
+
+    await sensor_platform.async_setup_entry(hass, entry, _add_entities)
+
+    integrated = [
+        entity
+        for entity in added
+        if isinstance(entity, sensor_platform.SolaxIntegratedEnergySensor)
+    ]
+    metrics = {entity._metric for entity in integrated}
+    assert metrics == {"pv1", "pv2", "grid_export", "grid_import"}
+    assert len(integrated) == 8
+    assert all(entity.entity_registry_enabled_default is False for entity in integrated)
+
+
+def test_lean_attribute_mode_drops_unrecorded_debug_attributes(payload_factory):
+    """Lean mode should drop per-update debug attributes the recorder already skips."""
+    coordinator = _FakeCoordinator({"SERIAL1": payload_factory(extra={"inverterStatus": 102})})
+    entity = sensor_platform.SolaxFieldSensor(
+        coordinator=coordinator,
+        serial="SERIAL1",
+        field="inverterStatus",
+        human_name="Inverter Status",
+        system_slug="lean_system",
+        translations={},
+        type_map={},
+    )
+    assert {"last_update_raw", "utc_date_time", "inverterStatus_text"} <= (
+        entity._unrecorded_attributes
+    )
+    assert "last_update_raw" in entity.extra_state_attributes
+
+    coordinator.lean_attributes = True
+    attrs = entity.extra_state_attributes
+    assert "last_update_raw" not in attrs
+    assert "utc_date_time" not in attrs
+    assert "inverterStatus_text" not in attrs
+    assert attrs["inverterStatus_raw"] == 102
+
+
+@pytest.mark.asyncio
+async def test_entity_profile_changes_add_and_retire_entities_incrementally(
+    hass, mock_solax_entry, monkeypatch, payload_factory
+):
+    """Switching profiles should add/remove entities without rebuilding the platform."""
+    entry = mock_solax_entry(
+        inverters=["SERIAL1"],
+        entity_prefix="profile_system",
+        options={"entity_profile": "minimal"},
+    )
+    coordinator = _FakeCoordinator({"SERIAL1": payload_factory(bat_power=-300)})
+    runtime = {"coordinator": coordinator}
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = runtime
+    monkeypatch.setattr(
+        sensor_platform,
+        "async_get_translations",
+        AsyncMock(return_value=_minimal_entity_translations()),
+    )
+
+    added = []
+
+    def _add_entities(entities, update_before_add=False):
+        added.extend(entities)
+
+    await sensor_platform.async_setup_entry(hass, entry, _add_entities)
+
+    field_sensors = {
+        entity._field for entity in added if isinstance(entity, sensor_platform.SolaxFieldSensor)
+    }
+    assert field_sensors == {"acpower", "yieldtoday", "yieldtotal", "batPower"}
+    assert not any(
+        isinstance(entity, sensor_platform.SolaxEstimatedBatteryEnergySensor) for entity in added
+    )
+    assert sum(isinstance(e, sensor_platform.SolaxSystemTotalSensor) for e in added) == len(
+        sensor_platform.SYSTEM_SENSOR_KEYS
+    )
+
+    added.clear()
+    await runtime["apply_entity_profile"]("standard")
+    assert any(isinstance(e, sensor_platform.SolaxInverterEfficiencySensor) for e in added)
+    assert any(isinstance(e, sensor_platform.SolaxEstimatedBatteryEnergySensor) for e in added)
+    assert not any(isinstance(e, sensor_platform.SolaxSystemTotalSensor) for e in added)
+
+    entity_registry = er.async_get(hass)
+    efficiency = next(
+        e for e in added if isinstance(e, sensor_platform.SolaxInverterEfficiencySensor)
+    )
+    registry_entry = entity_registry.async_get_or_create(
+        "sensor", DOMAIN, efficiency.unique_id, config_entry=entry
+    )
+
+    added.clear()
+    await runtime["apply_entity_profile"]("minimal")
+    assert added == []
+    registry_entry = entity_registry.async_get(registry_entry.entity_id)
+    assert registry_entry.disabled_by is None
+
+    await runtime["apply_entity_profile"]("standard")
+    assert entity_registry.async_get(registry_entry.entity_id).disabled_by is None
+    assert any(e.unique_id == efficiency.unique_id for e in added)
+
+
+@pytest.mark.asyncio
+async def test_entity_profile_switch_does_not_reload_the_entry(
+    hass, mock_solax_entry, monkeypatch, payload_factory
+):
+    """Leaving and re-entering a profile must not trigger Home Assistant's re-enable reload."""
+    entry = mock_solax_entry(inverters=["SERIAL1"], entity_prefix="profile_system")
+    entry.supports_unload = True
+    reload_mock = AsyncMock(return_value=True)
+    monkeypatch.setattr(hass.config_entries, "async_reload", reload_mock)
+    coordinator = _FakeCoordinator({"SERIAL1": payload_factory()})
+    runtime = {"coordinator": coordinator}
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = runtime
+    monkeypatch.setattr(
+        sensor_platform,
+        "async_get_translations",
+        AsyncMock(return_value=_minimal_entity_translations()),
+    )
+
+    added = []
+
+    def _add_entities(entities, update_before_add=False):
+        added.extend(entities)
+
+    await sensor_platform.async_setup_entry(hass, entry, _add_entities)
+    efficiency = next(
+        e for e in added if isinstance(e, sensor_platform.SolaxInverterEfficiencySensor)
+    )
+    entity_registry = er.async_get(hass)
+    entity_id = entity_registry.async_get_or_create(
+        "sensor", DOMAIN, efficiency.unique_id, config_entry=entry
+    ).entity_id
+
+    await runtime["apply_entity_profile"]("minimal")
+    added.clear()
+    await runtime["apply_entity_profile"]("standard")
+    assert any(e.unique_id == efficiency.unique_id for e in added)
+    assert entity_registry.async_get(entity_id).disabled_by is None
+
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=31))
+    await hass.async_block_till_done()
+    reload_mock.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_entity_profile_switch_keeps_registry_customisations(
+    hass, mock_solax_entry, monkeypatch, payload_factory
+):
+    """Names and hand-enabled estimators survive switching to full and back."""
+    entry = mock_solax_entry(inverters=["SERIAL1"], entity_prefix="profile_system")
+    coordinator = _FakeCoordinator({"SERIAL1": payload_factory()})
+    runtime = {"coordinator": coordinator}
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = runtime
+    monkeypatch.setattr(
+        sensor_platform,
+        "async_get_translations",
+        AsyncMock(return_value=_minimal_entity_translations()),
+    )
+
+    added = []
+
+    def _add_entities(entities, update_before_add=False):
+        added.extend(entities)
+
+    await sensor_platform.async_setup_entry(hass, entry, _add_entities)
+
+    entity_registry = er.async_get(hass)
+
+    def _register(entity):
+        return entity_registry.async_get_or_create(
+            "sensor",
+            DOMAIN,
+            entity.unique_id,
+            config_entry=entry,
+            disabled_by=(
+                None
+                if entity.entity_registry_enabled_default
+                else er.RegistryEntryDisabler.INTEGRATION
+            ),
+        ).entity_id
+
+    acpower = next(e for e in added if getattr(e, "_field", None) == "acpower")
+    acpower_id = _register(acpower)
+    entity_registry.async_update_entity(acpower_id, name="Roof AC")
+    hand_enabled_id, hidden_id = [
+        _register(entity)
+        for entity in added
+        if isinstance(entity, sensor_platform.SolaxIntegratedEnergySensor)
+    ][:2]
+    entity_registry.async_update_entity(hand_enabled_id, disabled_by=None)
+
+    await runtime["apply_entity_profile"]("full")
+    assert entity_registry.async_get(hidden_id).disabled_by is None
+    assert entity_registry.async_get(hand_enabled_id).disabled_by is None
+
+    await runtime["apply_entity_profile"]("standard")
+    assert entity_registry.async_get(acpower_id).name == "Roof AC"
+    assert entity_registry.async_get(acpower_id).disabled_by is None
+    assert entity_registry.async_get(hand_enabled_id).disabled_by is None
+    assert (
+        entity_registry.async_get(hidden_id).disabled_by is er.RegistryEntryDisabler.INTEGRATION
+    )
+
+
+@pytest.mark.asyncio
+async def test_full_entity_profile_enables_default_disabled_entities(
+    hass, mock_solax_entry, monkeypatch, payload_factory
+):
+    """The full profile should create normally hidden sensors enabled by default."""
+    entry = mock_solax_entry(
+        inverters=["SERIAL1"],
+        entity_prefix="full_system",
+        options={"entity_profile": "full"},
+    )
+    coordinator = _FakeCoordinator({"SERIAL1": payload_factory()})
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {"coordinator": coordinator}
+    monkeypatch.setattr(
+        sensor_platform,
+        "async_get_translations",
+        AsyncMock(return_value=_minimal_entity_translations()),
+    )
+
+    added = []
+
+    def _add_entities(entities, update_before_add=False):
+        added.extend(entities)
+
+    await sensor_platform.async_setup_entry(hass, entry, _add_entities)
+
+    assert any(isinstance(e, sensor_platform.SolaxIntegratedEnergySensor) for e in added)
+    assert all(entity.entity_registry_enabled_default for entity in added)
+
+
+@pytest.mark.asyncio
+async def test_removed_inverter_retires_only_its_entities(
+    hass, mock_solax_entry, monkeypatch, payload_factory
+):
+    """Removing a serial at runtime should leave entities of other serials untouched."""
+    entry = mock_solax_entry(inverters=["SERIAL1", "SERIAL2"], entity_prefix="fleet_system")
+    coordinator = _FakeCoordinator(
+        {"SERIAL1": payload_factory(), "SERIAL2": payload_factory()}
+    )
+    runtime = {"coordinator": coordinator}
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = runtime
+    monkeypatch.setattr(
+        sensor_platform,
+        "async_get_translations",
+        AsyncMock(return_value=_minimal_entity_translations()),
+    )
+
+    added = []
+
+    def _add_entities(entities, update_before_add=False):
+        added.extend(entities)
+
+    await sensor_platform.async_setup_entry(hass, entry, _add_entities)
+    entity_registry = er.async_get(hass)
+    for entity in added:
+        entity_registry.async_get_or_create("sensor", DOMAIN, entity.unique_id, config_entry=entry)
+
+    coordinator.inverters[:] = ["SERIAL1"]
+    coordinator.data.pop("SERIAL2")
+    added.clear()
+    await runtime["apply_removed_inverters"](["SERIAL2"])
+
+    remaining = {
+        reg_entry.unique_id
+        for reg_entry in er.async_entries_for_config_entry(entity_registry, entry.entry_id)
+    }
+    assert not any(unique_id.endswith("_serial2") for unique_id in remaining)
+    assert "fleet_system_acpower_serial1" in remaining
+    assert "fleet_system_ac_power_solax" in remaining
+    assert added == []
+
+    # A serial added back is picked up from the shared list on the next build.
+    coordinator.inverters.append("SERIAL3")
+    coordinator.data["SERIAL3"] = payload_factory()
+    await runtime["apply_removed_inverters"]([])
+    assert any(
+        isinstance(e, sensor_platform.SolaxInverterApiAccessStatusSensor) for e in added
+    )
+    assert all(entity.unique_id.casefold().endswith("_serial3") for entity in added)
+
+
+@pytest.mark.asyncio
+async def test_discovery_only_runs_when_field_set_grows(
+    hass, mock_solax_entry, monkeypatch, payload_factory
+):
+    """Steady-state updates add nothing; a newly reported field adds its sensors once."""
+    entry = mock_solax_entry(inverters=["SERIAL1"], entity_prefix="discovery_system")
+    coordinator = _FakeCoordinator({"SERIAL1": payload_factory()})
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {"coordinator": coordinator}
+    monkeypatch.setattr(
+        sensor_platform,
+        "async_get_translations",
+        AsyncMock(return_value=_minimal_entity_translations()),
+    )
+
+    add_calls = []
+
+    def _add_entities(entities, update_before_add=False):
+        add_calls.append(list(entities))
+
+    await sensor_platform.async_setup_entry(hass, entry, _add_entities)
+    field_scans = []
+
+    class _CountingFields(list):
+        def __iter__(self):
+            field_scans.append(1)
+            return super().__iter__()
+
+    monkeypatch.setattr(
+        sensor_platform, "RESULT_FIELDS", _CountingFields(sensor_platform.RESULT_FIELDS)
+    )
+
+    for listener in list(coordinator._listeners):
+        listener()
+    assert len(add_calls) == 1
+    assert field_scans == []
+
+    coordinator.data["SERIAL1"] = payload_factory(bat_power=-250)
+    for listener in list(coordinator._listeners):
+        listener()
+    assert len(add_calls) == 2
+    new_fields = {
+        entity._field
+        for entity in add_calls[1]
+        if isinstance(entity, sensor_platform.SolaxFieldSensor)
+    }
+    assert new_fields == {"batPower"}
+    assert any(
+        isinstance(entity, sensor_platform.SolaxEstimatedBatteryEnergySensor)
+        for entity in add_calls[1]
+    )
+
+    for listener in list(coordinator._listeners):
+        listener()
+    assert len(add_calls) == 2
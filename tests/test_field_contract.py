@@ -57,6 +57,7 @@ class _FakeCoordinator:
 
     def __init__(self, data: dict[str, dict]):
         self.data = data
+        self.inverters = list(data)
         self.last_update_success = True
         self.rate_limited_inverters = []
         self.rate_limited_details = {}
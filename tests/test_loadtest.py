@@ -0,0 +1,26 @@
+"""Smoke test for the fleet load-test entry point."""
+
+from __future__ import annotations
+
+import json
+
+from loadtest import main
+
+
+def test_load_test_reports_cycle_metrics_as_json(socket_enabled, tmp_path):
+    """A tiny fleet runs end to end and reports every metric family."""
+    output = tmp_path / "report.json"
+
+    assert main(["--fleets", "3", "--cycles", "2", "--output", str(output)]) == 0
+
+    report = json.loads(output.read_text())
+    fleet = report["fleets"][0]
+    assert fleet["serials"] == 3
+    assert len(fleet["cycles"]) == 2
+    cycle = fleet["cycles"][0]
+    assert cycle["request_latency_ms"]["count"] == 3
+    assert cycle["state_writes"] == fleet["entities"] > 0
+    assert 0 < cycle["loop_busy_seconds"] <= cycle["wall_seconds"]
+    assert fleet["memory"]["tracemalloc_cycle_peak_bytes"] > 0
+    # One call per serial for setup, each timed cycle and the traced cycle.
+    assert fleet["simulator"]["requests"] == 3 * 4
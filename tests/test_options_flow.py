@@ -2,19 +2,28 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 from homeassistant.data_entry_flow import FlowResultType
 
 from solax_cloud_api.config_flow import SolaxOptionsFlowHandler
 from solax_cloud_api.const import (
+    CONF_API_ENDPOINTS,
+    CONF_AUTO_SCAN_INTERVAL,
+    CONF_ENTITY_PREFIX,
+    CONF_ENTITY_PROFILE,
+    CONF_LEAN_ATTRIBUTES,
+    CONF_NIGHT_MODE,
+    CONF_RATE_LIMIT_NOTIFICATIONS,
     CONF_SCAN_INTERVAL,
     CONF_SYSTEM_NAME,
     CONF_TOKEN,
     DOMAIN,
     RUNTIME_RELOAD_STATE,
+    RUNTIME_SCHEDULER,
 )
+from solax_cloud_api.scheduler import SolaxRequestScheduler
 
 
 @pytest.mark.asyncio
@@ -132,3 +141,298 @@ async def test_options_token_changed_marks_full_refresh(
     state = hass.data[RUNTIME_RELOAD_STATE][entry.entry_id]
     assert state["token_changed"] is True
     assert state["added_inverters"] == []
+
+
+@pytest.mark.asyncio
+async def test_options_save_lean_attributes_and_keep_existing_options(
+    hass, mock_solax_entry, runtime_coordinator_stub, monkeypatch
+):
+    """Saving options should store lean mode without wiping other stored options."""
+    entry = mock_solax_entry(
+        inverters=["SERIAL1"],
+        options={CONF_RATE_LIMIT_NOTIFICATIONS: False},
+    )
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
+        "coordinator": runtime_coordinator_stub(data={"SERIAL1": {"acpower": 100}})
+    }
+    monkeypatch.setattr(hass.config_entries, "async_reload", AsyncMock(return_value=True))
+
+    flow = SolaxOptionsFlowHandler(entry)
+    flow.hass = hass
+    await flow.async_step_manage_inverters()
+    result = await flow.async_step_manage_inverters(
+        user_input={
+            CONF_TOKEN: entry.data[CONF_TOKEN],
+            CONF_SYSTEM_NAME: entry.data[CONF_SYSTEM_NAME],
+            CONF_SCAN_INTERVAL: 120,
+            CONF_LEAN_ATTRIBUTES: True,
+            "finish": True,
+        },
+    )
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert result["data"][CONF_LEAN_ATTRIBUTES] is True
+    assert result["data"][CONF_RATE_LIMIT_NOTIFICATIONS] is False
+    assert entry.options[CONF_LEAN_ATTRIBUTES] is True
+
+
+@pytest.mark.asyncio
+async def test_options_api_endpoints_are_validated_and_stored(
+    hass, mock_solax_entry, runtime_coordinator_stub, monkeypatch
+):
+    """Endpoint lists must be http(s) URLs; valid lists are stored deduplicated."""
+    entry = mock_solax_entry(inverters=["SERIAL1"])
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
+        "coordinator": runtime_coordinator_stub(data={"SERIAL1": {"acpower": 100}})
+    }
+    monkeypatch.setattr(hass.config_entries, "async_reload", AsyncMock(return_value=True))
+
+    flow = SolaxOptionsFlowHandler(entry)
+    flow.hass = hass
+    await flow.async_step_manage_inverters()
+    user_input = {
+        CONF_TOKEN: entry.data[CONF_TOKEN],
+        CONF_SYSTEM_NAME: entry.data[CONF_SYSTEM_NAME],
+        CONF_SCAN_INTERVAL: 120,
+        CONF_API_ENDPOINTS: "euapi.solaxcloud.com",
+        "finish": True,
+    }
+    result = await flow.async_step_manage_inverters(user_input=user_input)
+    assert result["type"] is FlowResultType.FORM
+    assert result["errors"] == {CONF_API_ENDPOINTS: "invalid_endpoint"}
+
+    user_input[CONF_API_ENDPOINTS] = (
+        "https://eu.example.test/\nhttps://global.solaxcloud.com, https://eu.example.test"
+    )
+    result = await flow.async_step_manage_inverters(user_input=user_input)
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert entry.options[CONF_API_ENDPOINTS] == [
+        "https://eu.example.test",
+        "https://global.solaxcloud.com",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_options_entity_profile_change_applies_without_reload(
+    hass, mock_solax_entry, runtime_coordinator_stub, monkeypatch
+):
+    """Changing only the entity profile should not reload the config entry."""
+    entry = mock_solax_entry(inverters=["SERIAL1"])
+    apply_mock = AsyncMock()
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
+        "coordinator": runtime_coordinator_stub(data={"SERIAL1": {"acpower": 100}}),
+        "apply_entity_profile": apply_mock,
+    }
+    reload_mock = AsyncMock(return_value=True)
+    monkeypatch.setattr(hass.config_entries, "async_reload", reload_mock)
+
+    flow = SolaxOptionsFlowHandler(entry)
+    flow.hass = hass
+    await flow.async_step_manage_inverters()
+    result = await flow.async_step_manage_inverters(
+        user_input={
+            CONF_TOKEN: entry.data[CONF_TOKEN],
+            CONF_SYSTEM_NAME: entry.data[CONF_SYSTEM_NAME],
+            CONF_SCAN_INTERVAL: entry.data[CONF_SCAN_INTERVAL],
+            CONF_LEAN_ATTRIBUTES: False,
+            CONF_ENTITY_PROFILE: "minimal",
+            "finish": True,
+        },
+    )
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert entry.options[CONF_ENTITY_PROFILE] == "minimal"
+    apply_mock.assert_awaited_once_with("minimal")
+    reload_mock.assert_not_awaited()
+    assert entry.entry_id not in hass.data.get(RUNTIME_RELOAD_STATE, {})
+
+
+@pytest.mark.asyncio
+async def test_options_auto_scan_interval_applies_planner(
+    hass, mock_solax_entry, runtime_coordinator_stub, monkeypatch
+):
+    """Auto scan interval should save the planner value for the configured fleet."""
+    serials = [f"SERIAL{i}" for i in range(40)]
+    entry = mock_solax_entry(inverters=serials)
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
+        "coordinator": runtime_coordinator_stub(data={})
+    }
+    monkeypatch.setattr(hass.config_entries, "async_reload", AsyncMock(return_value=True))
+
+    flow = SolaxOptionsFlowHandler(entry)
+    flow.hass = hass
+    result = await flow.async_step_manage_inverters()
+    assert result["description_placeholders"]["recommended_scan_interval"] == 390
+
+    result = await flow.async_step_manage_inverters(
+        user_input={
+            CONF_TOKEN: entry.data[CONF_TOKEN],
+            CONF_SYSTEM_NAME: entry.data[CONF_SYSTEM_NAME],
+            CONF_SCAN_INTERVAL: 120,
+            CONF_AUTO_SCAN_INTERVAL: True,
+            "finish": True,
+        },
+    )
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert entry.data[CONF_SCAN_INTERVAL] == 390
+    assert entry.options[CONF_AUTO_SCAN_INTERVAL] is True
+
+
+@pytest.mark.asyncio
+async def test_options_auto_scan_interval_counts_entries_sharing_the_token(
+    hass, mock_solax_entry, runtime_coordinator_stub, monkeypatch
+):
+    """Another running entry on the same token shares the quota the interval is sized for."""
+    entry = mock_solax_entry(inverters=[f"SERIAL{i}" for i in range(20)])
+    scheduler = SolaxRequestScheduler()
+    scheduler.register(entry.entry_id, entry.data[CONF_TOKEN], list(entry.data["inverters"]))
+    scheduler.register("other", entry.data[CONF_TOKEN], [f"OTHER{i}" for i in range(20)])
+    hass.data[RUNTIME_SCHEDULER] = scheduler
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
+        "coordinator": runtime_coordinator_stub(data={})
+    }
+    monkeypatch.setattr(hass.config_entries, "async_reload", AsyncMock(return_value=True))
+
+    flow = SolaxOptionsFlowHandler(entry)
+    flow.hass = hass
+    await flow.async_step_manage_inverters()
+    result = await flow.async_step_manage_inverters(
+        user_input={
+            CONF_TOKEN: entry.data[CONF_TOKEN],
+            CONF_SYSTEM_NAME: entry.data[CONF_SYSTEM_NAME],
+            CONF_SCAN_INTERVAL: 120,
+            CONF_AUTO_SCAN_INTERVAL: True,
+            "finish": True,
+        },
+    )
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    # 20 own + 20 shared serials, not the 200s that 20 serials alone would allow.
+    assert entry.data[CONF_SCAN_INTERVAL] == 390
+
+
+@pytest.mark.asyncio
+async def test_options_scan_interval_and_name_apply_without_reload(
+    hass, mock_solax_entry, runtime_coordinator_stub, monkeypatch
+):
+    """Settings that keep token and inverters should be applied live, not by reloading."""
+    entry = mock_solax_entry(inverters=["SERIAL1"], entity_prefix="test_system")
+    apply_mock = Mock()
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
+        "coordinator": runtime_coordinator_stub(data={"SERIAL1": {"acpower": 100}}),
+        "apply_options": apply_mock,
+    }
+    reload_mock = AsyncMock(return_value=True)
+    monkeypatch.setattr(hass.config_entries, "async_reload", reload_mock)
+
+    flow = SolaxOptionsFlowHandler(entry)
+    flow.hass = hass
+    await flow.async_step_manage_inverters()
+    result = await flow.async_step_manage_inverters(
+        user_input={
+            CONF_TOKEN: entry.data[CONF_TOKEN],
+            CONF_SYSTEM_NAME: "Renamed System",
+            CONF_SCAN_INTERVAL: 300,
+            CONF_NIGHT_MODE: True,
+            "finish": True,
+        },
+    )
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert entry.data[CONF_SCAN_INTERVAL] == 300
+    assert entry.data[CONF_SYSTEM_NAME] == "Renamed System"
+    assert entry.data[CONF_ENTITY_PREFIX] == "test_system"
+    apply_mock.assert_called_once_with()
+    reload_mock.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_options_adding_inverter_applies_without_reload(
+    hass, mock_solax_entry, runtime_coordinator_stub, monkeypatch
+):
+    """Adding a serial with an unchanged token should update the running entry in place."""
+    entry = mock_solax_entry(inverters=["SERIAL1"])
+    apply_inverters = AsyncMock(return_value=[])
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
+        "coordinator": runtime_coordinator_stub(data={"SERIAL1": {"acpower": 100}}),
+        "apply_options": Mock(),
+        "apply_inverters": apply_inverters,
+    }
+    reload_mock = AsyncMock(return_value=True)
+    monkeypatch.setattr(hass.config_entries, "async_reload", reload_mock)
+    preflight = {"data": {"SERIAL2": {"acpower": 200}}, "api_calls": 1}
+    preflight_mock = AsyncMock(return_value=preflight)
+    monkeypatch.setattr(
+        "solax_cloud_api.config_flow._classify_preflight_inverters", preflight_mock
+    )
+
+    flow = SolaxOptionsFlowHandler(entry)
+    flow.hass = hass
+    await flow.async_step_manage_inverters()
+    result = await flow.async_step_manage_inverters(
+        user_input={
+            CONF_TOKEN: entry.data[CONF_TOKEN],
+            CONF_SYSTEM_NAME: entry.data[CONF_SYSTEM_NAME],
+            CONF_SCAN_INTERVAL: entry.data[CONF_SCAN_INTERVAL],
+            "serial": "SERIAL2",
+            "finish": True,
+        },
+    )
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert entry.data["inverters"] == ["SERIAL1", "SERIAL2"]
+    preflight_mock.assert_awaited_once_with(
+        hass, entry.data[CONF_TOKEN], ["SERIAL2"], entry.data[CONF_SCAN_INTERVAL]
+    )
+    apply_inverters.assert_awaited_once_with(preflight)
+    reload_mock.assert_not_awaited()
+    assert entry.entry_id not in hass.data.get(RUNTIME_RELOAD_STATE, {})
+
+
+@pytest.mark.asyncio
+async def test_options_bulk_import_shows_per_serial_results(
+    hass, mock_solax_entry, runtime_coordinator_stub, monkeypatch
+):
+    """A pasted serial list is added in one submission and reported per serial.
+
+    Serials over this minute's preflight budget are reported as deferred while
+    the running entry fetches them in the background.
+    """
+    entry = mock_solax_entry(inverters=["SERIAL1"])
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
+        "coordinator": runtime_coordinator_stub(
+            data={
+                "SERIAL1": {"acpower": 100},
+                "SERIAL2": {"acpower": 200},
+                "SERIAL3": {"error": "data_unauthorized", "code": 1003},
+            },
+            unauthorized_inverters=["SERIAL3"],
+        ),
+        "apply_options": Mock(),
+        "apply_inverters": AsyncMock(return_value=["SERIAL4"]),
+    }
+    monkeypatch.setattr(hass.config_entries, "async_reload", AsyncMock(return_value=True))
+    monkeypatch.setattr(
+        "solax_cloud_api.config_flow._classify_preflight_inverters", AsyncMock(return_value=None)
+    )
+
+    flow = SolaxOptionsFlowHandler(entry)
+    flow.hass = hass
+    await flow.async_step_manage_inverters()
+    result = await flow.async_step_manage_inverters(
+        user_input={
+            CONF_TOKEN: entry.data[CONF_TOKEN],
+            CONF_SYSTEM_NAME: entry.data[CONF_SYSTEM_NAME],
+            CONF_SCAN_INTERVAL: entry.data[CONF_SCAN_INTERVAL],
+            "serial": "serial1\nSERIAL2, SERIAL3\nSERIAL4",
+            "finish": True,
+        },
+    )
+    assert entry.data["inverters"] == ["SERIAL1", "SERIAL2", "SERIAL3", "SERIAL4"]
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "import_results"
+    assert result["description_placeholders"]["count"] == 3
+    assert result["description_placeholders"]["ok_count"] == 1
+    results = result["description_placeholders"]["results"].splitlines()
+    assert results[0] == "| SERIAL2 | OK |"
+    assert results[1].startswith("| SERIAL3 | Data Unauthorized")
+    assert results[2] == "| SERIAL4 | Checked on first refresh |"
+
+    result = await flow.async_step_import_results(user_input={})
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "invalid_serial_notice"
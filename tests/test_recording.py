@@ -0,0 +1,122 @@
+"""Response recording and replay through the coordinator and entities."""
+
+from __future__ import annotations
+
+import pytest
+
+from replay import SolaxReplay, read_recording
+from solax_cloud_api import sensor as sensor_platform
+from solax_cloud_api.const import API_REALTIME_PATH
+from solax_cloud_api.coordinator import SolaxCoordinator
+from solax_cloud_api.diagnostics import _mask_serial
+from solax_cloud_api.recording import SolaxResponseRecorder
+
+
+@pytest.mark.asyncio
+async def test_recorder_masks_serials_and_rotates(hass, tmp_path, virtual_clock):
+    """Every flush appends one poll; full files rotate and the oldest is dropped."""
+    recorder = SolaxResponseRecorder(
+        hass, str(tmp_path), "entry1", clock=virtual_clock, max_bytes=1, backups=2
+    )
+    for poll in range(4):
+        recorder.record(
+            API_REALTIME_PATH,
+            "ABCDEF123456",
+            "https://global.solaxcloud.com",
+            200,
+            {
+                "success": True,
+                "code": 0,
+                "exception": "Query success! ABCDEF123456",
+                "result": {"inverterSN": "INV987654321", "sn": "ABCDEF123456", "acpower": poll},
+            },
+            0.25,
+        )
+        await recorder.async_flush()
+        virtual_clock.advance(300)
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "entry1.1.jsonl.gz",
+        "entry1.2.jsonl.gz",
+        "entry1.jsonl.gz",
+    ]
+    assert recorder.rotations == 3
+    records = read_recording(
+        [tmp_path / "entry1.2.jsonl.gz", tmp_path / "entry1.1.jsonl.gz", recorder.path]
+    )
+    assert [record["poll"] for record in records] == [1, 2, 3]
+    assert records[-1] == {
+        "poll": 3,
+        "time": "2026-06-21T00:15:00+00:00",
+        "path": API_REALTIME_PATH,
+        "endpoint": "https://global.solaxcloud.com",
+        "wifi_sn": "ABC***456",
+        "status": 200,
+        "elapsed_ms": 250.0,
+        "response": {
+            "success": True,
+            "code": 0,
+            "exception": "Query success! ABC***456",
+            "result": {"inverterSN": "INV***321", "sn": "ABC***456", "acpower": 3},
+        },
+    }
+
+
+@pytest.mark.asyncio
+async def test_recording_replays_through_coordinator_and_entities(
+    hass, tmp_path, solax_cloud, virtual_clock
+):
+    """A throttled half hour, recorded from the simulator, replays to the same states."""
+    simulator = await solax_cloud(
+        3, calls_per_minute=2, battery_share=1.0, clock=virtual_clock.timestamp
+    )
+    recorder = SolaxResponseRecorder(hass, str(tmp_path), "field", clock=virtual_clock)
+    recorded = SolaxCoordinator(
+        hass,
+        "token",
+        simulator.serials,
+        300,
+        api_endpoints=[simulator.url],
+        clock=virtual_clock,
+        response_recorder=recorder,
+    )
+    virtual_clock.advance(12 * 3600)
+    history = []
+    for _ in range(6):
+        recorded.data = await recorded._async_update_data()
+        history.append(
+            (
+                sorted(_mask_serial(sn) for sn in recorded.rate_limited_inverters),
+                {_mask_serial(sn): payload.get("acpower") for sn, payload in recorded.data.items()},
+            )
+        )
+        virtual_clock.advance(300)
+    assert simulator.stats["rate_limited"] > 0
+
+    replay = SolaxReplay.from_files(recorder.path)
+    coordinator = SolaxCoordinator(
+        hass, "token", replay.serials, 300, api_endpoints=replay.endpoints, clock=replay.clock
+    )
+    replayed = []
+
+    async def _refresh():
+        coordinator.data = await coordinator._async_update_data()
+        masked = {alias: masked for masked, alias in replay.aliases.items()}
+        replayed.append(
+            (
+                sorted(masked[sn] for sn in coordinator.rate_limited_inverters),
+                {masked[sn]: payload.get("acpower") for sn, payload in coordinator.data.items()},
+            )
+        )
+
+    with replay.installed():
+        assert await replay.async_run(_refresh) == 6
+
+    assert replayed == history
+    assert replay.stats["missing"] == 0
+    assert replay.stats["unused"] == 0
+    first = replay.serials[0]
+    acpower = sensor_platform.SolaxFieldSensor(
+        coordinator, first, "acpower", "AC Power", "replay", {}, {}
+    )
+    assert acpower.native_value == coordinator.data[first]["acpower"] > 0
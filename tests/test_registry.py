@@ -0,0 +1,59 @@
+"""Registry cleanup indexing tests."""
+
+from __future__ import annotations
+
+import pytest
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+
+from solax_cloud_api import sensor as sensor_platform
+from solax_cloud_api.const import DOMAIN
+from solax_cloud_api.registry import serial_for_unique_id, serial_suffix_index
+
+
+def test_serial_for_unique_id_resolves_suffixes_in_one_lookup():
+    """Serials (including ones with underscores) should resolve from the unique ID tail."""
+    index = serial_suffix_index(["SERIAL1", "ab_cd", "CD"])
+    assert serial_for_unique_id("test_acpower_serial1", index) == "serial1"
+    assert serial_for_unique_id("test_acpower_AB_CD", index) == "ab_cd"
+    assert serial_for_unique_id("test_acpower_cd", index) == "cd"
+    assert serial_for_unique_id("test_acpower_serial2", index) is None
+    assert serial_for_unique_id("test_ac_power_solax", index) is None
+
+
+@pytest.mark.asyncio
+async def test_cleanup_with_2000_registry_entries(hass, mock_solax_entry):
+    """Cleanup over 2000 entries removes exactly the dropped serials' entities and devices."""
+    serials = [f"SERIAL{i:03d}" for i in range(200)]
+    entry = mock_solax_entry(inverters=serials, entity_prefix="bench")
+    entity_registry = er.async_get(hass)
+    device_registry = dr.async_get(hass)
+    metrics = ("acpower", "yieldtoday", "yieldtotal", "powerdc1", "batpower")
+    for serial in serials:
+        device_registry.async_get_or_create(
+            config_entry_id=entry.entry_id, identifiers={(DOMAIN, serial)}
+        )
+        for metric in metrics:
+            entity_registry.async_get_or_create(
+                "sensor", DOMAIN, f"bench_{metric}_{serial}".lower(), config_entry=entry
+            )
+            entity_registry.async_get_or_create(
+                "sensor", DOMAIN, f"bench_estimated_{metric}_today_{serial}".lower(),
+                config_entry=entry,
+            )
+    assert len(er.async_entries_for_config_entry(entity_registry, entry.entry_id)) == 2000
+
+    kept = serials[:150]
+    sensor_platform._cleanup_removed_inverter_artifacts(hass, entry, "bench", kept)
+
+    remaining = er.async_entries_for_config_entry(entity_registry, entry.entry_id)
+    assert len(remaining) == 1500
+    assert len(dr.async_entries_for_config_entry(device_registry, entry.entry_id)) == 150
+
+    # A targeted cleanup only touches the removed serial.
+    sensor_platform._cleanup_removed_inverter_artifacts(
+        hass, entry, "bench", kept[1:], removed=[kept[0]]
+    )
+    remaining = er.async_entries_for_config_entry(entity_registry, entry.entry_id)
+    assert len(remaining) == 1490
+    assert not any(reg_entry.unique_id.endswith("_serial000") for reg_entry in remaining)
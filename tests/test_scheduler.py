@@ -0,0 +1,58 @@
+"""Domain-wide request scheduler tests."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from solax_cloud_api.scheduler import SolaxRequestScheduler
+
+
+@pytest.mark.asyncio
+async def test_entries_sharing_a_token_share_budget_and_counter(virtual_clock):
+    """Two entries on one token get one counter and one per-minute budget."""
+    scheduler = SolaxRequestScheduler(calls_per_minute=3, spacing=0, clock=virtual_clock)
+    first = scheduler.register("entry1", "token-a")
+    second = scheduler.register("entry2", "token-a")
+    assert first is second
+    assert scheduler.entries_for_token("token-a") == ["entry1", "entry2"]
+
+    waits = [await scheduler.async_acquire("token-a") for _ in range(4)]
+
+    assert waits[:3] == [0.0, 0.0, 0.0]
+    # The fourth call waits until the oldest call leaves the 60 s window.
+    assert waits[3] == pytest.approx(60.0)
+    assert scheduler.delayed_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_calls_of_different_tokens_are_spaced_apart(virtual_clock):
+    """Entries on different tokens do not fire their calls in the same instant."""
+    scheduler = SolaxRequestScheduler(calls_per_minute=9, spacing=1.0, clock=virtual_clock)
+    scheduler.register("entry1", "token-a")
+    scheduler.register("entry2", "token-b")
+
+    waits = await asyncio.gather(
+        scheduler.async_acquire("token-a"),
+        scheduler.async_acquire("token-b"),
+        scheduler.async_acquire("token-a"),
+    )
+
+    assert waits[0] == 0.0
+    # Three calls take two spacing gaps in total, whichever token they belong to.
+    assert virtual_clock.monotonic() == pytest.approx(1002.0)
+    assert scheduler.calls_last_minute("token-a") == 2
+    assert scheduler.calls_last_minute("token-b") == 1
+
+
+@pytest.mark.asyncio
+async def test_recorded_preflight_calls_count_against_the_budget(virtual_clock):
+    """Calls made outside the scheduler still use up the token's minute budget."""
+    scheduler = SolaxRequestScheduler(calls_per_minute=2, spacing=0, clock=virtual_clock)
+    scheduler.register("entry1", "token-a")
+    scheduler.record("token-a", 2)
+
+    assert await scheduler.async_acquire("token-a") == pytest.approx(60.0)
+    assert scheduler.unregister("entry1") is True
+    assert scheduler.api_call_counter("token-a") is None
@@ -0,0 +1,124 @@
+"""Coordinator behaviour against the local SolaX Cloud simulator."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from simulator import SolaxCloudSimulator
+from solax_cloud_api.coordinator import SolaxCoordinator
+from virtual_clock import VirtualClock
+
+_NOON = datetime(2026, 6, 21, 12, 2, 30, tzinfo=UTC).timestamp()
+
+
+def _coordinator(hass, simulators, serials):
+    return SolaxCoordinator(
+        hass,
+        "token",
+        serials,
+        120,
+        api_endpoints=[simulator.url for simulator in simulators],
+        clock=VirtualClock(),
+    )
+
+
+def test_samples_follow_the_sun_and_upload_cadence():
+    """PV peaks around noon, is zero at night and only changes per upload window."""
+    clock = SimpleNamespace(now=_NOON)
+    simulator = SolaxCloudSimulator(1, battery_share=1.0, clock=lambda: clock.now)
+    inverter = next(iter(simulator.inverters.values()))
+
+    noon = simulator.sample(inverter)
+    assert noon["uploadTime"] == "2026-06-21 12:00:00"
+    assert noon["powerdc1"] > 0
+    assert noon["batPower"] > 0
+    assert simulator.sample(inverter, _NOON + 60) == noon
+
+    soc_at_noon = inverter.soc
+    afternoon = simulator.sample(inverter, _NOON + 3 * 3600)
+    assert afternoon["uploadTime"] == "2026-06-21 15:00:00"
+    assert inverter.soc > soc_at_noon
+
+    evening = simulator.sample(inverter, _NOON + 8.5 * 3600)
+    assert evening["powerdc1"] == 0
+    assert evening["batPower"] < 0
+    assert evening["yieldtoday"] > afternoon["yieldtoday"] > noon["yieldtoday"] > 0
+    assert simulator.sample(inverter, _NOON + 12 * 3600)["yieldtoday"] == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("code", [104, 3])
+async def test_per_minute_limit_marks_remaining_serials_rate_limited(hass, solax_cloud, code):
+    """Calls beyond the per-minute limit are answered with the configured throttle code."""
+    simulator = await solax_cloud(4, calls_per_minute=2, rate_limit_code=code)
+    coordinator = _coordinator(hass, [simulator], simulator.serials)
+
+    data = await coordinator._async_update_data()
+
+    assert simulator.stats["ok"] == 2
+    assert simulator.stats["rate_limited"] >= 1
+    assert coordinator.rate_limited_inverters
+    assert sum(1 for sn in simulator.serials if "acpower" in data.get(sn, {})) == 2
+
+
+@pytest.mark.asyncio
+async def test_unauthorized_serials_and_server_errors(hass, solax_cloud):
+    """1003 serials are flagged while a failing host fails over to a healthy one."""
+    broken = await solax_cloud(["SN1", "SN2"], server_error_rate=1.0)
+    healthy = await solax_cloud(["SN1", "SN2"], unauthorized=["SN2"], calls_per_minute=None)
+    coordinator = _coordinator(hass, [broken, healthy], ["SN1", "SN2"])
+
+    data = await coordinator._async_update_data()
+
+    assert broken.stats["server_errors"] >= 1
+    assert data["SN1"]["sn"] == "SN1"
+    assert data["SN2"]["error"] == "data_unauthorized"
+    assert coordinator.unauthorized_inverters == ["SN2"]
+
+
+@pytest.mark.asyncio
+async def test_stalled_replies_surface_as_timeouts(hass, solax_cloud):
+    """A reply slower than the client timeout is reported as a timeout, not data."""
+    simulator = await solax_cloud(["SN1"], timeout_rate=1.0, timeout_delay=1.0)
+    coordinator = _coordinator(hass, [simulator], ["SN1"])
+    coordinator.client.timeout = 0.1
+
+    data = await coordinator._async_update_data()
+
+    assert simulator.stats["timeouts"] == 1
+    assert "acpower" not in data.get("SN1", {})
+
+
+@pytest.mark.asyncio
+async def test_virtual_clock_replays_a_day_of_polling(hass, solax_cloud, virtual_clock):
+    """A full simulated day of 5-minute polling runs in seconds on the virtual clock."""
+    simulator = await solax_cloud(
+        ["SN1", "SN2"], battery_share=1.0, clock=virtual_clock.timestamp
+    )
+    coordinator = SolaxCoordinator(
+        hass, "token", simulator.serials, 300, api_endpoints=[simulator.url], clock=virtual_clock
+    )
+    midnight = virtual_clock.now + timedelta(days=1)
+
+    cycles = 0
+    last_yield = 0.0
+    while virtual_clock.now + timedelta(seconds=300) < midnight:
+        coordinator.data = await coordinator._async_update_data()
+        last_yield = coordinator.data["SN1"]["yieldtoday"]
+        cycles += 1
+        virtual_clock.advance(300)
+
+    assert simulator.stats["rate_limited"] == 0
+    assert coordinator.api_call_counter.count("day") == 2 * cycles
+    # The integrated DC strings track the simulated daily yield.
+    integrator = coordinator.energy_integrator
+    integrated = integrator.total_kwh("SN1", "pv1") + integrator.total_kwh("SN1", "pv2")
+    assert integrated == pytest.approx(last_yield, rel=0.15)
+
+    virtual_clock.advance(600)
+    coordinator.data = await coordinator._async_update_data()
+    assert coordinator.api_call_counter.count("day") == 2
+    assert coordinator.data["SN1"]["yieldtoday"] == 0
@@ -0,0 +1,123 @@
+"""Store-backed estimator/scheduler persistence tests."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import State
+from pytest_homeassistant_custom_component.common import mock_restore_cache
+
+from solax_cloud_api import sensor as sensor_platform
+from solax_cloud_api.const import DOMAIN
+from solax_cloud_api.storage import SolaxStateStore
+
+
+class _FakeCoordinator:
+    """Minimal coordinator protocol for CoordinatorEntity usage in tests."""
+
+    def __init__(self, data: dict[str, dict], state_store=None):
+        self.data = data
+        self.state_store = state_store
+        self.last_update_success = True
+        self.update_interval = timedelta(seconds=120)
+
+    def async_add_listener(self, update_callback, _context=None):
+        return lambda: None
+
+
+@pytest.mark.asyncio
+async def test_state_store_flushes_registered_snapshots_on_stop(hass, hass_storage):
+    """Registered snapshots should be written on Home Assistant stop."""
+    store = SolaxStateStore(hass, "entry1")
+    await store.async_load()
+    store.async_register("estimators", "uid_1", lambda: {"total_kwh": 1.25})
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    await hass.async_block_till_done()
+
+    saved = hass_storage[f"{DOMAIN}.entry1"]["data"]
+    assert saved["estimators"]["uid_1"] == {"total_kwh": 1.25}
+
+
+@pytest.mark.asyncio
+async def test_state_store_starts_fresh_only_on_load_errors(hass):
+    """Unreadable storage starts fresh; unexpected errors are not swallowed."""
+    store = SolaxStateStore(hass, "entry1")
+    store._store.async_load = AsyncMock(side_effect=ValueError("bad json"))
+    await store.async_load()
+    assert store.restored("estimators", "uid_1") is None
+    await store.async_unload()
+
+    store = SolaxStateStore(hass, "entry2")
+    store._store.async_load = AsyncMock(side_effect=RuntimeError("bug"))
+    with pytest.raises(RuntimeError):
+        await store.async_load()
+
+
+@pytest.mark.asyncio
+async def test_state_store_keeps_final_snapshot_after_unregister(hass, hass_storage):
+    """Unregistering (entity removal/reload) must not drop persisted values."""
+    hass_storage[f"{DOMAIN}.entry1"] = {
+        "version": 1,
+        "key": f"{DOMAIN}.entry1",
+        "data": {"estimators": {"uid_old": {"total_kwh": 9.0}}},
+    }
+    store = SolaxStateStore(hass, "entry1")
+    await store.async_load()
+    assert store.restored("estimators", "uid_old") == {"total_kwh": 9.0}
+
+    unregister = store.async_register("estimators", "uid_1", lambda: {"total_kwh": 2.0})
+    unregister()
+    await store.async_unload()
+
+    saved = hass_storage[f"{DOMAIN}.entry1"]["data"]["estimators"]
+    assert saved == {"uid_old": {"total_kwh": 9.0}, "uid_1": {"total_kwh": 2.0}}
+
+
+@pytest.mark.asyncio
+async def test_estimator_migrates_legacy_attributes_into_store(hass, hass_storage):
+    """Estimators should restore from old state attributes once and keep them out of attrs."""
+    entity_id = "sensor.migrate_estimated_battery_charge_energy_today_serial1"
+    mock_restore_cache(
+        hass,
+        [
+            State(
+                entity_id,
+                "0.5",
+                {
+                    "total_kwh": 3.0,
+                    "today_baseline_kwh": 2.5,
+                    "today_date": "2026-03-19",
+                    "last_sample_key": "2026-03-19 12:00:00",
+                    "last_sample_dt": "2026-03-19T12:00:00+00:00",
+                },
+            )
+        ],
+    )
+    store = SolaxStateStore(hass, "entry1")
+    await store.async_load()
+    coordinator = _FakeCoordinator({"SERIAL1": {"batPower": 100}}, state_store=store)
+
+    entity = sensor_platform.SolaxEstimatedBatteryEnergySensor(
+        coordinator=coordinator,
+        serial="SERIAL1",
+        direction="charge",
+        period="today",
+        human_name="Estimated Battery Charge Energy Today",
+        system_slug="migrate",
+        type_map={},
+    )
+    entity.hass = hass
+    await entity.async_added_to_hass()
+
+    assert entity._total_kwh == pytest.approx(3.0)
+    assert entity._today_baseline_kwh == pytest.approx(2.5)
+    assert "total_kwh" not in entity.extra_state_attributes
+
+    await store.async_flush()
+    saved = hass_storage[f"{DOMAIN}.entry1"]["data"]["estimators"][entity.unique_id]
+    assert saved["total_kwh"] == pytest.approx(3.0)
+    assert saved["today_date"] == "2026-03-19"
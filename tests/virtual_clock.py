@@ -0,0 +1,42 @@
+"""Deterministic clock for replaying days of polling in seconds."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+from solax_cloud_api.clock import SolaxClock
+
+
+class VirtualClock(SolaxClock):
+    """Clock that only moves when advanced; sleeps advance it instantly.
+
+    `monotonic()` and `utcnow()` move together, so cooldowns, quota windows and
+    midnight rollovers stay consistent. Pass `timestamp` as the simulator's
+    clock to keep the simulated cloud on the same timeline.
+    """
+
+    def __init__(self, start: datetime | None = None, monotonic_start: float = 1000.0):
+        self.now = start or datetime(2026, 6, 21, 0, 0, tzinfo=UTC)
+        self._monotonic = monotonic_start
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self._monotonic
+
+    def utcnow(self) -> datetime:
+        return self.now
+
+    def timestamp(self) -> float:
+        return self.now.timestamp()
+
+    def advance(self, seconds: float) -> None:
+        self._monotonic += seconds
+        self.now += timedelta(seconds=seconds)
+
+    async def sleep(self, delay: float) -> None:
+        self.sleeps.append(delay)
+        if delay > 0:
+            self.advance(delay)
+        # Still yield, so concurrent tasks interleave as they would on a real loop.
+        await asyncio.sleep(0)